@@ -6,13 +6,18 @@ This example demonstrates how to create and use a custom optimizer algorithm wit
 We implement a simple simulated annealing optimizer as an example.
 """
 
-import random
+import os
+import sys
 import math
 import numpy as np
+import pandas as pd
 from typing import Dict, Any, List, Tuple, Optional
 
 from psuu import PsuuExperiment
 from psuu.optimizers.base import Optimizer
+from psuu.simulation_connector import SimulationConnector
+
+from sim_kernels import anneal_rosenbrock, rosenbrock, sa_step
 
 
 class SimulatedAnnealingOptimizer(Optimizer):
@@ -52,58 +57,51 @@ class SimulatedAnnealingOptimizer(Optimizer):
         self.current_temp = initial_temp
         self.iteration = 0
         
-        # Set random seed
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        # Split the space into continuous bounds (handled as arrays) and discrete choices
+        self._cont_keys = [
+            name for name, values in parameter_space.items()
+            if isinstance(values, tuple) and len(values) == 2
+        ]
+        self._disc_keys = [name for name in parameter_space if name not in self._cont_keys]
+        self._mins = np.array([parameter_space[k][0] for k in self._cont_keys], dtype=float)
+        self._maxs = np.array([parameter_space[k][1] for k in self._cont_keys], dtype=float)
+        self._ranges = self._maxs - self._mins
+        self._rng = np.random.default_rng(seed)
         
         # Initialize with a random point
         self.current_solution = self._random_point()
-        self.best_solution = self.current_solution.copy()
+        self.best_solution = self.current_solution
         self.current_value = None
         self.best_value = None
     
     def _random_point(self) -> Dict[str, Any]:
         """Generate a random point in the parameter space."""
-        point = {}
+        values = self._rng.uniform(self._mins, self._maxs)
+        point = dict(zip(self._cont_keys, values.tolist()))
         
-        for param_name, param_range in self.parameter_space.items():
-            if isinstance(param_range, tuple) and len(param_range) == 2:
-                # Continuous parameter
-                min_val, max_val = param_range
-                point[param_name] = random.uniform(min_val, max_val)
-            else:
-                # Discrete parameter
-                point[param_name] = random.choice(param_range)
+        for param_name in self._disc_keys:
+            param_range = self.parameter_space[param_name]
+            point[param_name] = param_range[self._rng.integers(len(param_range))]
         
         return point
     
     def _neighbor(self, point: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a neighboring point with small perturbations."""
-        neighbor = {}
+        # Continuous parameters - perturb by up to 10% of range, staying within bounds
+        current = np.array([point[k] for k in self._cont_keys], dtype=float)
+        perturbation = self._rng.uniform(-0.1, 0.1, current.size) * self._ranges
+        new_values = np.clip(current + perturbation, self._mins, self._maxs)
+        neighbor = dict(zip(self._cont_keys, new_values.tolist()))
         
-        for param_name, param_value in point.items():
-            param_range = self.parameter_space[param_name]
-            
-            if isinstance(param_range, tuple) and len(param_range) == 2:
-                # Continuous parameter - perturb by up to 10% of range
-                min_val, max_val = param_range
-                range_size = max_val - min_val
-                perturbation = random.uniform(-0.1, 0.1) * range_size
-                new_value = param_value + perturbation
-                # Ensure we stay within bounds
-                neighbor[param_name] = max(min_val, min(max_val, new_value))
-            else:
-                # Discrete parameter - 20% chance to change
-                if random.random() < 0.2:
-                    # Choose a different value
-                    possible_values = [v for v in param_range if v != param_value]
-                    if possible_values:
-                        neighbor[param_name] = random.choice(possible_values)
-                    else:
-                        neighbor[param_name] = param_value
-                else:
-                    neighbor[param_name] = param_value
+        # Discrete parameters - 20% chance to change each one
+        for param_name in self._disc_keys:
+            param_value = point[param_name]
+            neighbor[param_name] = param_value
+            if self._rng.random() < 0.2:
+                # Choose a different value
+                possible_values = [v for v in self.parameter_space[param_name] if v != param_value]
+                if possible_values:
+                    neighbor[param_name] = possible_values[self._rng.integers(len(possible_values))]
         
         return neighbor
     
@@ -127,6 +125,29 @@ class SimulatedAnnealingOptimizer(Optimizer):
         # Return the neighbor
         return neighbor
     
+    def batch_suggest(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Suggest up to n independent parameter sets.
+        
+        The first batch samples random starting points; later batches draw
+        several neighbors of the current solution, which can be evaluated in
+        parallel before the annealing step accepts or rejects them.
+        
+        Args:
+            n: Maximum number of parameter sets to suggest
+            
+        Returns:
+            List of parameter dictionaries to evaluate
+        """
+        n = min(n, self.num_iterations - self.iteration)
+        if n <= 0:
+            return []
+        
+        if self.iteration == 0:
+            return [self.current_solution] + [self._random_point() for _ in range(n - 1)]
+        
+        return [self._neighbor(self.current_solution) for _ in range(n)]
+    
     def update(self, parameters: Dict[str, Any], objective_value: float) -> None:
         """
         Update the optimizer with a new evaluation result.
@@ -138,34 +159,25 @@ class SimulatedAnnealingOptimizer(Optimizer):
         # Call parent method to store the evaluation
         super().update(parameters, objective_value)
         
-        # Update current solution and value
+        # The optimizer owns `parameters` (see Optimizer.update), so keep
+        # references rather than copies
         if self.current_value is None:
-            self.current_solution = parameters.copy()
+            self.current_solution = parameters
             self.current_value = objective_value
-            self.best_solution = parameters.copy()
+            self.best_solution = parameters
             self.best_value = objective_value
         else:
-            # Determine if we should accept the new solution
-            # For maximization, higher values are better; for minimization, lower values are better
-            current_is_better = (self.maximize and objective_value > self.current_value) or \
-                               (not self.maximize and objective_value < self.current_value)
-            
-            # Calculate acceptance probability
-            if current_is_better:
-                acceptance_probability = 1.0
-            else:
-                # For maximization, calculate exp((new - old) / temp)
-                # For minimization, calculate exp((old - new) / temp)
-                if self.maximize:
-                    delta = objective_value - self.current_value
-                else:
-                    delta = self.current_value - objective_value
-                
-                acceptance_probability = math.exp(delta / self.current_temp)
-            
-            # Accept new solution with calculated probability
-            if random.random() < acceptance_probability:
-                self.current_solution = parameters.copy()
+            # Accept improvements always, and worse solutions with probability
+            # exp(delta / temp) (compiled acceptance test)
+            accept = sa_step(
+                float(self.current_value),
+                float(objective_value),
+                self.current_temp,
+                self._rng.random(),
+                self.maximize,
+            )
+            if accept:
+                self.current_solution = parameters
                 self.current_value = objective_value
             
             # Update best solution if better
@@ -173,7 +185,7 @@ class SimulatedAnnealingOptimizer(Optimizer):
                             (not self.maximize and objective_value < self.best_value)
             
             if best_is_better:
-                self.best_solution = parameters.copy()
+                self.best_solution = parameters
                 self.best_value = objective_value
         
         # Cool down temperature
@@ -190,8 +202,54 @@ class SimulatedAnnealingOptimizer(Optimizer):
         return self.iteration >= self.num_iterations
 
 
-def main():
-    """Run an optimization example with custom simulated annealing optimizer."""
+# Noise source for RosenbrockConnector. Forked worker processes get a fresh
+# stream so parallel evaluations do not repeat each other's noise.
+_noise_rng = np.random.default_rng()
+
+
+def _reseed_noise_rng() -> None:
+    """Give a forked worker process its own noise stream."""
+    global _noise_rng
+    _noise_rng = np.random.default_rng()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_noise_rng)
+
+
+class RosenbrockConnector(SimulationConnector):
+    """
+    In-process connector that evaluates the Rosenbrock function directly.
+    
+    This avoids spawning a Python interpreter for every parameter evaluation.
+    """
+    
+    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Evaluate the Rosenbrock function for the given parameters.
+        
+        Args:
+            parameters: Dictionary with 'x' and 'y' values
+            
+        Returns:
+            Single-row DataFrame with the inputs and the noisy function value
+        """
+        x = float(parameters["x"])
+        y = float(parameters["y"])
+        
+        # Add some noise to make it more interesting
+        result = rosenbrock(x, y) * _noise_rng.uniform(0.9, 1.1)
+        
+        return pd.DataFrame({"x": [x], "y": [y], "result": [result]})
+
+
+def main(use_subprocess: bool = False):
+    """
+    Run an optimization example with custom simulated annealing optimizer.
+    
+    Args:
+        use_subprocess: Run the simulation as an external command instead of in-process
+    """
     print("PSUU - Custom Optimizer Example (Simulated Annealing)")
     print("====================================================")
     
@@ -224,17 +282,18 @@ df = pd.DataFrame({
     'result': [result]
 })
 print(df.to_csv(index=False))
-" --{name}={value}"""
+\""""
     
-    # Create experiment
+    # Create experiment (the in-process connector skips the per-evaluation subprocess)
     experiment = PsuuExperiment(
         simulation_command=command,
         param_format="--{name}={value}",
-        output_format="csv"
+        output_format="csv",
+        connector_class=None if use_subprocess else RosenbrockConnector,
     )
     
     # Add KPI
-    experiment.add_kpi("function_value", column="result", operation="min")
+    experiment.add_kpi("function_value", column="result", operation="min", objective="minimize")
     
     # Set parameter space
     experiment.set_parameter_space({
@@ -258,7 +317,8 @@ print(df.to_csv(index=False))
     
     # Run optimization
     print("\nRunning optimization with simulated annealing...")
-    results = experiment.run(verbose=True)
+    # Each step evaluates a batch of neighbors concurrently
+    results = experiment.run(verbose=True, batch_size=4)
     
     # Print results
     print("\nOptimization Results:")
@@ -269,7 +329,16 @@ print(df.to_csv(index=False))
     # Calculate error
     error = math.sqrt((results.best_parameters['x'] - 1.0)**2 + (results.best_parameters['y'] - 1.0)**2)
     print(f"Distance from true minimum: {error:.6f}")
+    
+    # For a model that is itself a compiled kernel, the whole annealing loop
+    # can run in one call without returning to Python between iterations
+    best_x, best_y, best_value = anneal_rosenbrock(
+        0.0, 0.0, -2.0, 2.0, 5000, 5.0, 0.999, np.random.default_rng(42)
+    )
+    print("\nFused compiled annealing (5000 iterations):")
+    print(f"Minimum found at x={best_x:.4f}, y={best_y:.4f}")
+    print(f"Function value: {best_value:.6f}")
 
 
 if __name__ == "__main__":
-    main()
+    main(use_subprocess="--subprocess" in sys.argv)
@@ -6,11 +6,80 @@ This example demonstrates the use of the quick_optimize function,
 which provides a simple one-line interface for parameter optimization.
 """
 
+import functools
+import sys
+from typing import Dict, Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
 from psuu import quick_optimize
+from psuu.simulation_connector import SimulationConnector
+
+from sim_kernels import sir_loop
+
+
+class SIRKernelConnector(SimulationConnector):
+    """
+    In-process connector that runs the SIR model with a compiled kernel.
+    
+    This avoids spawning a Python interpreter for every parameter evaluation.
+    """
+    
+    population = 1000
+    initial_infected = 10
+    timesteps = 100
+    
+    def __init__(
+        self,
+        *args,
+        seed: Optional[Union[int, np.random.Generator]] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the connector.
+        
+        Args:
+            *args: Positional arguments for SimulationConnector
+            seed: Seed or Generator for the simulation noise
+            **kwargs: Keyword arguments for SimulationConnector
+        """
+        super().__init__(*args, **kwargs)
+        self._rng = np.random.default_rng(seed)
+    
+    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Run the SIR kernel for the given parameters.
+        
+        Uses the same model and noise as the subprocess simulation in main(),
+        so both modes optimize the same objective.
+        
+        Args:
+            parameters: Dictionary with 'beta' and 'gamma' values
+            
+        Returns:
+            DataFrame with the S, I and R trajectories
+        """
+        noise = self._rng.uniform(0.9, 1.1, self.timesteps)
+        S, I, R = sir_loop(
+            float(parameters["beta"]),
+            float(parameters["gamma"]),
+            float(self.population),
+            float(self.initial_infected),
+            noise,
+        )
+        
+        return pd.DataFrame({"timestep": np.arange(self.timesteps), "S": S, "I": I, "R": R})
 
 
-def main():
-    """Run a quick optimization experiment."""
+def main(use_subprocess: bool = False, seed: Optional[int] = None):
+    """
+    Run a quick optimization experiment.
+    
+    Args:
+        use_subprocess: Run the simulation as an external command instead of in-process
+        seed: Seed for the in-process simulation noise
+    """
     print("PSUU - Quick Optimize Example")
     print("=============================")
     
@@ -32,33 +101,32 @@ I0 = 10
 S0 = N - I0
 R0 = 0
 
-S, I, R = S0, I0, R0
 timesteps = 100
-results = []
+S = np.empty(timesteps)
+I = np.empty(timesteps)
+R = np.empty(timesteps)
+s, i, r = S0, I0, R0
 
 for t in range(timesteps):
     # Add some randomness to make it interesting
     noise = random.uniform(0.9, 1.1)
     
     # SIR model equations
-    new_infections = beta * S * I / N * noise
-    new_recoveries = gamma * I * noise
+    new_infections = beta * s * i / N * noise
+    new_recoveries = gamma * i * noise
     
-    S = S - new_infections
-    I = I + new_infections - new_recoveries
-    R = R + new_recoveries
+    s = s - new_infections
+    i = i + new_infections - new_recoveries
+    r = r + new_recoveries
     
-    results.append({
-        'timestep': t,
-        'S': S,
-        'I': I,
-        'R': R
-    })
+    S[t] = s
+    I[t] = i
+    R[t] = r
 
 # Output as CSV to stdout
-df = pd.DataFrame(results)
+df = pd.DataFrame({'timestep': np.arange(timesteps), 'S': S, 'I': I, 'R': R})
 print(df.to_csv(index=False))
-" --{name}={value}"""
+\""""
     
     # Run quick optimization
     results = quick_optimize(
@@ -66,7 +134,9 @@ print(df.to_csv(index=False))
         params={"beta": (0.1, 0.5), "gamma": (0.01, 0.1)},
         kpi_column="I",      # Column to optimize
         objective="min",     # Minimize the value
-        iterations=10        # Number of iterations to run
+        iterations=10,       # Number of iterations to run
+        param_format="--{name}={value}",
+        connector_class=None if use_subprocess else functools.partial(SIRKernelConnector, seed=seed),
     )
     
     # Display results
@@ -81,4 +151,4 @@ print(df.to_csv(index=False))
 
 
 if __name__ == "__main__":
-    main()
+    main(use_subprocess="--subprocess" in sys.argv)
@@ -0,0 +1,197 @@
+"""
+Simulation Kernels for the Basic Usage Examples
+
+This module provides in-process implementations of the toy simulations used
+by the basic usage examples. The kernels are compiled with Numba when it is
+installed, and run as plain Python functions otherwise.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rosenbrock(x, y):
+    """
+    Evaluate the Rosenbrock function f(x, y) = (a - x)^2 + b(y - x^2)^2.
+
+    The global minimum is at (1, 1) where f(1, 1) = 0.
+
+    Args:
+        x: First coordinate
+        y: Second coordinate
+
+    Returns:
+        Function value at (x, y)
+    """
+    a = 1.0
+    b = 100.0
+    return (a - x) ** 2 + b * (y - x ** 2) ** 2
+
+
+@njit(cache=True)
+def sir_loop(beta, gamma, N, I0, noise):
+    """
+    Integrate a discrete-time SIR model and return its trajectory.
+
+    Args:
+        beta: Transmission rate
+        gamma: Recovery rate
+        N: Total population
+        I0: Initial number of infected individuals
+        noise: Multiplicative noise on both rates, one value per timestep
+
+    Returns:
+        Tuple of arrays (S, I, R), one value per timestep
+    """
+    T = noise.shape[0]
+    S = np.empty(T)
+    I = np.empty(T)
+    R = np.empty(T)
+    s = N - I0
+    i = I0
+    r = 0.0
+    for t in range(T):
+        new_infections = beta * s * i / N * noise[t]
+        new_recoveries = gamma * i * noise[t]
+        s -= new_infections
+        i += new_infections - new_recoveries
+        r += new_recoveries
+        S[t] = s
+        I[t] = i
+        R[t] = r
+    return S, I, R
+
+
+@njit(cache=True)
+def sa_step(current_value, new_value, temp, u, maximize):
+    """
+    Metropolis acceptance test for simulated annealing.
+
+    Args:
+        current_value: Objective value of the current solution
+        new_value: Objective value of the candidate solution
+        temp: Current temperature
+        u: Uniform random number in [0, 1)
+        maximize: Whether higher objective values are better
+
+    Returns:
+        True if the candidate should replace the current solution
+    """
+    if maximize:
+        delta = new_value - current_value
+    else:
+        delta = current_value - new_value
+    if delta >= 0:
+        return True
+    return u < math.exp(delta / temp)
+
+
+@njit(cache=True)
+def anneal_rosenbrock(x0, y0, lo, hi, num_iterations, initial_temp, cooling_rate, rng):
+    """
+    Minimize the Rosenbrock function with simulated annealing in one call.
+
+    The whole suggest-evaluate-accept cycle runs inside the kernel, so only
+    the final result crosses back into Python. Random numbers are drawn
+    from the given Generator (which Numba accepts as an argument), so the
+    global NumPy random state is left untouched.
+
+    Args:
+        x0: Initial x coordinate
+        y0: Initial y coordinate
+        lo: Lower bound for both coordinates
+        hi: Upper bound for both coordinates
+        num_iterations: Number of annealing iterations
+        initial_temp: Initial temperature
+        cooling_rate: Multiplicative cooling factor per iteration
+        rng: NumPy random Generator, e.g. np.random.default_rng(seed)
+
+    Returns:
+        Tuple of (best x, best y, best value)
+    """
+    span = hi - lo
+    x, y = x0, y0
+    value = rosenbrock(x, y)
+    best_x, best_y, best_value = x, y, value
+    temp = initial_temp
+
+    for _ in range(num_iterations):
+        nx = min(hi, max(lo, x + rng.uniform(-0.1, 0.1) * span))
+        ny = min(hi, max(lo, y + rng.uniform(-0.1, 0.1) * span))
+        new_value = rosenbrock(nx, ny)
+
+        if sa_step(value, new_value, temp, rng.random(), False):
+            x, y, value = nx, ny, new_value
+            if value < best_value:
+                best_x, best_y, best_value = x, y, value
+
+        temp *= cooling_rate
+
+    return best_x, best_y, best_value
+
+
+@njit(
+    "UniTuple(f8[::1], 3)(f8[::1], f8[::1], f8[::1], f8, i8)",
+    parallel=True,
+    cache=True,
+)
+def sir_batch(betas, gammas, Ns, I0, T):
+    """
+    Integrate an ensemble of discrete-time SIR models in one call.
+
+    Each parameter set is integrated independently, so with Numba the
+    ensemble is spread across all cores.
+
+    Args:
+        betas: Transmission rates, one per run
+        gammas: Recovery rates, one per run
+        Ns: Population sizes, one per run
+        I0: Initial number of infected individuals
+        T: Number of timesteps
+
+    Returns:
+        Tuple of arrays (peak infections, total recovered, last timestep
+        with more than one infected individual)
+    """
+    K = betas.shape[0]
+    peaks = np.empty(K)
+    totals = np.empty(K)
+    durations = np.empty(K)
+
+    for k in prange(K):
+        N = Ns[k]
+        S = N - I0
+        I = I0
+        R = 0.0
+        peak = I0
+        last = 0
+        for t in range(T):
+            new_infections = betas[k] * S * I / N
+            new_recoveries = gammas[k] * I
+            S -= new_infections
+            I += new_infections - new_recoveries
+            R += new_recoveries
+            if I > peak:
+                peak = I
+            if I > 1.0:
+                last = t
+        peaks[k] = peak
+        totals[k] = R
+        durations[k] = last
+
+    return peaks, totals, durations
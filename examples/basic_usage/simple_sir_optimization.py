@@ -12,9 +12,73 @@ To run this example:
 """
 
 import os
-from psuu import PsuuExperiment
+import sys
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 import pandas as pd
 
+from psuu import PsuuExperiment
+from psuu.optimizers.tpe import OPTUNA_AVAILABLE
+from psuu.simulation_connector import SimulationConnector
+
+from sim_kernels import sir_batch
+
+
+class InProcessSIRConnector(SimulationConnector):
+    """
+    In-process connector that integrates the SIR model with a compiled kernel.
+    
+    Batches are integrated in a single parallel kernel call instead of one
+    subprocess per parameter set. Each run is returned as a single-row
+    DataFrame with 'peak', 'total' and 'duration' columns.
+    """
+    
+    initial_infected = 10.0
+    timesteps = 100
+    
+    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Run the SIR kernel for a single parameter set.
+        
+        Args:
+            parameters: Dictionary with 'beta', 'gamma' and 'population' values
+            
+        Returns:
+            Single-row DataFrame of summary values
+        """
+        return self.run_simulation_batch([parameters])[0]
+    
+    def run_simulation_batch(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[pd.DataFrame, Exception]]:
+        """
+        Run the SIR kernel for a batch of parameter sets in one call.
+        
+        Args:
+            parameter_sets: List of parameter dictionaries to simulate
+            max_workers: Ignored; the kernel parallelizes across threads itself
+            return_exceptions: Accepted for interface compatibility
+            
+        Returns:
+            List of single-row DataFrames, in the same order as parameter_sets
+        """
+        betas = np.array([p["beta"] for p in parameter_sets], dtype=np.float64)
+        gammas = np.array([p["gamma"] for p in parameter_sets], dtype=np.float64)
+        populations = np.array([p["population"] for p in parameter_sets], dtype=np.float64)
+        
+        peaks, totals, durations = sir_batch(
+            betas, gammas, populations, self.initial_infected, self.timesteps
+        )
+        
+        return [
+            pd.DataFrame({"peak": [peak], "total": [total], "duration": [duration]})
+            for peak, total, duration in zip(peaks, totals, durations)
+        ]
+
 
 def peak_infections(df):
     """Calculate peak infections KPI."""
@@ -31,13 +95,22 @@ def total_infections(df):
 def epidemic_duration(df, threshold=1):
     """Calculate epidemic duration KPI."""
     # Find time from first to last infection above threshold
-    above_threshold = df[df["I"] > threshold]
-    if len(above_threshold) == 0:
+    above_threshold = df["I"].to_numpy() > threshold
+    if not above_threshold.any():
         return 0
-    return above_threshold.iloc[-1]["time"] - above_threshold.iloc[0]["time"]
+    time = df["time"].to_numpy()
+    first = above_threshold.argmax()
+    last = len(above_threshold) - 1 - above_threshold[::-1].argmax()
+    return time[last] - time[first]
 
 
-def main():
+def main(use_subprocess: bool = False):
+    """
+    Run the SIR optimization example.
+    
+    Args:
+        use_subprocess: Run the cadcad-sir command instead of the in-process kernel
+    """
     # Create output directory
     os.makedirs("results", exist_ok=True)
     
@@ -47,12 +120,20 @@ def main():
         param_format="--{name} {value}",
         output_format="csv",
         working_dir=None,
+        connector_class=None if use_subprocess else InProcessSIRConnector,
     )
     
     # Add KPIs
-    experiment.add_kpi("peak", function=peak_infections)
-    experiment.add_kpi("total", function=total_infections)
-    experiment.add_kpi("duration", function=epidemic_duration)
+    if use_subprocess:
+        # Computed from the full time series written by cadcad-sir
+        experiment.add_kpi("peak", function=peak_infections)
+        experiment.add_kpi("total", function=total_infections)
+        experiment.add_kpi("duration", function=epidemic_duration)
+    else:
+        # The kernel returns the summary values directly
+        experiment.add_kpi("peak", column="peak", operation="max")
+        experiment.add_kpi("total", column="total", operation="max")
+        experiment.add_kpi("duration", column="duration", operation="max")
     
     # Set parameter space
     experiment.set_parameter_space({
@@ -61,19 +142,21 @@ def main():
         "population": [1000, 5000]  # Population size options
     })
     
-    # Configure optimizer
+    # Configure optimizer (TPE needs fewer real simulations; fall back to
+    # random search when optuna is not installed)
     experiment.set_optimizer(
-        method="random",
+        method="tpe" if OPTUNA_AVAILABLE else "random",
         objective_name="peak",
         maximize=False,              # We want to minimize peak infections
         num_iterations=20,
         seed=42
     )
     
-    # Run experiment
+    # Run experiment (each batch of suggestions is evaluated in parallel)
     results = experiment.run(
         verbose=True,
-        save_results="results/sir_optimization"
+        save_results="results/sir_optimization",
+        batch_size=os.cpu_count() or 1
     )
     
     # Print best results
@@ -114,4 +197,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(use_subprocess="--subprocess" in sys.argv)
@@ -9,6 +9,9 @@ using the new standardized protocols and formats.
 import os
 import sys
 import argparse
+import hashlib
+import importlib.util
+from collections import OrderedDict
 import pandas as pd
 from typing import Dict, Any, List, Union, Callable, Optional
 
@@ -24,6 +27,11 @@ from psuu import (
     SimulationResults,
     RobustCadcadConnector
 )
+from psuu.results import PYARROW_AVAILABLE
+
+# Parquet stores the time series as compressed columns and carries the KPIs,
+# parameters and metadata in its schema metadata; CSV + JSON is the fallback
+RESULT_FORMATS = ["parquet"] if PYARROW_AVAILABLE else ["csv", "json"]
 
 
 class CadcadModelWrapper(CadcadModelProtocol):
@@ -31,7 +39,10 @@ class CadcadModelWrapper(CadcadModelProtocol):
     Wrapper for existing cadCAD models to adapt them to the new PSUU protocol.
     
     This class serves as an adapter between existing cadCAD models and the
-    new standardized PSUU protocol interface.
+    new standardized PSUU protocol interface. Results are memoized by
+    parameter values, so optimizers revisiting a point do not re-run the
+    simulation; the memo is cleared (and the module reloaded) when the
+    model file changes.
     """
     
     def __init__(
@@ -39,7 +50,8 @@ class CadcadModelWrapper(CadcadModelProtocol):
         model_path: str,
         entry_point: str = "run_model",
         parameter_space: Optional[Dict] = None,
-        kpi_functions: Optional[Dict] = None
+        kpi_functions: Optional[Dict] = None,
+        cache_size: int = 128
     ):
         """
         Initialize the cadCAD model wrapper.
@@ -49,36 +61,143 @@ class CadcadModelWrapper(CadcadModelProtocol):
             entry_point: Name of the function to run the model
             parameter_space: Optional parameter space definition
             kpi_functions: Optional KPI functions
+            cache_size: Maximum number of memoized results (0 disables memoization)
         """
         self.model_path = model_path
         self.entry_point = entry_point
         self._parameter_space = parameter_space or {}
         self._kpi_functions = kpi_functions or {}
+        self.cache_size = cache_size
+        self._results_cache: "OrderedDict[tuple, SimulationResults]" = OrderedDict()
         
         # Import the model module
-        sys.path.insert(0, os.path.dirname(model_path))
-        module_name = os.path.basename(model_path).replace('.py', '')
+        self._load_model()
+        self._model_mtime = self._get_model_mtime()
+        
+        # Auto-discover parameter space
+        if not self._parameter_space and hasattr(self.model_module, "PARAMETER_RANGES"):
+            self._parameter_space = self.model_module.PARAMETER_RANGES
+            
+        # Auto-discover KPI functions
+        self._kpis_from_module = (
+            not self._kpi_functions and hasattr(self.model_module, "KPI_FUNCTIONS")
+        )
+        if self._kpis_from_module:
+            self._kpi_functions = self.model_module.KPI_FUNCTIONS
+        self._kpi_callables = self._resolve_kpi_callables()
+    
+    def _resolve_kpi_callables(self) -> List[tuple]:
+        """
+        Normalize the KPI definitions to a list of (name, function) pairs.
+        
+        Definitions may be plain callables or dicts with a 'function' entry;
+        resolving them once keeps type checks out of every run.
+        
+        Returns:
+            List of (KPI name, callable) pairs
+        """
+        callables = []
+        for kpi_name, kpi_func in self._kpi_functions.items():
+            if callable(kpi_func):
+                callables.append((kpi_name, kpi_func))
+            elif isinstance(kpi_func, dict) and callable(kpi_func.get('function')):
+                callables.append((kpi_name, kpi_func['function']))
+        return callables
+    
+    def _load_model(self) -> None:
+        """
+        Import the model module and look up its entry point.
+        
+        The module is loaded from its file path without touching sys.path,
+        under a name derived from that path, so models that share a file name
+        (e.g. several __main__.py files) do not collide.
+        
+        Raises:
+            ImportError: If the module or entry point cannot be imported
+        """
+        model_path = os.path.abspath(self.model_path)
+        digest = hashlib.blake2b(model_path.encode(), digest_size=8).hexdigest()
+        module_name = f"cadcad_model_{digest}"
         
         try:
-            self.model_module = __import__(module_name)
+            spec = importlib.util.spec_from_file_location(module_name, model_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load a module from '{self.model_path}'")
+            
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+            self.model_module = module
+            self.batch_function = getattr(module, f"{self.entry_point}_batch", None)
+            
+            # Resolve the cadCAD configuration once rather than on every query
+            if hasattr(module, "CADCAD_CONFIG"):
+                self._cadcad_config = module.CADCAD_CONFIG
+            else:
+                self._cadcad_config = {
+                    "model_path": self.model_path,
+                    "entry_point": self.entry_point
+                }
             
             # Get the entry point function
-            if hasattr(self.model_module, entry_point):
-                self.model_function = getattr(self.model_module, entry_point)
+            if hasattr(self.model_module, self.entry_point):
+                self.model_function = getattr(self.model_module, self.entry_point)
             else:
-                raise ImportError(f"Entry point '{entry_point}' not found in module '{module_name}'")
+                raise ImportError(f"Entry point '{self.entry_point}' not found in module '{module_name}'")
                 
-            # Auto-discover parameter space
-            if not self._parameter_space and hasattr(self.model_module, "PARAMETER_RANGES"):
-                self._parameter_space = self.model_module.PARAMETER_RANGES
-                
-            # Auto-discover KPI functions
-            if not self._kpi_functions and hasattr(self.model_module, "KPI_FUNCTIONS"):
-                self._kpi_functions = self.model_module.KPI_FUNCTIONS
-                
-        except ImportError as e:
+        except (ImportError, OSError) as e:
             raise ImportError(f"Failed to import cadCAD model module: {e}")
     
+    def _get_model_mtime(self) -> Optional[int]:
+        """Return the model file's modification time, or None if it cannot be read."""
+        try:
+            return os.stat(self.model_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _check_model_changed(self) -> None:
+        """Reload the model module and drop memoized results if the file changed."""
+        mtime = self._get_model_mtime()
+        if mtime != self._model_mtime:
+            self._model_mtime = mtime
+            self._results_cache.clear()
+            self._load_model()
+            if self._kpis_from_module:
+                self._kpi_functions = self.model_module.KPI_FUNCTIONS
+                self._kpi_callables = self._resolve_kpi_callables()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Prepare the wrapper for pickling (e.g. to send it to worker processes).
+        
+        Module objects cannot be pickled, so the module and entry point are
+        dropped here and re-imported when the wrapper is unpickled.
+        """
+        state = self.__dict__.copy()
+        state.pop("model_module", None)
+        state.pop("model_function", None)
+        state.pop("batch_function", None)
+        state.pop("_kpi_callables", None)
+        state.pop("_cadcad_config", None)
+        if self._kpis_from_module:
+            # Functions from the path-loaded module cannot be unpickled by
+            # reference in another process; they are re-read on load
+            state.pop("_kpi_functions", None)
+        state["_results_cache"] = OrderedDict()
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled wrapper and re-import its model module."""
+        self.__dict__.update(state)
+        self._load_model()
+        if self._kpis_from_module:
+            self._kpi_functions = self.model_module.KPI_FUNCTIONS
+        self._kpi_callables = self._resolve_kpi_callables()
+    
     def run(self, params: Dict[str, Any], **kwargs) -> SimulationResults:
         """
         Run the cadCAD model with given parameters.
@@ -90,49 +209,155 @@ class CadcadModelWrapper(CadcadModelProtocol):
         Returns:
             SimulationResults object with simulation results
         """
-        # Run the model using its entry point function
-        try:
-            # Call the model's entry point function
-            results = self.model_function(params, **kwargs)
+        return self.run_batch([params], **kwargs)[0]
+    
+    def run_batch(self, param_list: List[Dict[str, Any]], **kwargs) -> List[SimulationResults]:
+        """
+        Run the cadCAD model for several parameter sets.
+        
+        If the model module defines ``<entry_point>_batch`` (e.g.
+        ``run_model_batch``), it is called once with all parameter sets that
+        are not memoized, so the model can build a single cadCAD experiment
+        with one config per set and pay its setup cost once. Otherwise the
+        entry point is called for each parameter set.
+        
+        Args:
+            param_list: List of parameter dictionaries
+            **kwargs: Additional simulation options
             
-            # Convert results to SimulationResults if needed
-            if isinstance(results, SimulationResults):
-                return results
-            elif isinstance(results, pd.DataFrame):
-                # Calculate KPIs
-                kpis = {}
-                for kpi_name, kpi_func in self._kpi_functions.items():
-                    if callable(kpi_func):
-                        kpis[kpi_name] = kpi_func(results)
-                    elif isinstance(kpi_func, dict) and callable(kpi_func.get('function')):
-                        kpis[kpi_name] = kpi_func['function'](results)
-                
-                # Create metadata
-                metadata = {
-                    "model_path": self.model_path,
-                    "entry_point": self.entry_point
-                }
-                
-                # Create SimulationResults
-                return SimulationResults(
-                    time_series_data=results,
-                    kpis=kpis,
-                    metadata=metadata,
-                    parameters=params
-                )
+        Returns:
+            List of SimulationResults, in the same order as param_list
+        """
+        self._check_model_changed()
+        
+        keys = [self._memo_key(params, kwargs) for params in param_list]
+        results: List[Optional[SimulationResults]] = [None] * len(param_list)
+        missing = []
+        for i, key in enumerate(keys):
+            if key is not None and key in self._results_cache:
+                self._results_cache.move_to_end(key)
+                results[i] = self._results_cache[key]
             else:
-                # Handle other return types (dict, tuple, etc.)
-                raise ValueError(f"Unsupported result type from model function: {type(results)}")
-                
+                missing.append(i)
+        
+        if len(missing) > 1 and self.batch_function is not None:
+            try:
+                outputs = self.batch_function([param_list[i] for i in missing], **kwargs)
+            except Exception as e:
+                print(f"Error running cadCAD model batch, running parameter sets one by one: {e}")
+                outputs = None
+            if outputs is not None:
+                for i, output in zip(missing, outputs):
+                    try:
+                        results[i] = self._to_results(output, param_list[i])
+                    except Exception as e:
+                        results[i] = self._failed_results(param_list[i], e)
+                missing = [i for i in missing if results[i] is None]
+        
+        for i in missing:
+            results[i] = self._run_model(param_list[i], **kwargs)
+        
+        # Failed runs are not memoized so they are retried
+        if self.cache_size > 0:
+            for key, result in zip(keys, results):
+                if key is not None and "error" not in result.metadata:
+                    self._results_cache[key] = result
+                    if len(self._results_cache) > self.cache_size:
+                        self._results_cache.popitem(last=False)
+        
+        return results
+    
+    @staticmethod
+    def _memo_key(params: Dict[str, Any], kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the memo key for a parameter set and run options.
+        
+        Returns:
+            Hashable key, or None if the values cannot be hashed
+        """
+        try:
+            key = (tuple(sorted(params.items())), tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values are never memoized
+            return None
+        return key
+    
+    def _run_model(self, params: Dict[str, Any], **kwargs) -> SimulationResults:
+        """
+        Run the model entry point and convert its output to SimulationResults.
+        
+        Args:
+            params: Dictionary of parameter values
+            **kwargs: Additional simulation options
+            
+        Returns:
+            SimulationResults object with simulation results
+        """
+        # Run the model using its entry point function
+        try:
+            return self._to_results(self.model_function(params, **kwargs), params)
         except Exception as e:
-            print(f"Error running cadCAD model: {e}")
-            # Return empty results
+            return self._failed_results(params, e)
+    
+    def _to_results(self, results: Any, params: Dict[str, Any]) -> SimulationResults:
+        """
+        Convert the output of the model entry point to SimulationResults.
+        
+        Args:
+            results: Output of the model entry point
+            params: Dictionary of parameter values
+            
+        Returns:
+            SimulationResults object with simulation results
+            
+        Raises:
+            ValueError: If the output type is not supported
+        """
+        # Convert results to SimulationResults if needed
+        if isinstance(results, SimulationResults):
+            return results
+        elif isinstance(results, pd.DataFrame):
+            # Calculate KPIs
+            kpis = {name: func(results) for name, func in self._kpi_callables}
+            
+            # Create metadata
+            metadata = {
+                "model_path": self.model_path,
+                "entry_point": self.entry_point
+            }
+            
+            # Create SimulationResults
             return SimulationResults(
-                time_series_data=pd.DataFrame(),
-                kpis={},
-                metadata={"error": str(e)},
+                time_series_data=results,
+                kpis=kpis,
+                metadata=metadata,
                 parameters=params
             )
+        else:
+            # Handle other return types (dict, tuple, etc.)
+            raise ValueError(f"Unsupported result type from model function: {type(results)}")
+    
+    @staticmethod
+    def _failed_results(params: Dict[str, Any], error: Exception) -> SimulationResults:
+        """
+        Report a failed run and build its empty results.
+        
+        Args:
+            params: Dictionary of parameter values
+            error: The exception raised by the model
+            
+        Returns:
+            Empty SimulationResults with the error in its metadata
+        """
+        print(f"Error running cadCAD model: {error}")
+        # Return empty results
+        return SimulationResults(
+            time_series_data=pd.DataFrame(),
+            kpis={},
+            metadata={"error": str(error)},
+            parameters=params
+        )
     
     def get_parameter_space(self) -> Dict[str, Union[List, tuple, Dict]]:
         """
@@ -157,17 +382,28 @@ class CadcadModelWrapper(CadcadModelProtocol):
         Get cadCAD configuration.
         
         Returns:
-            Dictionary with cadCAD configuration
+            Dictionary with cadCAD configuration (the model module's
+            CADCAD_CONFIG, or a default built from the model path)
         """
-        # Try to get cadCAD config from the model module
-        if hasattr(self.model_module, "CADCAD_CONFIG"):
-            return self.model_module.CADCAD_CONFIG
-        
-        # Default config
-        return {
-            "model_path": self.model_path,
-            "entry_point": self.entry_point
-        }
+        return self._cadcad_config
+
+
+# KPI functions for the SIR model. Defined at module level (not as lambdas)
+# so the wrapped model can be pickled for parallel evaluation.
+
+def peak_infections(df: pd.DataFrame) -> float:
+    """Calculate peak infections KPI."""
+    return df['I'].max()
+
+
+def total_infections(df: pd.DataFrame) -> float:
+    """Calculate total infections KPI."""
+    return df['R'].iloc[-1]
+
+
+def epidemic_duration(df: pd.DataFrame) -> float:
+    """Calculate epidemic duration KPI."""
+    return len(df)
 
 
 def integrate_cadcad_model(model_path, config_path=None):
@@ -183,9 +419,9 @@ def integrate_cadcad_model(model_path, config_path=None):
     """
     # Define KPI functions for cadCAD
     kpi_functions = {
-        "peak_infections": lambda df: df['I'].max(),
-        "total_infections": lambda df: df['R'].iloc[-1],
-        "epidemic_duration": lambda df: len(df)
+        "peak_infections": peak_infections,
+        "total_infections": total_infections,
+        "epidemic_duration": epidemic_duration
     }
     
     # Define parameter space
@@ -225,40 +461,25 @@ def integrate_cadcad_model(model_path, config_path=None):
     return model
 
 
-def optimize_cadcad_model(model, method="random", iterations=10):
+def optimize_cadcad_model(model, method="random", iterations=10, n_workers=None):
     """
     Run optimization on a cadCAD model.
     
+    Parameter sets are evaluated in batches across worker processes, so each
+    optimizer step runs up to n_workers simulations concurrently.
+    
     Args:
         model: CadcadModelWrapper instance
         method: Optimization method
         iterations: Number of iterations
+        n_workers: Number of worker processes (None for os.cpu_count())
         
     Returns:
         Optimization results
     """
-    # Create experiment
-    experiment = PsuuExperiment()
-    
-    # Create a model adapter function
-    def model_adapter(params):
-        """Adapter function to run the model and return a DataFrame."""
-        results = model.run(params)
-        return results.to_dataframe()
-    
-    # Set up the experiment to use the adapter function
-    experiment.simulation_connector.run_simulation = model_adapter
-    
-    # Add KPIs from model
-    kpi_defs = model.get_kpi_definitions()
-    for kpi_name, kpi_def in kpi_defs.items():
-        if isinstance(kpi_def, dict) and 'function' in kpi_def:
-            experiment.add_kpi(kpi_name, function=kpi_def['function'])
-        else:
-            experiment.add_kpi(kpi_name, function=kpi_def)
-    
-    # Set parameter space from model
-    experiment.set_parameter_space(model.get_parameter_space())
+    # Create experiment (the wrapper implements the model protocol, so its
+    # parameter space and KPIs are picked up automatically)
+    experiment = PsuuExperiment(model=model)
     
     # Configure optimizer
     experiment.set_optimizer(
@@ -273,7 +494,9 @@ def optimize_cadcad_model(model, method="random", iterations=10):
     return experiment.run(
         max_iterations=iterations,
         verbose=True,
-        save_results="results/cadcad_integration/optimization"
+        save_results="results/cadcad_integration/optimization",
+        batch_size=n_workers or os.cpu_count() or 1,
+        n_workers=n_workers,
     )
 
 
@@ -285,6 +508,7 @@ def main():
     parser.add_argument('--optimize', action='store_true', help='Run optimization')
     parser.add_argument('--method', type=str, default='random', help='Optimization method')
     parser.add_argument('--iterations', type=int, default=10, help='Number of iterations')
+    parser.add_argument('--workers', type=int, default=None, help='Number of parallel workers')
     
     args = parser.parse_args()
     
@@ -324,7 +548,7 @@ def main():
     
     # Save results
     os.makedirs("results/cadcad_integration", exist_ok=True)
-    saved_files = results.save("results/cadcad_integration/single_run", formats=["csv", "json"])
+    saved_files = results.save("results/cadcad_integration/single_run", formats=RESULT_FORMATS)
     
     print("\nResults saved to:")
     for fmt, path in saved_files.items():
@@ -335,7 +559,8 @@ def main():
         opt_results = optimize_cadcad_model(
             model, 
             method=args.method,
-            iterations=args.iterations
+            iterations=args.iterations,
+            n_workers=args.workers
         )
         
         # Print optimization results
@@ -5,155 +5,69 @@ Example of using PSUU to optimize parameters for the cadcad-sandbox SIR model.
 This example demonstrates how to use PSUU to find optimal parameter values
 for minimizing peak infections in an SIR epidemic model.
 
-This version uses a custom SimulationConnector to work with the cadcad-sandbox output format.
+This version uses the CadcadSimulationConnector from psuu.custom_connectors to
+work with the cadcad-sandbox output format.
 """
 
 import os
 import sys
-import tempfile
-import subprocess
 import json
-import pandas as pd
 import numpy as np
 from typing import Dict, Any
 import time
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from psuu import PsuuExperiment
-from psuu.simulation_connector import SimulationConnector
 from psuu.experiment import ExperimentResults
+from psuu.custom_connectors.cadcad_connector import (
+    CadcadSimulationConnector,
+    peak_infections,
+    total_infections,
+    epidemic_duration,
+    calculate_r0,
+)
 
 
-class CadcadSimulationConnector(SimulationConnector):
-    """
-    Custom simulation connector for cadcad-sandbox that handles its specific output format.
+def _np_default(obj):
     """
+    JSON fallback for NumPy values.
     
-    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
-        """
-        Run the simulation with the given parameters and return results.
-        
-        Args:
-            parameters: Dictionary of parameter names and values
-            
-        Returns:
-            DataFrame containing simulation results
-        """
-        # Convert any numpy types to native Python types
-        cleaned_params = {}
-        for key, value in parameters.items():
-            if isinstance(value, np.integer):
-                cleaned_params[key] = int(value)
-            elif isinstance(value, np.floating):
-                cleaned_params[key] = float(value)
-            else:
-                cleaned_params[key] = value
-        
-        cmd = self._build_command(cleaned_params)
-        timestamp = time.strftime("%Y_%m_%d_%H_%M_%S")
-        output_name = f"psuu_run_{timestamp}"
-        
-        # Add output parameter to command
-        cmd = f"{cmd} --output {output_name}"
-        
-        # Create temporary directory for output
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Set PYTHONPATH to include cadcad-sandbox directory
-            env = os.environ.copy()
-            if "PYTHONPATH" in env:
-                env["PYTHONPATH"] = f"{self.working_dir}:{env['PYTHONPATH']}"
-            else:
-                env["PYTHONPATH"] = self.working_dir
-            
-            # Run simulation
-            try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    check=True,
-                    cwd=self.working_dir,
-                    env=env,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Find the latest simulation output files
-                sim_dir = os.path.join(self.working_dir, "data", "simulations")
-                files = [f for f in os.listdir(sim_dir) if f.endswith('.json') and output_name in f]
-                
-                if not files:
-                    raise FileNotFoundError(f"No output files found with name {output_name}")
-                
-                # Get the latest KPI file
-                kpi_file = sorted(files)[-1]
-                
-                # Load KPI data
-                with open(os.path.join(sim_dir, kpi_file), 'r') as f:
-                    kpi_data = json.load(f)
-                
-                # Convert KPI data to DataFrame for compatibility with our KPI functions
-                # Create a simple DataFrame with the necessary columns
-                peak = kpi_data['peak_infections']['mean']
-                total = kpi_data['total_infections']['mean']
-                duration = kpi_data['epidemic_duration']['mean']
-                r0 = kpi_data['r0']['mean']
-                
-                # Create a synthetic DataFrame with just the KPI values
-                # This is a workaround since we don't have direct access to the simulation data
-                df = pd.DataFrame({
-                    'timestep': [0],
-                    'I': [peak],         # Using peak as I value
-                    'S': [1000 - total], # Estimating S from total infections
-                    'R': [total],        # Using total as R value
-                    'duration': [duration],
-                    'r0': [r0]
-                })
-                
-                return df
-                
-            except subprocess.CalledProcessError as e:
-                print(f"Simulation failed with error: {e}")
-                print(f"Stdout: {e.stdout}")
-                print(f"Stderr: {e.stderr}")
-                # Return empty DataFrame with expected columns
-                return pd.DataFrame(columns=['timestep', 'I', 'S', 'R', 'duration', 'r0'])
-
-
-def peak_infections(df: pd.DataFrame) -> float:
-    """Calculate peak infections KPI from simulation output."""
-    # Since we're using the synthetic DataFrame, I is directly the peak
-    return df['I'].iloc[0]
-
-
-def total_infections(df: pd.DataFrame) -> float:
-    """Calculate total infections KPI from simulation output."""
-    # In our synthetic DataFrame, R is the total infections
-    return df['R'].iloc[0]
-
-
-def epidemic_duration(df: pd.DataFrame) -> float:
-    """Calculate epidemic duration KPI from simulation output."""
-    # In our synthetic DataFrame, duration is directly available
-    return df['duration'].iloc[0]
-
-
-def calculate_r0(df: pd.DataFrame) -> float:
-    """Calculate basic reproduction number."""
-    # In our synthetic DataFrame, r0 is directly available
-    return df['r0'].iloc[0]
+    Passed as json.dump(default=...), so it is only called for objects the
+    encoder cannot serialize itself; native values never reach Python code.
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-# Utility function to convert NumPy types to Python types
-def convert_numpy_types(obj):
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
+def save_json(path, data):
+    """
+    Save results to a JSON file.
+    
+    Uses orjson when installed (it serializes NumPy scalars and arrays
+    natively in C), falling back to the standard library encoder.
+    
+    Args:
+        path: Output file path
+        data: JSON-serializable data, possibly containing NumPy values
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(
+                data,
+                default=_np_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            ))
     else:
-        return obj
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=_np_default)
 
 
 def main():
@@ -176,7 +90,8 @@ def main():
     experiment.simulation_connector = CadcadSimulationConnector(
         command="python -m model",
         param_format="--{name} {value}",
-        working_dir="/home/e4roh/projects/cadcad-sandbox"
+        working_dir="/home/e4roh/projects/cadcad-sandbox",
+        return_dataframe=False,  # the KPI functions below read a KpiResult
     )
     
     # Add KPIs
@@ -209,29 +124,28 @@ def main():
     # Manually save the results with proper type conversion
     results_file = "results/sir_optimization.json"
     
-    # Convert the results data to Python native types
+    # NumPy values are converted by _np_default while encoding
     results_data = {
         "iterations": results.iterations,
         "elapsed_time": results.elapsed_time,
-        "best_parameters": convert_numpy_types(results.best_parameters),
-        "best_kpis": convert_numpy_types(results.best_kpis),
-        "summary": convert_numpy_types(results.summary),
+        "best_parameters": results.best_parameters,
+        "best_kpis": results.best_kpis,
+        "summary": results.summary,
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
     }
     
     # Save to JSON
-    with open(results_file, "w") as f:
-        json.dump(results_data, f, indent=2)
+    save_json(results_file, results_data)
     
     # Print best results
     print("\nBest parameters to minimize peak infections:")
-    print(f"Beta: {convert_numpy_types(results.best_parameters['beta']):.4f}")
-    print(f"Gamma: {convert_numpy_types(results.best_parameters['gamma']):.4f}")
-    print(f"Population: {convert_numpy_types(results.best_parameters['population'])}")
-    print(f"Peak infections: {convert_numpy_types(results.best_kpis['peak']):.2f}")
-    print(f"Total infections: {convert_numpy_types(results.best_kpis['total']):.2f}")
-    print(f"Epidemic duration: {convert_numpy_types(results.best_kpis['duration']):.2f}")
-    print(f"Basic reproduction number (R0): {convert_numpy_types(results.best_kpis['r0']):.2f}")
+    print(f"Beta: {results.best_parameters['beta']:.4f}")
+    print(f"Gamma: {results.best_parameters['gamma']:.4f}")
+    print(f"Population: {results.best_parameters['population']}")
+    print(f"Peak infections: {results.best_kpis['peak']:.2f}")
+    print(f"Total infections: {results.best_kpis['total']:.2f}")
+    print(f"Epidemic duration: {results.best_kpis['duration']:.2f}")
+    print(f"Basic reproduction number (R0): {results.best_kpis['r0']:.2f}")
     
     print(f"\nOptimization complete! Results saved to '{results_file}'")
     
@@ -241,9 +155,9 @@ def main():
         print("\nRunning Bayesian optimization for more precise results...")
         
         # Set a narrower parameter space based on best results
-        beta_best = convert_numpy_types(results.best_parameters['beta'])
-        gamma_best = convert_numpy_types(results.best_parameters['gamma'])
-        pop_best = convert_numpy_types(results.best_parameters['population'])
+        beta_best = float(results.best_parameters['beta'])
+        gamma_best = float(results.best_parameters['gamma'])
+        pop_best = int(results.best_parameters['population'])
         
         experiment.set_parameter_space({
             "beta": (max(0.05, beta_best - 0.05), min(0.5, beta_best + 0.05)),
@@ -269,24 +183,23 @@ def main():
         bayesian_data = {
             "iterations": bayesian_results.iterations,
             "elapsed_time": bayesian_results.elapsed_time,
-            "best_parameters": convert_numpy_types(bayesian_results.best_parameters),
-            "best_kpis": convert_numpy_types(bayesian_results.best_kpis),
-            "summary": convert_numpy_types(bayesian_results.summary),
+            "best_parameters": bayesian_results.best_parameters,
+            "best_kpis": bayesian_results.best_kpis,
+            "summary": bayesian_results.summary,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        with open(bayesian_file, "w") as f:
-            json.dump(bayesian_data, f, indent=2)
+        save_json(bayesian_file, bayesian_data)
         
         # Print refined results
         print("\nRefined parameters from Bayesian optimization:")
-        print(f"Beta: {convert_numpy_types(bayesian_results.best_parameters['beta']):.4f}")
-        print(f"Gamma: {convert_numpy_types(bayesian_results.best_parameters['gamma']):.4f}")
-        print(f"Population: {convert_numpy_types(bayesian_results.best_parameters['population'])}")
-        print(f"Peak infections: {convert_numpy_types(bayesian_results.best_kpis['peak']):.2f}")
-        print(f"Total infections: {convert_numpy_types(bayesian_results.best_kpis['total']):.2f}")
-        print(f"Epidemic duration: {convert_numpy_types(bayesian_results.best_kpis['duration']):.2f}")
-        print(f"Basic reproduction number (R0): {convert_numpy_types(bayesian_results.best_kpis['r0']):.2f}")
+        print(f"Beta: {bayesian_results.best_parameters['beta']:.4f}")
+        print(f"Gamma: {bayesian_results.best_parameters['gamma']:.4f}")
+        print(f"Population: {bayesian_results.best_parameters['population']}")
+        print(f"Peak infections: {bayesian_results.best_kpis['peak']:.2f}")
+        print(f"Total infections: {bayesian_results.best_kpis['total']:.2f}")
+        print(f"Epidemic duration: {bayesian_results.best_kpis['duration']:.2f}")
+        print(f"Basic reproduction number (R0): {bayesian_results.best_kpis['r0']:.2f}")
         
         print(f"\nBayesian optimization complete! Results saved to '{bayesian_file}'")
         
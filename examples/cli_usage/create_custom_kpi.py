@@ -9,6 +9,165 @@ used with the PSUU CLI through the configuration file.
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _kpi_kernel(infected, timesteps, order, susceptible, threshold, window,
+                initial_population):
+    """
+    Compute all custom KPIs with one pass over the arrays.
+    
+    Args:
+        infected: Infections per row (float64)
+        timesteps: Timestep per row (float64)
+        order: Row indices sorted by timestep
+        susceptible: Susceptible population per row, or an empty array
+        threshold: Infection threshold to consider epidemic active
+        window: Window size for the rolling rate of change
+        initial_population: Initial total population, or NaN to use susceptible[0]
+        
+    Returns:
+        Tuple of (epidemic duration, peak timing, rate of change, herd immunity threshold)
+    """
+    n = infected.shape[0]
+    
+    # Peak, and first/last timesteps above threshold, in one scan
+    peak_idx = 0
+    peak_val = infected[0]
+    t_min = np.inf
+    t_max = -np.inf
+    for i in range(n):
+        value = infected[i]
+        if value > peak_val:
+            peak_val = value
+            peak_idx = i
+        if value > threshold:
+            t = timesteps[i]
+            if t < t_min:
+                t_min = t
+            if t > t_max:
+                t_max = t
+    
+    duration = t_max - t_min if t_max >= t_min else 0.0
+    
+    # The rolling mean of `window` consecutive changes telescopes to
+    # (I[j] - I[j - window]) / window in timestep order
+    rate = 0.0
+    if n >= window:
+        rate = np.nan
+        for j in range(window, n):
+            change = (infected[order[j]] - infected[order[j - window]]) / window
+            if rate != rate or change > rate:
+                rate = change
+    
+    herd = 0.0
+    if susceptible.shape[0] == n and 0 < peak_idx < n - 1:
+        if initial_population != initial_population:
+            # Assume first row has initial susceptible population
+            initial_population = susceptible[0]
+        herd = (1.0 - susceptible[peak_idx] / initial_population) * 100  # As percentage
+    
+    return duration, timesteps[peak_idx], rate, herd
+
+
+def warm_up():
+    """
+    Compile the KPI kernel ahead of the first optimization iteration.
+    
+    With Numba installed, the first call compiles the kernel (or loads it from
+    the on-disk cache); calling this once up front keeps that latency out of
+    the timed runs. Without Numba it does nothing useful but is harmless.
+    """
+    values = np.arange(8, dtype=np.float64)
+    _kpi_kernel(values, values, np.arange(8), values, 1.0, 5, np.nan)
+
+
+def compute_all_kpis(df, threshold=1.0, window=5, population_column='S',
+                     initial_population=None):
+    """
+    Calculate all custom KPIs in a single pass over the underlying arrays.
+    
+    The I, timestep and population columns are extracted once as NumPy
+    arrays and handed to a kernel that is JIT-compiled when Numba is
+    installed.
+    
+    Args:
+        df: DataFrame with simulation results
+        threshold: Infection threshold to consider epidemic active
+        window: Window size for the rolling rate of change
+        population_column: Column with susceptible population
+        initial_population: Initial total population (if None, inferred from data)
+        
+    Returns:
+        Dictionary with epidemic_duration, peak_timing, infection_rate_of_change
+        and herd_immunity_threshold values
+    """
+    if 'I' not in df.columns or df.empty:
+        return {
+            "epidemic_duration": 0.0,
+            "peak_timing": 0.0,
+            "infection_rate_of_change": 0.0,
+            "herd_immunity_threshold": 0.0,
+        }
+    
+    infected = df['I'].to_numpy(dtype=np.float64)
+    if 'timestep' in df.columns:
+        timesteps = df['timestep'].to_numpy(dtype=np.float64)
+    else:
+        timesteps = np.arange(len(infected), dtype=np.float64)
+    if population_column in df.columns:
+        susceptible = df[population_column].to_numpy(dtype=np.float64)
+    else:
+        susceptible = np.empty(0, dtype=np.float64)
+    
+    duration, peak_time, rate, herd = _kpi_kernel(
+        infected,
+        timesteps,
+        np.argsort(timesteps, kind='stable'),
+        susceptible,
+        float(threshold),
+        int(window),
+        np.nan if initial_population is None else float(initial_population),
+    )
+    
+    return {
+        "epidemic_duration": float(duration),
+        "peak_timing": float(peak_time),
+        "infection_rate_of_change": float(rate),
+        "herd_immunity_threshold": float(herd),
+    }
+
+
+# PSUU calls each registered KPI function with the same DataFrame in turn, so
+# the fused result for the most recent DataFrame is kept and reused.
+_last_kpis = None
+
+
+def _cached_kpis(df, threshold=1.0, window=5, population_column='S',
+                 initial_population=None):
+    """
+    Return compute_all_kpis() for df, reusing the last result when the same
+    DataFrame object is passed with the same arguments.
+    """
+    global _last_kpis
+    key = (threshold, window, population_column, initial_population)
+    if _last_kpis is not None and _last_kpis[0] is df and _last_kpis[1] == key:
+        return _last_kpis[2]
+    kpis = compute_all_kpis(df, *key)
+    _last_kpis = (df, key, kpis)
+    return kpis
+
 
 def epidemic_duration(df, threshold=1.0):
     """
@@ -21,17 +180,7 @@ def epidemic_duration(df, threshold=1.0):
     Returns:
         Duration in timesteps
     """
-    if 'I' not in df.columns or df.empty:
-        return 0.0
-    
-    # Get periods where infections are above threshold
-    above_threshold = df[df['I'] > threshold]
-    
-    if above_threshold.empty:
-        return 0.0
-    
-    # Calculate duration (last timestep with infections above threshold - first)
-    return float(above_threshold['timestep'].max() - above_threshold['timestep'].min())
+    return _cached_kpis(df, threshold=threshold)["epidemic_duration"]
 
 
 def peak_timing(df):
@@ -44,12 +193,7 @@ def peak_timing(df):
     Returns:
         Timestep of peak infections
     """
-    if 'I' not in df.columns or df.empty:
-        return 0.0
-    
-    # Find the timestep with maximum infections
-    peak_idx = df['I'].idxmax()
-    return float(df.loc[peak_idx, 'timestep'])
+    return _cached_kpis(df)["peak_timing"]
 
 
 def infection_rate_of_change(df, window=5):
@@ -63,20 +207,7 @@ def infection_rate_of_change(df, window=5):
     Returns:
         Maximum rate of change in infections
     """
-    if 'I' not in df.columns or df.empty or len(df) < window:
-        return 0.0
-    
-    # Sort by timestep to ensure proper order
-    df_sorted = df.sort_values('timestep')
-    
-    # Calculate change in infections
-    df_sorted['I_diff'] = df_sorted['I'].diff()
-    
-    # Calculate rolling mean of change
-    df_sorted['I_diff_rolling'] = df_sorted['I_diff'].rolling(window=window).mean()
-    
-    # Return the maximum rate of change (could be negative if focusing on decline)
-    return float(df_sorted['I_diff_rolling'].max())
+    return _cached_kpis(df, window=window)["infection_rate_of_change"]
 
 
 def herd_immunity_threshold(df, population_column='S', initial_population=None):
@@ -91,28 +222,9 @@ def herd_immunity_threshold(df, population_column='S', initial_population=None):
     Returns:
         Percentage of population needed for herd immunity
     """
-    if population_column not in df.columns or df.empty:
-        return 0.0
-    
-    # Determine total population
-    if initial_population is None:
-        # Assume first row has initial susceptible population
-        initial_population = df[population_column].iloc[0]
-    
-    # Calculate minimum susceptible population (when epidemic starts declining)
-    peak_idx = df['I'].idxmax()
-    
-    # If peak is at the very start or end, return 0
-    if peak_idx == 0 or peak_idx == len(df) - 1:
-        return 0.0
-    
-    # Get susceptible population at peak
-    s_at_peak = df.loc[peak_idx, population_column]
-    
-    # Calculate herd immunity threshold as percentage
-    herd_threshold = 1.0 - (s_at_peak / initial_population)
-    
-    return float(herd_threshold * 100)  # Return as percentage
+    return _cached_kpis(
+        df, population_column=population_column, initial_population=initial_population
+    )["herd_immunity_threshold"]
 
 
 if __name__ == "__main__":
@@ -23,6 +23,11 @@ from psuu import (
     ParameterValidator,
     ConfigurationError
 )
+from psuu.results import PYARROW_AVAILABLE
+
+# Parquet stores the time series as compressed columns and carries the KPIs,
+# parameters and metadata in its schema metadata; CSV + JSON is the fallback
+RESULT_FORMATS = ["parquet"] if PYARROW_AVAILABLE else ["csv", "json"]
 
 # Import our SIR model
 from examples.protocol_example.sir_model import SIRModel
@@ -57,7 +62,7 @@ def direct_model_usage():
     # Save results
     output_dir = "results/protocol_example/direct"
     os.makedirs(output_dir, exist_ok=True)
-    saved_files = results.save(f"{output_dir}/sir_simulation", formats=["csv", "json"])
+    saved_files = results.save(f"{output_dir}/sir_simulation", formats=RESULT_FORMATS)
     
     print("\nResults saved to:")
     for fmt, path in saved_files.items():
@@ -129,7 +134,7 @@ def config_based_usage():
     
     output_dir = config.get_output_config().get('directory', 'results/protocol_example/config')
     os.makedirs(output_dir, exist_ok=True)
-    saved_files = results.save(f"{output_dir}/sir_config_run", formats=["csv", "json"])
+    saved_files = results.save(f"{output_dir}/sir_config_run", formats=RESULT_FORMATS)
     
     print("\nResults saved to:")
     for fmt, path in saved_files.items():
@@ -143,28 +148,20 @@ def optimization_example():
     # Initialize model
     model = SIRModel(timesteps=100, samples=1)
     
-    # Create experiment
-    experiment = PsuuExperiment()
-    
-    # Create a model adapter function
-    def model_adapter(params):
-        """Adapter function to run the model and return a DataFrame."""
-        results = model.run(params)
-        return results.to_dataframe()
-    
-    # Set up the experiment to use the adapter function
-    experiment.simulation_connector.run_simulation = model_adapter
-    
-    # Add KPIs from model
-    kpi_defs = model.get_kpi_definitions()
-    for kpi_name, kpi_def in kpi_defs.items():
-        if isinstance(kpi_def, dict) and 'function' in kpi_def:
-            experiment.add_kpi(kpi_name, function=kpi_def['function'])
-        else:
-            experiment.add_kpi(kpi_name, function=kpi_def)
+    # Create the experiment in protocol mode. model.run() already returns
+    # SimulationResults with KPIs computed, so the experiment uses them
+    # directly instead of re-applying each KPI function to the time series.
+    # The optimizer only needs KPIs, so the model skips building time series.
+    experiment = PsuuExperiment(
+        model=model,
+        model_run_options={"return_timeseries": False}
+    )
     
-    # Set parameter space from model
-    experiment.set_parameter_space(model.get_parameter_space())
+    # Optimizers take plain ranges, so drop the metadata from the model's
+    # parameter definitions
+    experiment.set_parameter_space({
+        name: spec["range"] for name, spec in model.get_parameter_space().items()
+    })
     
     # Configure optimizer
     experiment.set_optimizer(
@@ -174,12 +171,16 @@ def optimization_example():
         num_iterations=5  # Small number for demonstration
     )
     
-    # Run optimization
+    # Run optimization. SIRModel overrides run_batch, so each batch of
+    # suggestions is integrated in a single vectorized call; one worker keeps
+    # the whole batch in one call instead of splitting it across processes.
     print("\nRunning optimization...")
     results = experiment.run(
         max_iterations=5,
         verbose=True,
-        save_results="results/protocol_example/optimization/sir_opt"
+        save_results="results/protocol_example/optimization/sir_opt",
+        batch_size=5,
+        n_workers=1
     )
     
     # Print optimization results
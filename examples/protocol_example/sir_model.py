@@ -7,12 +7,122 @@ the CadcadModelProtocol.
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple, Optional, Union, Callable
 
 # Import the PSUU protocol
 from psuu.protocols import CadcadModelProtocol
 from psuu.results import SimulationResults
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sir_step_loop(S0, I0, R0, beta, gamma, N, T, factors):
+    """
+    Integrate the discrete-time SIR recurrence for a batch of trajectories.
+    
+    Compiled to native code with Numba (trajectories run in parallel).
+    The state is integrated in float64 and stored as float32, which is ample
+    for populations of this size and halves the memory of the trajectories.
+    
+    Args:
+        S0: Initial susceptible population per trajectory
+        I0: Initial infected population per trajectory
+        R0: Initial recovered population per trajectory
+        beta: Transmission rate per trajectory
+        gamma: Recovery rate per trajectory
+        N: Total population per trajectory
+        T: Number of timesteps
+        factors: Multipliers applied to new infections, shape (len(S0), T),
+            or an empty (0, 0) array for the deterministic model
+        
+    Returns:
+        Tuple of (S, I, R) float32 arrays with shape (len(S0), T + 1)
+    """
+    K = S0.shape[0]
+    noisy = factors.shape[0] > 0
+    S_arr = np.empty((K, T + 1), dtype=np.float32)
+    I_arr = np.empty((K, T + 1), dtype=np.float32)
+    R_arr = np.empty((K, T + 1), dtype=np.float32)
+    
+    for k in prange(K):
+        S = S0[k]
+        I = I0[k]
+        R = R0[k]
+        S_arr[k, 0] = S
+        I_arr[k, 0] = I
+        R_arr[k, 0] = R
+        
+        for t in range(1, T + 1):
+            # SIR model equations
+            new_infections = beta[k] * S * I / N[k]
+            if noisy:
+                new_infections *= factors[k, t - 1]
+            new_recoveries = gamma[k] * I
+            
+            S -= new_infections
+            I += new_infections - new_recoveries
+            R += new_recoveries
+            
+            S_arr[k, t] = S
+            I_arr[k, t] = I
+            R_arr[k, t] = R
+    
+    return S_arr, I_arr, R_arr
+
+
+def _sir_step_vectorized(S0, I0, R0, beta, gamma, N, T, factors):
+    """
+    NumPy implementation of _sir_step_loop for when Numba is not installed.
+    
+    Each timestep updates one vector entry per trajectory, so the
+    Python-level loop runs over timesteps only.
+    """
+    K = S0.shape[0]
+    noisy = factors.shape[0] > 0
+    S_arr = np.empty((K, T + 1), dtype=np.float32)
+    I_arr = np.empty((K, T + 1), dtype=np.float32)
+    R_arr = np.empty((K, T + 1), dtype=np.float32)
+    
+    S = S0.astype(np.float64)
+    I = I0.astype(np.float64)
+    R = R0.astype(np.float64)
+    S_arr[:, 0] = S
+    I_arr[:, 0] = I
+    R_arr[:, 0] = R
+    
+    for t in range(1, T + 1):
+        # SIR model equations
+        new_infections = beta * S * I / N
+        if noisy:
+            new_infections *= factors[:, t - 1]
+        new_recoveries = gamma * I
+        
+        S -= new_infections
+        I += new_infections - new_recoveries
+        R += new_recoveries
+        
+        S_arr[:, t] = S
+        I_arr[:, t] = I
+        R_arr[:, t] = R
+    
+    return S_arr, I_arr, R_arr
+
+
+_sir_step = _sir_step_loop if NUMBA_AVAILABLE else _sir_step_vectorized
+
 
 class SIRModel(CadcadModelProtocol):
     """
@@ -24,16 +134,60 @@ class SIRModel(CadcadModelProtocol):
     
     VERSION = "0.1.0"
     
-    def __init__(self, timesteps: int = 100, samples: int = 1):
+    # Static definitions are built once; the getters hand out copies, since
+    # validate_parameters() looks the parameter space up on every run
+    _PARAMETER_SPACE = {
+        "beta": {
+            "type": "continuous",
+            "range": (0.1, 0.5),
+            "description": "Transmission rate (contact rate * transmission probability)"
+        },
+        "gamma": {
+            "type": "continuous",
+            "range": (0.01, 0.1),
+            "description": "Recovery rate (1 / infectious period)"
+        },
+        "population": {
+            "type": "discrete",
+            "range": [1000, 5000, 10000],
+            "description": "Total population"
+        },
+        "initial_infected": {
+            "type": "continuous",
+            "range": (1, 100),
+            "description": "Initial number of infected individuals",
+            "required": True
+        }
+    }
+    
+    def __init__(
+        self,
+        timesteps: int = 100,
+        samples: int = 1,
+        cache_size: int = 0,
+        infection_noise: float = 0.0,
+    ):
         """
         Initialize the SIR model.
         
         Args:
             timesteps: Number of timesteps to simulate
             samples: Number of Monte Carlo samples
+            cache_size: Maximum number of memoized results (0, the default,
+                disables memoization). Only used for the deterministic model.
+            infection_noise: Standard deviation of the multiplicative noise on new
+                infections, drawn per sample and timestep (0 for the
+                deterministic model)
         """
         self.timesteps = timesteps
         self.samples = samples
+        self.infection_noise = infection_noise
+        
+        # Results for a parameter set and run options can be reused when an
+        # optimizer revisits them (LRU order). Stochastic runs are never
+        # memoized, so every call draws its own noise.
+        self.cache_size = cache_size
+        self._results_cache: "OrderedDict[tuple, SimulationResults]" = OrderedDict()
         
         # Default parameters
         self.default_params = {
@@ -52,76 +206,210 @@ class SIRModel(CadcadModelProtocol):
             **kwargs: Additional simulation options
                 - timesteps: Override default timesteps
                 - samples: Override default samples
+                - return_timeseries: If False, only KPIs are computed and the
+                  time series DataFrame is not built (default True)
+                - seed: Seed for the infection noise (ignored without noise)
         
         Returns:
             SimulationResults object with simulation results
         """
-        # Merge default parameters with provided parameters
-        run_params = self.default_params.copy()
-        run_params.update(params)
+        return self.run_batch([params], **kwargs)[0]
+    
+    def run_batch(self, param_list: List[Dict[str, Any]], **kwargs) -> List[SimulationResults]:
+        """
+        Run the SIR model for several parameter sets in one vectorized pass.
+        
+        The parameters are stacked into arrays and all trajectories are
+        integrated by a single kernel call. With infection noise, one random
+        generator is created per call and the whole noise matrix is drawn up
+        front; all parameter sets share it (common random numbers), so a
+        seeded result does not depend on what else is in the batch.
+        
+        Args:
+            param_list: List of parameter dictionaries
+            **kwargs: Additional simulation options (see run)
+        
+        Returns:
+            List of SimulationResults, in the same order as param_list
         
+        Raises:
+            ValueError: If any parameter set is invalid
+        """
         # Get simulation options
         timesteps = kwargs.get('timesteps', self.timesteps)
         samples = kwargs.get('samples', self.samples)
+        return_timeseries = kwargs.get('return_timeseries', True)
+        seed = kwargs.get('seed')
+        stochastic = self.infection_noise > 0
+        
+        # Merge default parameters with provided parameters and validate
+        all_params = []
+        for params in param_list:
+            run_params = self.default_params.copy()
+            run_params.update(params)
+            
+            is_valid, error_msg = self.validate_parameters(run_params)
+            if not is_valid:
+                raise ValueError(error_msg)
+            all_params.append(run_params)
         
-        # Validate parameters
-        is_valid, error_msg = self.validate_parameters(run_params)
-        if not is_valid:
-            raise ValueError(error_msg)
+        options = (timesteps, samples, return_timeseries)
+        if stochastic:
+            keys = [None] * len(all_params)
+        else:
+            keys = [self._memo_key(run_params, options) for run_params in all_params]
         
-        # Run simulation for each sample
-        all_results = []
+        # Collect the parameter sets that are neither memoized nor repeated
+        # earlier in this batch
+        results: List[Optional[SimulationResults]] = [None] * len(all_params)
+        to_run: Dict[Any, int] = {}
+        for i, key in enumerate(keys):
+            if key is not None and key in self._results_cache:
+                self._results_cache.move_to_end(key)
+                results[i] = self._copy_results(self._results_cache[key])
+            elif key is None or key not in to_run:
+                to_run[key if key is not None else ("unhashable", i)] = i
         
-        for sample in range(samples):
-            # Initial state
-            population = run_params["population"]
-            initial_infected = run_params["initial_infected"]
+        if to_run:
+            run_list = [all_params[i] for i in to_run.values()]
             
-            S = population - initial_infected
-            I = initial_infected
-            R = 0
+            # Without noise every sample follows the same trajectory, so one is
+            # integrated per parameter set and replicated; with noise each
+            # sample gets its own trajectory
+            reps = samples if stochastic else 1
             
-            # Arrays to store results
-            S_values = [S]
-            I_values = [I]
-            R_values = [R]
-            time_values = [0]
+            def stacked(name):
+                values = np.array([p[name] for p in run_list], dtype=np.float64)
+                return np.repeat(values, reps)
             
-            # Run simulation
-            for t in range(1, timesteps + 1):
-                # SIR model equations
-                beta = run_params["beta"]
-                gamma = run_params["gamma"]
-                
-                new_infections = beta * S * I / population
-                new_recoveries = gamma * I
-                
-                S -= new_infections
-                I += new_infections - new_recoveries
-                R += new_recoveries
-                
-                # Store results
-                S_values.append(S)
-                I_values.append(I)
-                R_values.append(R)
-                time_values.append(t)
+            if stochastic:
+                rng = np.random.default_rng(seed)
+                noise = rng.standard_normal((samples, int(timesteps)))
+                factors = np.maximum(1.0 + self.infection_noise * noise, 0.0)
+                factors = np.tile(factors, (len(run_list), 1))
+            else:
+                factors = np.empty((0, 0))
             
-            # Create DataFrame for this sample
-            sample_df = pd.DataFrame({
-                'timestep': time_values,
-                'S': S_values,
-                'I': I_values,
-                'R': R_values,
-                'run': sample
-            })
+            population = stacked("population")
+            initial_infected = stacked("initial_infected")
+            S_arr, I_arr, R_arr = _sir_step(
+                population - initial_infected,
+                initial_infected,
+                np.zeros(len(population)),
+                stacked("beta"),
+                stacked("gamma"),
+                population,
+                int(timesteps),
+                factors,
+            )
             
-            all_results.append(sample_df)
+            for k, i in enumerate(to_run.values()):
+                rows = slice(k * reps, (k + 1) * reps)
+                results[i] = self._build_results(
+                    all_params[i], S_arr[rows], I_arr[rows], R_arr[rows],
+                    timesteps, samples, return_timeseries
+                )
+                if self.cache_size > 0 and keys[i] is not None:
+                    self._results_cache[keys[i]] = self._copy_results(results[i])
+                    if len(self._results_cache) > self.cache_size:
+                        self._results_cache.popitem(last=False)
         
-        # Combine all samples
-        combined_df = pd.concat(all_results, ignore_index=True)
+        # Repeats within the batch get copies of their first occurrence
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                results[i] = self._copy_results(results[to_run[key]])
         
-        # Calculate KPIs
-        kpis = self._calculate_kpis(combined_df, run_params)
+        return results
+    
+    @staticmethod
+    def _copy_results(results: SimulationResults) -> SimulationResults:
+        """
+        Copy a result so that callers cannot change memoized or shared ones.
+        
+        Returns:
+            SimulationResults with its own time series, KPIs, metadata and
+            parameters
+        """
+        time_series = results.time_series_data
+        return SimulationResults(
+            time_series_data=time_series.copy() if time_series is not None else None,
+            kpis=dict(results.kpis),
+            metadata=dict(results.metadata),
+            parameters=dict(results.parameters),
+        )
+    
+    @staticmethod
+    def _memo_key(run_params: Dict[str, Any], options: tuple) -> Optional[tuple]:
+        """
+        Build the memo key for a parameter set and run options.
+        
+        Returns:
+            Hashable key, or None if the values cannot be hashed
+        """
+        try:
+            key = (tuple(sorted(run_params.items())), options)
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values are never memoized
+            return None
+        return key
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without memoized results (e.g. when sent to worker processes)."""
+        state = self.__dict__.copy()
+        state["_results_cache"] = OrderedDict()
+        return state
+    
+    def _build_results(
+        self,
+        run_params: Dict[str, Any],
+        S: np.ndarray,
+        I: np.ndarray,
+        R: np.ndarray,
+        timesteps: int,
+        samples: int,
+        return_timeseries: bool,
+    ) -> SimulationResults:
+        """
+        Assemble SimulationResults from integrated trajectories.
+        
+        Args:
+            run_params: Parameters used for the simulation
+            S: Susceptible population, shape (trajectories, timesteps + 1)
+            I: Infected population, shape (trajectories, timesteps + 1)
+            R: Recovered population, shape (trajectories, timesteps + 1)
+            timesteps: Number of timesteps simulated
+            samples: Number of samples; a single trajectory is replicated
+                across them
+            return_timeseries: Whether to build the time series DataFrame
+        
+        Returns:
+            SimulationResults object with simulation results
+        """
+        # Build the DataFrame once, one block of rows per sample. The kernel's
+        # preallocated rows are used as-is (ravel is a view), and copy=False
+        # wraps the arrays without copying them again.
+        # Skipped entirely when the caller only needs KPIs.
+        combined_df = None
+        if return_timeseries:
+            S_col, I_col, R_col = S.ravel(), I.ravel(), R.ravel()
+            if S.shape[0] == 1 and samples != 1:
+                S_col = np.tile(S_col, samples)
+                I_col = np.tile(I_col, samples)
+                R_col = np.tile(R_col, samples)
+            
+            combined_df = pd.DataFrame({
+                'timestep': np.tile(np.arange(timesteps + 1, dtype=np.int32), samples),
+                'S': S_col,
+                'I': I_col,
+                'R': R_col,
+                'run': np.repeat(np.arange(samples, dtype=np.int32), timesteps + 1)
+            }, copy=False)
+        
+        # Calculate KPIs, reading the trajectory-based ones off the raw arrays
+        kpis = self._calculate_kpis(
+            combined_df, run_params, known_kpis=self._trajectory_kpis(I, R)
+        )
         
         # Create metadata
         metadata = {
@@ -146,29 +434,7 @@ class SIRModel(CadcadModelProtocol):
         Returns:
             Dictionary mapping parameter names to their valid ranges/values
         """
-        return {
-            "beta": {
-                "type": "continuous",
-                "range": (0.1, 0.5),
-                "description": "Transmission rate (contact rate * transmission probability)"
-            },
-            "gamma": {
-                "type": "continuous",
-                "range": (0.01, 0.1),
-                "description": "Recovery rate (1 / infectious period)"
-            },
-            "population": {
-                "type": "discrete",
-                "range": [1000, 5000, 10000],
-                "description": "Total population"
-            },
-            "initial_infected": {
-                "type": "continuous",
-                "range": (1, 100),
-                "description": "Initial number of infected individuals",
-                "required": True
-            }
-        }
+        return {name: dict(spec) for name, spec in self._PARAMETER_SPACE.items()}
     
     def get_kpi_definitions(self) -> Dict[str, Union[Callable, Dict]]:
         """
@@ -177,28 +443,7 @@ class SIRModel(CadcadModelProtocol):
         Returns:
             Dictionary mapping KPI names to their calculation functions
         """
-        return {
-            "peak_infections": {
-                "function": self.peak_infections,
-                "description": "Maximum number of infections at any time",
-                "tags": ["epidemic", "critical"]
-            },
-            "total_infections": {
-                "function": self.total_infections,
-                "description": "Total number of people infected over the course of the epidemic",
-                "tags": ["epidemic", "cumulative"]
-            },
-            "epidemic_duration": {
-                "function": self.epidemic_duration,
-                "description": "Number of days until infections drop below 1% of peak",
-                "tags": ["epidemic", "temporal"]
-            },
-            "r0": {
-                "function": self.calculate_r0,
-                "description": "Basic reproduction number",
-                "tags": ["epidemic", "transmission"]
-            }
-        }
+        return {name: dict(definition) for name, definition in self._KPI_DEFINITIONS.items()}
     
     def get_cadcad_config(self) -> Dict[str, Any]:
         """
@@ -214,24 +459,68 @@ class SIRModel(CadcadModelProtocol):
             "model_type": "SIR"
         }
     
-    def _calculate_kpis(self, df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, float]:
+    @staticmethod
+    def _trajectory_kpis(I: np.ndarray, R: np.ndarray) -> Dict[str, float]:
+        """
+        Calculate KPIs directly from the trajectory arrays.
+        
+        These equal the DataFrame-based KPIs over the combined results (a
+        single trajectory stands for all of its identical samples) without
+        building groupbys.
+        
+        Args:
+            I: Infected population, shape (trajectories, timesteps + 1)
+            R: Recovered population, shape (trajectories, timesteps + 1)
+            
+        Returns:
+            Dictionary with peak_infections, total_infections and
+            epidemic_duration values
+        """
+        rows = np.arange(I.shape[0])
+        peak_times = np.argmax(I, axis=1)
+        peaks = I[rows, peak_times]
+        
+        # First timestep at or after the peak with infections below 1% of
+        # peak; trajectories that never drop below it use the last timestep
+        after_peak = np.arange(I.shape[1]) >= peak_times[:, None]
+        below = after_peak & (I <= peaks[:, None] * 0.01)
+        end_times = np.where(below.any(axis=1), np.argmax(below, axis=1), I.shape[1] - 1)
+        
+        return {
+            "peak_infections": np.float64(peaks.max()),
+            "total_infections": np.float64(R[:, -1].astype(np.float64).mean()),
+            "epidemic_duration": np.float64(end_times.mean()),
+        }
+    
+    def _calculate_kpis(
+        self,
+        df: pd.DataFrame,
+        params: Dict[str, Any],
+        known_kpis: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, float]:
         """
         Calculate all KPIs from simulation results.
         
         Args:
             df: DataFrame with simulation results
             params: Parameters used for simulation
+            known_kpis: KPI values already computed elsewhere; these are not
+                recalculated from the DataFrame
             
         Returns:
             Dictionary of KPI values
         """
-        kpis = {}
+        kpis = dict(known_kpis or {})
         
         # Calculate each KPI
-        kpis["peak_infections"] = self.peak_infections(df)
-        kpis["total_infections"] = self.total_infections(df)
-        kpis["epidemic_duration"] = self.epidemic_duration(df)
-        kpis["r0"] = self.calculate_r0(df, params.get("beta", 0.3), params.get("gamma", 0.05))
+        if "peak_infections" not in kpis:
+            kpis["peak_infections"] = self.peak_infections(df)
+        if "total_infections" not in kpis:
+            kpis["total_infections"] = self.total_infections(df)
+        if "epidemic_duration" not in kpis:
+            kpis["epidemic_duration"] = self.epidemic_duration(df)
+        if "r0" not in kpis:
+            kpis["r0"] = self.calculate_r0(df, params.get("beta", 0.3), params.get("gamma", 0.05))
         
         return kpis
     
@@ -261,12 +550,11 @@ class SIRModel(CadcadModelProtocol):
         Returns:
             Total number of infections (final R value)
         """
-        # Get the last timestep for each run
-        last_timesteps = df.groupby('run')['timestep'].max()
-        final_states = df[df['timestep'].isin(last_timesteps.values)]
+        # Row of the last timestep of each run, found in a single grouped pass
+        last_rows = df.groupby('run', sort=False)['timestep'].idxmax()
         
         # Return the average final R value across all runs
-        return final_states['R'].mean()
+        return df.loc[last_rows, 'R'].mean()
     
     @staticmethod
     def epidemic_duration(df: pd.DataFrame) -> float:
@@ -279,28 +567,27 @@ class SIRModel(CadcadModelProtocol):
         Returns:
             Duration of the epidemic in timesteps
         """
-        # Calculate peak for each run
-        peaks = df.groupby('run')['I'].max()
-        
-        durations = []
-        for run in df['run'].unique():
-            run_df = df[df['run'] == run].sort_values('timestep')
-            peak = peaks[run]
-            threshold = peak * 0.01  # 1% of peak
-            
-            # Find when infections drop below threshold after peak
-            peak_time = run_df[run_df['I'] == peak]['timestep'].iloc[0]
-            post_peak = run_df[run_df['timestep'] >= peak_time]
-            
-            end_points = post_peak[post_peak['I'] <= threshold]
-            if not end_points.empty:
-                end_time = end_points['timestep'].iloc[0]
-                durations.append(end_time)
-            else:
-                # If never drops below threshold, use max timestep
-                durations.append(run_df['timestep'].max())
+        if df.empty:
+            return 0
+        
+        run_df = df.sort_values(['run', 'timestep'], kind='stable')
+        by_run = run_df.groupby('run', sort=False)
         
-        return np.mean(durations) if durations else 0
+        # Peak and 1% threshold broadcast back onto every row of its run
+        peaks = by_run['I'].transform('max')
+        threshold = peaks * 0.01
+        
+        # Rows at or after the first occurrence of the peak within each run
+        past_peak = run_df['I'].eq(peaks).groupby(run_df['run'], sort=False).cummax()
+        end_mask = past_peak & (run_df['I'] <= threshold)
+        
+        # First timestep below threshold after peak; runs that never drop
+        # below it use their max timestep
+        end_times = run_df.loc[end_mask].groupby('run', sort=False)['timestep'].first()
+        max_times = by_run['timestep'].max()
+        durations = end_times.reindex(max_times.index).fillna(max_times)
+        
+        return durations.mean()
     
     @staticmethod
     def calculate_r0(df: pd.DataFrame, beta: Optional[float] = None, gamma: Optional[float] = None) -> float:
@@ -323,15 +610,41 @@ class SIRModel(CadcadModelProtocol):
         early_growth_rate = 0
         try:
             # Use early part of epidemic for estimation
-            for run in df['run'].unique():
-                run_df = df[(df['run'] == run) & (df['timestep'] <= 10)].copy()
-                if len(run_df) > 1:
-                    run_df['growth_rate'] = run_df['I'].pct_change()
-                    early_growth_rate += run_df['growth_rate'].mean()
+            early = df[df['timestep'] <= 10]
+            by_run = early.groupby('run', sort=False)['I']
+            # No forward-filling of missing values (the pandas 3 default, and
+            # the non-deprecated spelling on pandas 2)
+            growth = by_run.pct_change(fill_method=None).groupby(early['run'], sort=False).mean()
             
-            early_growth_rate /= len(df['run'].unique())
+            # Runs with a single early row have no growth rate but still
+            # count towards the average
+            early_growth_rate = growth[by_run.size() > 1].sum(skipna=False)
+            early_growth_rate /= df['run'].nunique(dropna=False)
             
             # Convert growth rate to R0 using standard formula
             return 1 + early_growth_rate * 5  # Assuming average infectious period of 5 days
         except:
             return 0  # Default if calculation fails
+    
+    _KPI_DEFINITIONS = {
+        "peak_infections": {
+            "function": peak_infections.__func__,
+            "description": "Maximum number of infections at any time",
+            "tags": ["epidemic", "critical"]
+        },
+        "total_infections": {
+            "function": total_infections.__func__,
+            "description": "Total number of people infected over the course of the epidemic",
+            "tags": ["epidemic", "cumulative"]
+        },
+        "epidemic_duration": {
+            "function": epidemic_duration.__func__,
+            "description": "Number of days until infections drop below 1% of peak",
+            "tags": ["epidemic", "temporal"]
+        },
+        "r0": {
+            "function": calculate_r0.__func__,
+            "description": "Basic reproduction number",
+            "tags": ["epidemic", "transmission"]
+        }
+    }
@@ -5,11 +5,9 @@ A framework for automated parameter selection and optimization
 for simulation models under uncertainty.
 """
 
-from .experiment import PsuuExperiment, quick_optimize
-from .protocols import ModelProtocol, CadcadModelProtocol
-from .results import SimulationResults
-from .config import PsuuConfig
-from .validation import ParameterValidator, RobustCadcadConnector
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import (
     PsuuError,
     ModelInitializationError,
@@ -23,6 +21,40 @@ from .exceptions import (
 )
 from .version import __version__
 
+# Public names whose modules pull in pandas, numpy or PyYAML are imported on
+# first access (PEP 562), so `import psuu` itself stays cheap
+_LAZY_IMPORTS = {
+    "PsuuExperiment": ".experiment",
+    "quick_optimize": ".experiment",
+    "ModelProtocol": ".protocols",
+    "CadcadModelProtocol": ".protocols",
+    "SimulationResults": ".results",
+    "PsuuConfig": ".config",
+    "ParameterValidator": ".validation",
+    "RobustCadcadConnector": ".validation",
+}
+
+if TYPE_CHECKING:
+    from .experiment import PsuuExperiment, quick_optimize
+    from .protocols import ModelProtocol, CadcadModelProtocol
+    from .results import SimulationResults
+    from .config import PsuuConfig
+    from .validation import ParameterValidator, RobustCadcadConnector
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __all__ = [
     "PsuuExperiment",
     "quick_optimize",
@@ -1,8 +1,48 @@
 """
 Main entry point for running PSUU as a module.
+
+`psuu --version` and `psuu list-models` take no options, so they are answered
+here without importing Click; every other invocation is handed to the Click
+application in psuu.cli.
 """
 
-from psuu.cli import main
+import os
+import sys
+
+
+def _prog_name() -> str:
+    """Program name as Click would report it."""
+    main_module = sys.modules.get("__main__")
+    spec = getattr(main_module, "__spec__", None)
+    if spec is not None and spec.name == "psuu.__main__":
+        return "python -m psuu"
+    return os.path.basename(sys.argv[0])
+
+
+def main():
+    """Main entry point for the psuu command."""
+    args = sys.argv[1:]
+
+    if args == ["--version"]:
+        from psuu.version import __version__
+        print(f"{_prog_name()}, version {__version__}")
+        return
+
+    if args == ["list-models"]:
+        try:
+            from psuu.clone_model import list_available_models
+            list_available_models()
+        except ImportError:
+            print("Error: Could not import clone_model module.")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error listing models: {str(e)}")
+            sys.exit(1)
+        return
+
+    from psuu.cli import main as cli_main
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
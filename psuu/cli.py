@@ -4,21 +4,286 @@ Command Line Interface Module
 This module provides a command-line interface for the PSUU package.
 """
 
+import copy
+import functools
+import hashlib
 import os
 import sys
-import time
-import json
-import yaml
 import click
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple
 
-from .experiment import PsuuExperiment
-from .optimizers import AVAILABLE_OPTIMIZERS
 from .version import __version__
 
+# PyYAML, the experiment and the optimizers (numpy, pandas and optional
+# backends) are imported by the commands that use them, so `psuu --help`,
+# `psuu init` and shell completion do not pay for them
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """
+    Import PyYAML on first use.
+    
+    Returns:
+        Tuple of (yaml module, loader class, dumper class); LibYAML's C
+        loader/dumper are used when available, being several times faster
+        than the pure-Python ones
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+# Optimization methods offered by set-optimizer. Listing them here keeps the
+# option from importing the optimizer registry; grid and random search are
+# always available, the others are checked against AVAILABLE_OPTIMIZERS when
+# chosen since they depend on optional backends.
+_OPTIMIZER_METHODS = ("grid", "random", "bayesian", "tpe")
+_BUILTIN_OPTIMIZERS = ("grid", "random")
+
 
 CONFIG_FILENAME = "psuu_config.yaml"
 
+# Default configuration written by `psuu init`, as yaml.dump would render it
+# (keys sorted), so init writes it without importing or running PyYAML
+_DEFAULT_CFG_YAML = b"""\
+kpis: {}
+optimizer:
+  iterations: 20
+  maximize: true
+  method: random
+  objective: null
+parameters: {}
+simulation:
+  command: python -m model
+  output_file: results.csv
+  output_format: csv
+  param_format: --{name} {value}
+  working_dir: null
+"""
+
+# Parsed configurations keyed by (absolute path, mtime_ns, size), so repeated
+# loads of an unchanged file within one process skip the YAML parse. Each
+# entry also holds the digest of the file contents, which lets _dump_cfg skip
+# rewriting a file whose contents would not change.
+_CFG_CACHE: Dict[Tuple[str, int, int], Tuple[bytes, Dict[str, Any]]] = {}
+
+
+def _cfg_cache_key(path: str) -> Tuple[str, int, int]:
+    """Build the cache key for a configuration file from its current stat."""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _cfg_digest(data: bytes) -> bytes:
+    """Hash serialized configuration contents."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _cache_cfg(key: Tuple[str, int, int], digest: bytes, cfg: Dict[str, Any]) -> None:
+    """Cache a parsed configuration, dropping entries for earlier versions of the file."""
+    for stale in [k for k in _CFG_CACHE if k[0] == key[0]]:
+        del _CFG_CACHE[stale]
+    _CFG_CACHE[key] = (digest, cfg)
+
+
+def _as_reloaded(value: Any) -> Any:
+    """
+    Copy a configuration value the way a dump and reload would return it.
+    
+    yaml.dump sorts mapping keys, so the reloaded dictionaries are in key
+    order; lists and scalars come back as they were.
+    """
+    if isinstance(value, dict):
+        return {k: _as_reloaded(value[k]) for k in sorted(value)}
+    if isinstance(value, list):
+        return [_as_reloaded(v) for v in value]
+    return value
+
+
+def _exit_cfg_not_found(path: str) -> None:
+    """Report a missing configuration file and exit."""
+    click.echo(f"Configuration file not found: {path}")
+    click.echo("Run 'psuu init' first to create a configuration file.")
+    sys.exit(1)
+
+
+def _load_cfg(path: str) -> Dict[str, Any]:
+    """
+    Load a configuration file, exiting with a message if it does not exist.
+    
+    Args:
+        path: Path to the configuration file
+        
+    Returns:
+        Configuration dictionary (a private copy that may be modified)
+    """
+    try:
+        key = _cfg_cache_key(path)
+    except FileNotFoundError:
+        _exit_cfg_not_found(path)
+    
+    if key not in _CFG_CACHE:
+        yaml, loader, _ = _yaml_codec()
+        with open(path, "rb") as f:
+            data = f.read()
+        _cache_cfg(key, _cfg_digest(data), yaml.load(data, Loader=loader))
+    return copy.deepcopy(_CFG_CACHE[key][1])
+
+
+# Settings `run` requires, as key paths into the configuration, with the
+# message shown when one is missing or empty
+_RUN_REQUIREMENTS = (
+    (("parameters",), "No parameters defined. Use 'psuu add-param' to add parameters."),
+    (("kpis",), "No KPIs defined. Use 'psuu add-kpi' to add KPIs."),
+    (("optimizer", "objective"), "No objective KPI set. Use 'psuu set-optimizer --objective KPI_NAME'."),
+)
+
+_YAML_NULLS = ("", "~", "null", "Null", "NULL")
+
+
+def _peek_cfg(path: str, wanted: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], bool]:
+    """
+    Check which settings of a configuration file are set, without loading it.
+    
+    Walks LibYAML's event stream, so no Python objects are built for the
+    configuration bodies, and stops as soon as every wanted setting is seen.
+    
+    Args:
+        path: Path to the configuration file
+        wanted: Key paths to check, e.g. ("optimizer", "objective")
+        
+    Returns:
+        Dictionary mapping each wanted key path that is present to whether
+        its value is set (not null and not an empty mapping or sequence)
+    """
+    yaml, loader, _ = _yaml_codec()
+    wanted = set(wanted)
+    found: Dict[Tuple[str, ...], bool] = {}
+    # One frame per open collection: [key path, is mapping, pending key,
+    # is a mapping key itself]
+    stack: List[list] = []
+    opened: Optional[Tuple[str, ...]] = None
+    
+    with open(path, "rb") as f:
+        for event in yaml.parse(f, Loader=loader):
+            if opened is not None:
+                # A collection is set unless it is closed straight away
+                found[opened] = not isinstance(
+                    event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+                )
+                opened = None
+                if len(found) == len(wanted):
+                    break
+            
+            if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                closed = stack.pop()
+                if not stack:
+                    break
+                if stack[-1][1] and not closed[3]:
+                    stack[-1][2] = None
+                continue
+            if not isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent,
+                                      yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                continue
+            
+            frame = stack[-1] if stack else None
+            if frame is not None and frame[1] and frame[2] is None:
+                # Mapping key
+                frame[2] = event.value if isinstance(event, yaml.ScalarEvent) else ""
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    stack.append([None, isinstance(event, yaml.MappingStartEvent), None, True])
+                continue
+            
+            # Value: track key paths only through nested mappings
+            if frame is None:
+                key_path: Optional[Tuple[str, ...]] = ()
+            elif frame[1] and frame[0] is not None:
+                key_path = frame[0] + (frame[2],)
+            else:
+                key_path = None
+            
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                stack.append([key_path, isinstance(event, yaml.MappingStartEvent), None, False])
+                if key_path in wanted:
+                    opened = key_path
+            else:
+                if key_path in wanted:
+                    found[key_path] = not (
+                        isinstance(event, yaml.ScalarEvent)
+                        and (event.value == "" or (event.implicit[0] and event.value in _YAML_NULLS))
+                    )
+                    if len(found) == len(wanted):
+                        break
+                if frame is not None and frame[1]:
+                    frame[2] = None
+    
+    return found
+
+
+def _write_cfg_bytes(data: bytes, path: str, cfg: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write serialized configuration atomically, skipping the write if unchanged.
+    
+    The data is written to a temporary file that then replaces the original,
+    so an interrupted write never leaves a truncated file behind.
+    
+    Args:
+        data: YAML document to write
+        path: Path to the configuration file
+        cfg: Configuration dictionary that data was rendered from; if given,
+            it is cached under the written file so the next _load_cfg of the
+            file does not parse it again
+    """
+    digest = _cfg_digest(data)
+    
+    try:
+        key = _cfg_cache_key(path)
+    except FileNotFoundError:
+        key = None
+    if key is not None:
+        if key in _CFG_CACHE:
+            current = _CFG_CACHE[key][0]
+        else:
+            with open(path, "rb") as f:
+                current = _cfg_digest(f.read())
+            if current == digest and cfg is not None:
+                _cache_cfg(key, digest, _as_reloaded(cfg))
+        if current == digest:
+            return
+    
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    if cfg is not None:
+        _cache_cfg(_cfg_cache_key(path), digest, _as_reloaded(cfg))
+
+
+def _dump_cfg(cfg: Dict[str, Any], path: str) -> None:
+    """
+    Write a configuration file and keep it cached for the next _load_cfg.
+    
+    Args:
+        cfg: Configuration dictionary
+        path: Path to the configuration file
+    """
+    yaml, _, dumper = _yaml_codec()
+    _write_cfg_bytes(
+        yaml.dump(cfg, Dumper=dumper, default_flow_style=False, encoding="utf-8"),
+        path,
+        cfg=cfg
+    )
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -44,29 +309,9 @@ def init(output_dir: str):
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create default configuration
-    config = {
-        "simulation": {
-            "command": "python -m model",
-            "param_format": "--{name} {value}",
-            "output_format": "csv",
-            "output_file": "results.csv",
-            "working_dir": None,
-        },
-        "parameters": {},
-        "kpis": {},
-        "optimizer": {
-            "method": "random",
-            "objective": None,
-            "maximize": True,
-            "iterations": 20,
-        }
-    }
-    
-    # Write configuration file
+    # Write the default configuration
     config_path = os.path.join(output_dir, CONFIG_FILENAME)
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    _write_cfg_bytes(_DEFAULT_CFG_YAML, config_path)
     
     click.echo(f"Created configuration file: {config_path}")
     click.echo("You can now add parameters and KPIs.")
@@ -82,13 +327,7 @@ def add_param(name: str, range: Optional[Tuple[float, float]], values: List[str]
     Add a parameter to the configuration.
     """
     # Load configuration
-    try:
-        with open(config, "r") as f:
-            cfg = yaml.safe_load(f)
-    except FileNotFoundError:
-        click.echo(f"Configuration file not found: {config}")
-        click.echo("Run 'psuu init' first to create a configuration file.")
-        sys.exit(1)
+    cfg = _load_cfg(config)
     
     # Add parameter
     if range:
@@ -100,8 +339,7 @@ def add_param(name: str, range: Optional[Tuple[float, float]], values: List[str]
         sys.exit(1)
     
     # Write updated configuration
-    with open(config, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
+    _dump_cfg(cfg, config)
     
     click.echo(f"Added parameter '{name}' to configuration.")
 
@@ -129,13 +367,7 @@ def add_kpi(
     Add a KPI to the configuration.
     """
     # Load configuration
-    try:
-        with open(config, "r") as f:
-            cfg = yaml.safe_load(f)
-    except FileNotFoundError:
-        click.echo(f"Configuration file not found: {config}")
-        click.echo("Run 'psuu init' first to create a configuration file.")
-        sys.exit(1)
+    cfg = _load_cfg(config)
     
     # Add KPI
     if custom:
@@ -162,8 +394,7 @@ def add_kpi(
             cfg["kpis"][name]["filter"] = filter
     
     # Write updated configuration
-    with open(config, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
+    _dump_cfg(cfg, config)
     
     click.echo(f"Added KPI '{name}' to configuration.")
 
@@ -171,7 +402,7 @@ def add_kpi(
 @cli.command("set-optimizer")
 @click.option(
     "--method", "-m",
-    type=click.Choice(list(AVAILABLE_OPTIMIZERS.keys())),
+    type=click.Choice(_OPTIMIZER_METHODS),
     default="random",
     help="Optimization method"
 )
@@ -179,7 +410,7 @@ def add_kpi(
 @click.option("--maximize/--minimize", default=True, help="Whether to maximize or minimize")
 @click.option("--iterations", "-i", type=int, default=20, help="Number of iterations")
 @click.option("--num-points", type=int, default=5, help="Points per dimension for grid search")
-@click.option("--n-initial-points", type=int, default=10, help="Initial points for Bayesian")
+@click.option("--n-initial-points", type=int, default=10, help="Initial random points for Bayesian and TPE")
 @click.option("--seed", type=int, help="Random seed")
 @click.option("--config", default=CONFIG_FILENAME, help="Configuration file")
 def set_optimizer(
@@ -195,14 +426,14 @@ def set_optimizer(
     """
     Configure the optimizer.
     """
+    if method not in _BUILTIN_OPTIMIZERS:
+        from .optimizers import AVAILABLE_OPTIMIZERS
+        if method not in AVAILABLE_OPTIMIZERS:
+            click.echo(f"Optimization method '{method}' requires optional dependencies that are not installed.")
+            sys.exit(1)
+    
     # Load configuration
-    try:
-        with open(config, "r") as f:
-            cfg = yaml.safe_load(f)
-    except FileNotFoundError:
-        click.echo(f"Configuration file not found: {config}")
-        click.echo("Run 'psuu init' first to create a configuration file.")
-        sys.exit(1)
+    cfg = _load_cfg(config)
     
     # Update optimizer configuration
     cfg["optimizer"]["method"] = method
@@ -218,15 +449,14 @@ def set_optimizer(
         cfg["optimizer"]["num_iterations"] = iterations
         if seed is not None:
             cfg["optimizer"]["seed"] = seed
-    elif method == "bayesian":
+    elif method in ("bayesian", "tpe"):
         cfg["optimizer"]["num_iterations"] = iterations
         cfg["optimizer"]["n_initial_points"] = n_initial_points
         if seed is not None:
             cfg["optimizer"]["seed"] = seed
     
     # Write updated configuration
-    with open(config, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
+    _dump_cfg(cfg, config)
     
     click.echo(f"Updated optimizer configuration.")
 
@@ -237,33 +467,47 @@ def set_optimizer(
 @click.option(
     "--output", "-o",
     default="psuu_results",
-    help="Base filename for output files"
+    help="Base filename for output files; '{ts}' is replaced by the run's "
+         "timestamp, which is otherwise appended"
 )
 def run(config: str, verbose: bool, output: str):
     """
     Run a parameter optimization experiment.
     """
-    # Load configuration
+    # Check configuration from the YAML event stream, so an incomplete
+    # configuration fails before it is fully loaded
     try:
-        with open(config, "r") as f:
-            cfg = yaml.safe_load(f)
+        is_set = _peek_cfg(config, [key_path for key_path, _ in _RUN_REQUIREMENTS])
     except FileNotFoundError:
-        click.echo(f"Configuration file not found: {config}")
-        click.echo("Run 'psuu init' first to create a configuration file.")
-        sys.exit(1)
+        _exit_cfg_not_found(config)
+    for key_path, message in _RUN_REQUIREMENTS:
+        if not is_set.get(key_path):
+            click.echo(message)
+            sys.exit(1)
     
-    # Check configuration
-    if not cfg["parameters"]:
-        click.echo("No parameters defined. Use 'psuu add-param' to add parameters.")
-        sys.exit(1)
+    import importlib
+    import time
     
-    if not cfg["kpis"]:
-        click.echo("No KPIs defined. Use 'psuu add-kpi' to add KPIs.")
-        sys.exit(1)
+    # Load configuration
+    cfg = _load_cfg(config)
     
-    if not cfg["optimizer"]["objective"]:
-        click.echo("No objective KPI set. Use 'psuu set-optimizer --objective KPI_NAME'.")
-        sys.exit(1)
+    # Resolve all custom KPI functions up front, importing each module once,
+    # so a bad module or function name fails before the experiment is built
+    modules = {}
+    custom_kpis = {}
+    for name, kpi_config in cfg["kpis"].items():
+        if kpi_config.get("type") == "custom":
+            try:
+                module_name = kpi_config["module"]
+                module = modules.get(module_name)
+                if module is None:
+                    module = modules[module_name] = importlib.import_module(module_name)
+                custom_kpis[name] = getattr(module, kpi_config["function"])
+            except (ImportError, AttributeError) as e:
+                click.echo(f"Error loading custom KPI function: {e}")
+                sys.exit(1)
+    
+    from .experiment import PsuuExperiment
     
     # Create experiment
     experiment = PsuuExperiment(
@@ -276,16 +520,8 @@ def run(config: str, verbose: bool, output: str):
     
     # Add KPIs
     for name, kpi_config in cfg["kpis"].items():
-        if kpi_config.get("type") == "custom":
-            # Import custom KPI function
-            try:
-                import importlib
-                module = importlib.import_module(kpi_config["module"])
-                function = getattr(module, kpi_config["function"])
-                experiment.add_kpi(name=name, function=function)
-            except (ImportError, AttributeError) as e:
-                click.echo(f"Error loading custom KPI function: {e}")
-                sys.exit(1)
+        if name in custom_kpis:
+            experiment.add_kpi(name=name, function=custom_kpis[name])
         else:
             # Simple KPI
             experiment.add_kpi(
@@ -317,7 +553,7 @@ def run(config: str, verbose: bool, output: str):
             optimizer_args["num_iterations"] = cfg["optimizer"]["num_iterations"]
         if "seed" in cfg["optimizer"]:
             optimizer_args["seed"] = cfg["optimizer"]["seed"]
-    elif cfg["optimizer"]["method"] == "bayesian":
+    elif cfg["optimizer"]["method"] in ("bayesian", "tpe"):
         if "num_iterations" in cfg["optimizer"]:
             optimizer_args["num_iterations"] = cfg["optimizer"]["num_iterations"]
         if "n_initial_points" in cfg["optimizer"]:
@@ -334,7 +570,10 @@ def run(config: str, verbose: bool, output: str):
     
     # Run experiment
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    output_path = f"{output}_{timestamp}"
+    if "{ts}" in output:
+        output_path = output.replace("{ts}", timestamp)
+    else:
+        output_path = f"{output}_{timestamp}"
     
     click.echo(f"Starting optimization experiment...")
     
@@ -363,7 +602,26 @@ def run(config: str, verbose: bool, output: str):
     "--no-install", is_flag=True,
     help="Skip installing dependencies"
 )
-def clone_model_cmd(model_name: str, directory: Optional[str], no_install: bool):
+@click.option(
+    "--full-history", is_flag=True,
+    help="Clone the complete Git history instead of a shallow clone"
+)
+@click.option(
+    "--blobless", is_flag=True,
+    help="With --full-history, download file contents only as they are checked out"
+)
+@click.option(
+    "--cache", is_flag=True,
+    help="Clone from a local mirror of the repository, kept under ~/.cache/psuu"
+)
+def clone_model_cmd(
+    model_name: str,
+    directory: Optional[str],
+    no_install: bool,
+    full_history: bool,
+    blobless: bool,
+    cache: bool
+):
     """
     Clone a simulation model and configure PSUU to use it.
     
@@ -371,7 +629,10 @@ def clone_model_cmd(model_name: str, directory: Optional[str], no_install: bool)
     """
     try:
         from .clone_model import clone_model
-        clone_model(model_name, directory, not no_install)
+        clone_model(
+            model_name, directory, not no_install,
+            full_history=full_history, use_cache=cache, filter_blobs=blobless
+        )
     except ImportError:
         click.echo("Error: Could not import clone_model module.")
         sys.exit(1)
@@ -5,18 +5,25 @@ This module provides functionality to clone simulation models from GitHub
 and automatically configure PSUU to work with them.
 """
 
+import functools
+import hashlib
 import os
+import re
 import sys
 import subprocess
-import yaml
-import json
-import importlib.util
-from typing import Optional, Dict, Any, List, Tuple
-import tempfile
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 import shutil
+import string
+from pathlib import Path
 
+# asyncio and PyYAML together take longer to import than the rest of this
+# module; they are imported by the functions that use them, so listing
+# models or cloning a single one does not pay for them
 
-# Registry of known simulation models with their connection details
+
+# Registry of known simulation models with their connection details. An
+# entry may set "clone_flags" to replace the default shallow-clone options
+# of `git clone` for that model (see _clone_options).
 KNOWN_MODELS = {
     "cadcad-sandbox": {
         "repo": "https://github.com/rororowyourboat/cadcad-sandbox.git",
@@ -43,55 +50,388 @@ KNOWN_MODELS = {
 }
 
 
-def clone_repo(repo_url: str, target_dir: Optional[str] = None) -> str:
+class ModelSpec(NamedTuple):
     """
-    Clone a Git repository.
+    Registry entry of a model with the defaults of missing fields filled in.
+    """
+    repo: Optional[str]
+    description: str
+    main_command: str
+    param_format: str
+    output_format: str
+    default_params: Optional[Dict[str, Any]]
+    default_kpis: Optional[Dict[str, Dict[str, Any]]]
+    connector_type: str
+    connector_module: Optional[str]
+    connector_class: Optional[str]
+    dependencies: Optional[List[str]]
+    clone_flags: Optional[List[str]]
+
+
+@functools.lru_cache(maxsize=None)
+def _model_spec(model_name: str) -> ModelSpec:
+    """
+    Resolve the registry entry of a model.
+    
+    Resolved once per model name, like the rendered configuration; models
+    not in KNOWN_MODELS get the defaults for every field.
+    
+    Args:
+        model_name: Name of the model
+        
+    Returns:
+        Model specification
+    """
+    model_info = KNOWN_MODELS.get(model_name, {})
+    connector_module = model_info.get("connector_module")
+    
+    connector_class = None
+    if connector_module and "." in connector_module:
+        if connector_module.rsplit(".", 1)[1] == "cadcad_connector":
+            connector_class = "CadcadSimulationConnector"
+        else:
+            connector_class = f"{model_name.capitalize().replace('-', '')}Connector"
+    
+    return ModelSpec(
+        repo=model_info.get("repo"),
+        description=model_info.get("description", "No description"),
+        main_command=model_info.get("main_command", "python -m model"),
+        param_format=model_info.get("param_format", "--{name} {value}"),
+        output_format=model_info.get("output_format", "csv"),
+        default_params=model_info.get("default_params"),
+        default_kpis=model_info.get("default_kpis"),
+        connector_type=model_info.get("connector_type", "generic"),
+        connector_module=connector_module,
+        connector_class=connector_class,
+        dependencies=model_info.get("dependencies"),
+        clone_flags=model_info.get("clone_flags"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _git_version() -> Tuple[int, ...]:
+    """
+    Get the installed Git version.
+    
+    Returns:
+        Version as a tuple of integers, e.g. (2, 39, 2); empty if it cannot
+        be determined
+    """
+    try:
+        result = subprocess.run(
+            ["git", "--version"],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ()
+    # e.g. "git version 2.39.2" or "git version 2.39.3 (Apple Git-146)"
+    match = re.search(r"(\d+(?:\.\d+)+)", result.stdout)
+    return tuple(int(part) for part in match.group(1).split(".")) if match else ()
+
+
+def _clone_options(full_history: bool, filter_blobs: bool = False) -> List[str]:
+    """
+    Build the `git clone` options for fetching a repository.
+    
+    Only the tip of the default branch is needed to run a model, so unless
+    the full history is requested the clone is shallow, without tags, and
+    (on Git 2.19+, which supports partial clones) fetches blobs on demand.
+    
+    Args:
+        full_history: Whether to clone the complete history
+        filter_blobs: With full_history, whether to make a blobless partial
+            clone, which fetches all commits and trees but only the file
+            contents needed for the checkout (Git 2.19+)
+    
+    Returns:
+        List of options for `git clone`
+    """
+    if full_history:
+        return ["--filter=blob:none"] if filter_blobs and _git_version() >= (2, 19) else []
+    
+    options = ["--depth=1", "--single-branch", "--no-tags"]
+    if _git_version() >= (2, 19):
+        options.append("--filter=blob:none")
+    return options
+
+
+def _mirror_path(repo_url: str) -> str:
+    """
+    Get the path of the local mirror of a repository.
+    
+    Mirrors live under $PSUU_CACHE_DIR/git (default: $XDG_CACHE_HOME/psuu,
+    i.e. ~/.cache/psuu), named by the SHA-1 of the repository URL.
+    
+    Args:
+        repo_url: URL of the repository
+        
+    Returns:
+        Path to the bare mirror repository
+    """
+    cache_dir = os.environ.get("PSUU_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "psuu"
+    )
+    digest = hashlib.sha1(repo_url.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, "git", digest)
+
+
+def _clone_commands(
+    repo_url: str,
+    target_dir: Optional[str],
+    full_history: bool,
+    use_cache: bool,
+    filter_blobs: bool = False,
+    clone_flags: Optional[List[str]] = None
+) -> Tuple[str, List[List[str]]]:
+    """
+    Work out where a repository is cloned to and the commands that clone it.
     
     Args:
         repo_url: URL of the repository to clone
         target_dir: Directory to clone into (optional)
+        full_history: Whether to clone the complete history
+        use_cache: Whether to clone from a local mirror of the repository
+        filter_blobs: Whether to make a blobless partial clone of the full
+            history
+        clone_flags: Options for `git clone` replacing the default
+            shallow-clone options (ignored with full_history)
         
     Returns:
-        Path to the cloned repository
-    
-    Raises:
-        subprocess.CalledProcessError: If the clone fails
+        Tuple of (clone path, list of argv to run in order); the list is
+        empty if the clone path already exists
     """
     if target_dir:
         # Make sure the target directory exists
         os.makedirs(target_dir, exist_ok=True)
         clone_path = os.path.join(target_dir, os.path.basename(repo_url).replace('.git', ''))
-        
-        # Check if directory already exists
-        if os.path.exists(clone_path):
-            print(f"Directory already exists: {clone_path}")
-            return clone_path
-        
-        # Clone to the specified directory
-        subprocess.run(
-            ["git", "clone", repo_url, clone_path],
-            check=True,
-            capture_output=True,
-            text=True
-        )
     else:
         # Clone to current directory
         clone_path = os.path.basename(repo_url).replace('.git', '')
+    
+    # Check if directory already exists
+    if os.path.exists(clone_path):
+        print(f"Directory already exists: {clone_path}")
+        return clone_path, []
+    
+    if not use_cache:
+        if clone_flags is None or full_history:
+            options = _clone_options(full_history, filter_blobs)
+        else:
+            options = list(clone_flags)
+        return clone_path, [["git", "clone", *options, repo_url, clone_path]]
+    
+    # Bring the mirror up to date (only new objects are fetched once it
+    # exists), then clone from it locally, hardlinking its objects, and point
+    # the clone back at the original repository
+    mirror = _mirror_path(repo_url)
+    partial = _git_version() >= (2, 19)
+    if os.path.isdir(mirror):
+        update = ["git", "-C", mirror, "fetch", "--prune", "origin"]
+    else:
+        os.makedirs(os.path.dirname(mirror), exist_ok=True)
+        # On Git 2.19+ the mirror is blobless, like the default clone
+        update = [
+            "git", "clone", "--mirror", *(["--filter=blob:none"] if partial else []),
+            repo_url, mirror
+        ]
+    if not partial:
+        return clone_path, [
+            update,
+            ["git", "clone", "--local", mirror, clone_path],
+            ["git", "-C", clone_path, "remote", "set-url", "origin", repo_url],
+        ]
+    
+    # The mirror lacks the blobs that were never checked out, so the clone
+    # is made without a checkout and marked as a partial clone of the
+    # original repository, from which the checkout then fetches them
+    return clone_path, [
+        update,
+        ["git", "clone", "--local", "--no-checkout", mirror, clone_path],
+        ["git", "-C", clone_path, "remote", "set-url", "origin", repo_url],
+        ["git", "-C", clone_path, "config", "remote.origin.promisor", "true"],
+        ["git", "-C", clone_path, "config", "remote.origin.partialclonefilter", "blob:none"],
+        ["git", "-C", clone_path, "reset", "--quiet", "--hard"],
+    ]
+
+
+def clone_repo(
+    repo_url: str,
+    target_dir: Optional[str] = None,
+    full_history: bool = False,
+    use_cache: bool = False,
+    filter_blobs: bool = False,
+    clone_flags: Optional[List[str]] = None
+) -> str:
+    """
+    Clone a Git repository.
+    
+    Args:
+        repo_url: URL of the repository to clone
+        target_dir: Directory to clone into (optional)
+        full_history: Whether to clone the complete history instead of a
+            shallow clone of the default branch (default: False)
+        use_cache: Whether to keep a local mirror of the repository and clone
+            from it, so repeated clones only fetch new objects (default:
+            False). Clones made from the mirror have the full history.
+        filter_blobs: With full_history, whether to make a blobless partial
+            clone, which fetches the history but downloads file contents
+            only when they are checked out (default: False)
+        clone_flags: Options for `git clone` to use instead of the default
+            shallow-clone options, e.g. a model's "clone_flags" registry
+            entry (ignored with full_history or use_cache)
+    
+    Returns:
+        Path to the cloned repository
+    
+    Raises:
+        subprocess.CalledProcessError: If the clone fails
+    """
+    clone_path, commands = _clone_commands(
+        repo_url, target_dir, full_history, use_cache, filter_blobs, clone_flags
+    )
+    for argv in commands:
+        _run(argv)
+    return clone_path
+
+
+def _run(argv: List[str]) -> None:
+    """
+    Run a command, keeping only its error output.
+    
+    Standard output is discarded and standard error is read as bytes; it is
+    only decoded when the command fails.
+    
+    Args:
+        argv: Command and arguments (run without a shell)
         
-        # Check if directory already exists
-        if os.path.exists(clone_path):
-            print(f"Directory already exists: {clone_path}")
-            return clone_path
+    Raises:
+        subprocess.CalledProcessError: If the command fails
+    """
+    result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, argv,
+            stderr=result.stderr.decode(errors="replace"),
+        )
+
+
+async def _aclone_repo(
+    repo_url: str,
+    target_dir: Optional[str] = None,
+    full_history: bool = False,
+    use_cache: bool = False,
+    filter_blobs: bool = False,
+    clone_flags: Optional[List[str]] = None
+) -> str:
+    """Asynchronous version of clone_repo."""
+    clone_path, commands = _clone_commands(
+        repo_url, target_dir, full_history, use_cache, filter_blobs, clone_flags
+    )
+    for argv in commands:
+        await _arun(argv)
+    return clone_path
+
+
+async def _arun(argv: List[str]) -> None:
+    """
+    Run a command as a child process of the event loop.
+    
+    Like _run, only standard error is kept and it is decoded on failure.
+    
+    Args:
+        argv: Command and arguments (run without a shell)
         
-        # Clone to current directory
-        subprocess.run(
-            ["git", "clone", repo_url],
-            check=True,
-            capture_output=True,
-            text=True
+    Raises:
+        subprocess.CalledProcessError: If the command fails
+    """
+    import asyncio
+    
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, argv,
+            stderr=stderr.decode(errors="replace"),
         )
+
+
+@functools.lru_cache(maxsize=None)
+def _pip_install_command() -> Tuple[str, ...]:
+    """
+    Get the command prefix used to install packages.
     
-    return clone_path
+    uv's pip interface is used when it is on PATH (it resolves in parallel
+    and caches wheels, which makes repeated installs much faster), targeting
+    the running interpreter like pip would. Otherwise pip is run as a module
+    of the running interpreter, so packages land in the same environment as
+    PSUU regardless of which `pip` is first on PATH.
+    
+    Returns:
+        Command prefix to which the install arguments are appended
+    """
+    if shutil.which("uv"):
+        return ("uv", "pip", "install", "--python", sys.executable)
+    return (sys.executable, "-m", "pip", "install", "--no-input")
+
+
+def _install_commands(repo_path: str, model_name: Optional[str] = None) -> List[Tuple[str, List[str]]]:
+    """
+    Work out the commands that install a cloned repository's dependencies.
+    
+    Args:
+        repo_path: Path to the cloned repository
+        model_name: Name of the model (to check for specific dependencies)
+        
+    Returns:
+        List of (progress message, argv) pairs, to be run in order
+    """
+    commands = []
+    
+    # Install specific dependencies if provided in registry
+    dependencies = _model_spec(model_name).dependencies if model_name else None
+    if dependencies:
+        for dependency in dependencies:
+            commands.append((
+                f"Installing specific dependencies for {model_name}...",
+                [*_pip_install_command(), dependency]
+            ))
+    
+    # Look for dependency files with a single directory read
+    with os.scandir(repo_path) as entries:
+        names = {entry.name for entry in entries}
+    
+    # Check for requirements.txt
+    if "requirements.txt" in names:
+        commands.append((
+            "Installing dependencies from requirements.txt...",
+            [*_pip_install_command(), "-r", os.path.join(repo_path, "requirements.txt")]
+        ))
+    # Check for pyproject.toml (preferred over setup.py, as pip does)
+    elif "pyproject.toml" in names:
+        commands.append((
+            "Installing package from pyproject.toml...",
+            [*_pip_install_command(), "-e", repo_path]
+        ))
+    # Check for setup.py
+    elif "setup.py" in names:
+        commands.append((
+            "Installing package in development mode...",
+            [*_pip_install_command(), "-e", repo_path]
+        ))
+    else:
+        commands.append((
+            "No recognized dependency files found. Skipping dependency installation.",
+            []
+        ))
+    
+    return commands
 
 
 def install_dependencies(repo_path: str, model_name: str = None) -> None:
@@ -105,54 +445,129 @@ def install_dependencies(repo_path: str, model_name: str = None) -> None:
     Raises:
         subprocess.CalledProcessError: If installation fails
     """
-    # Install specific dependencies if provided in registry
-    if model_name and model_name in KNOWN_MODELS and "dependencies" in KNOWN_MODELS[model_name]:
-        print(f"Installing specific dependencies for {model_name}...")
-        for dependency in KNOWN_MODELS[model_name]["dependencies"]:
-            subprocess.run(
-                ["pip", "install", dependency],
-                check=True,
-                capture_output=True,
-                text=True
-            )
+    last_message = None
+    for message, argv in _install_commands(repo_path, model_name):
+        if message != last_message:
+            print(message)
+            last_message = message
+        if argv:
+            _run(argv)
+
+
+def _batch_install_command(repos: List[Tuple[str, Optional[str]]]) -> Optional[List[str]]:
+    """
+    Combine the installs of several cloned repositories into one command.
     
-    # Check for requirements.txt
-    req_file = os.path.join(repo_path, "requirements.txt")
-    if os.path.exists(req_file):
-        print(f"Installing dependencies from requirements.txt...")
-        subprocess.run(
-            ["pip", "install", "-r", req_file],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        return
+    Registry dependencies, requirements files (`-r`) and editable installs
+    (`-e`) of all repositories are passed to a single pip invocation, so the
+    resolver runs once over their union. Duplicate arguments are dropped.
     
-    # Check for setup.py
-    setup_file = os.path.join(repo_path, "setup.py")
-    if os.path.exists(setup_file):
-        print(f"Installing package in development mode...")
-        subprocess.run(
-            ["pip", "install", "-e", repo_path],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        return
+    Args:
+        repos: List of (repository path, model name) pairs
+        
+    Returns:
+        Install argv, or None if none of the repositories has dependencies
+    """
+    prefix = list(_pip_install_command())
+    requirements = {}
+    for repo_path, model_name in repos:
+        for _, argv in _install_commands(repo_path, model_name):
+            if argv:
+                requirements[tuple(argv[len(prefix):])] = None
     
-    # Check for pyproject.toml
-    pyproject_file = os.path.join(repo_path, "pyproject.toml")
-    if os.path.exists(pyproject_file):
-        print(f"Installing package from pyproject.toml...")
-        subprocess.run(
-            ["pip", "install", "-e", repo_path],
-            check=True,
-            capture_output=True,
-            text=True
-        )
+    if not requirements:
+        return None
+    return prefix + [arg for requirement in requirements for arg in requirement]
+
+
+def install_dependencies_batch(repo_paths: List[str], model_names: Optional[List[str]] = None) -> None:
+    """
+    Install the dependencies of several cloned repositories with one pip run.
+    
+    Args:
+        repo_paths: Paths to the cloned repositories
+        model_names: Names of the models, in the same order as repo_paths (to
+            check for specific dependencies)
+        
+    Raises:
+        subprocess.CalledProcessError: If installation fails
+    """
+    argv = _batch_install_command(list(zip(repo_paths, model_names or [None] * len(repo_paths))))
+    if argv is None:
+        print("No recognized dependency files found. Skipping dependency installation.")
         return
+    print(f"Installing dependencies for {len(repo_paths)} repositories...")
+    _run(argv)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> string.Template:
+    """
+    Load one of the code templates shipped in psuu/templates.
+    
+    Args:
+        name: File name of the template
+        
+    Returns:
+        Template with $-placeholders for the model-specific parts
+    """
+    try:
+        from importlib.resources import files
+    except ImportError:
+        # Python 3.8
+        with open(os.path.join(os.path.dirname(__file__), "templates", name)) as f:
+            return string.Template(f.read())
+    return string.Template(files("psuu").joinpath("templates").joinpath(name).read_text())
+
+
+_GENERATED_HEADER = "# psuu-template-sha: "
+
+
+def _content_hash(content: str) -> str:
+    """Short hash identifying the rendered content of a generated file."""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+
+
+def _write_generated_file(path: str, content: str) -> bool:
+    """
+    Write a generated source file unless an up-to-date copy already exists.
+    
+    The file starts with a header holding the hash of the content below it,
+    so an up-to-date file is recognized from its first line alone. An
+    outdated file is only replaced if its body still matches its header,
+    i.e. it has not been edited since it was generated. A file without the
+    header, e.g. one generated before the header was added, gets the header
+    if it matches the current template; otherwise it is left alone with a
+    warning, like an edited file.
+    
+    Args:
+        path: Path of the generated file
+        content: Rendered file content
+        
+    Returns:
+        True if the file was written
+    """
+    header = f"{_GENERATED_HEADER}{_content_hash(content)}\n"
+    try:
+        with open(path, encoding="utf-8") as f:
+            first_line = f.readline()
+            if first_line == header:
+                return False
+            if first_line.startswith(_GENERATED_HEADER):
+                up_to_date = _content_hash(f.read()) == first_line[len(_GENERATED_HEADER):].strip()
+            else:
+                up_to_date = first_line + f.read() == content
+        if not up_to_date:
+            print(
+                f"Warning: {path} differs from the current template and was left unchanged. "
+                "Delete it to regenerate it."
+            )
+            return False
+    except FileNotFoundError:
+        pass
     
-    print("No recognized dependency files found. Skipping dependency installation.")
+    Path(path).write_text(header + content, encoding="utf-8")
+    return True
 
 
 def generate_custom_connector(model_name: str, repo_path: str) -> Tuple[str, str]:
@@ -170,8 +585,8 @@ def generate_custom_connector(model_name: str, repo_path: str) -> Tuple[str, str
         raise ValueError(f"Unknown model: {model_name}")
     
     # Get connector module info
-    model_info = KNOWN_MODELS[model_name]
-    connector_module = model_info.get("connector_module")
+    spec = _model_spec(model_name)
+    connector_module = spec.connector_module
     
     # If connector_module is specified and already exists, just return it
     if connector_module:
@@ -190,9 +605,7 @@ def generate_custom_connector(model_name: str, repo_path: str) -> Tuple[str, str
         return rel_path, connector_module
     
     # Otherwise, we need to generate it
-    connector_type = model_info.get("connector_type", "generic")
-    
-    if connector_type == "cadcad":
+    if spec.connector_type == "cadcad":
         # Use the existing connector in the psuu package
         return "psuu/custom_connectors/cadcad_connector.py", "psuu.custom_connectors.cadcad_connector"
     else:
@@ -203,71 +616,21 @@ def generate_custom_connector(model_name: str, repo_path: str) -> Tuple[str, str
         # Initialize __init__.py if it doesn't exist
         init_file = os.path.join(connectors_dir, "__init__.py")
         if not os.path.exists(init_file):
-            with open(init_file, "w") as f:
-                f.write('"""Custom connector modules for PSUU."""\n')
+            Path(init_file).write_text('"""Custom connector modules for PSUU."""\n', encoding="utf-8")
         
         connector_path = os.path.join(connectors_dir, f"{model_name}_connector.py")
         
-        # Only create if it doesn't exist
-        if not os.path.exists(connector_path):
-            with open(connector_path, "w") as f:
-                f.write(f'''"""
-{model_name.capitalize()} Simulation Connector for PSUU.
-
-This module provides a custom connector for {model_name}.
-"""
-
-import os
-import subprocess
-import pandas as pd
-from typing import Dict, Any
-
-from psuu.simulation_connector import SimulationConnector
-
-
-class {model_name.capitalize().replace('-', '')}Connector(SimulationConnector):
-    """
-    Custom simulation connector for {model_name}.
-    """
-    
-    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
-        """
-        Run the simulation with the given parameters and return results.
-        
-        Args:
-            parameters: Dictionary of parameter names and values
-            
-        Returns:
-            DataFrame containing simulation results
-        """
-        cmd = self._build_command(parameters)
-        
-        # Run the command
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=True,
-            cwd=self.working_dir,
-            capture_output=True,
-            text=True
+        # Create it, or update it if it was generated from an older
+        # template and has not been edited since
+        _write_generated_file(
+            connector_path,
+            _load_template("generic_connector.py.tmpl").substitute(
+                model_name=model_name,
+                model_title=model_name.capitalize(),
+                class_name=f"{model_name.capitalize().replace('-', '')}Connector",
+            ),
         )
         
-        # Process output based on the format (CSV by default)
-        if self.output_file:
-            # Read from output file
-            return pd.read_csv(os.path.join(self.working_dir, self.output_file))
-        else:
-            # Read from stdout
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.csv', delete=False) as temp_file:
-                temp_file.write(result.stdout)
-                temp_file_path = temp_file.name
-            
-            try:
-                return pd.read_csv(temp_file_path)
-            finally:
-                os.unlink(temp_file_path)
-''')
-        
         module_name = f"psuu.custom_connectors.{model_name}_connector"
         return connector_path, module_name
 
@@ -286,16 +649,15 @@ def create_kpi_functions(model_name: str) -> Dict[str, Any]:
         # Generic KPIs
         return {}
     
-    model_info = KNOWN_MODELS[model_name]
-    default_kpis = model_info.get("default_kpis", {})
+    spec = _model_spec(model_name)
     
     # Process KPIs
     kpi_config = {}
     
-    for kpi_name, kpi_info in default_kpis.items():
+    for kpi_name, kpi_info in (spec.default_kpis or {}).items():
         if kpi_info.get("type") == "custom":
             # Get connector module name from model info
-            connector_module = model_info.get("connector_module", f"psuu.custom_connectors.{model_name}_connector")
+            connector_module = spec.connector_module or f"psuu.custom_connectors.{model_name}_connector"
             kpi_config[kpi_name] = {
                 "type": "custom",
                 "module": connector_module,
@@ -311,20 +673,30 @@ def create_kpi_functions(model_name: str) -> Dict[str, Any]:
     return kpi_config
 
 
-def configure_psuu(model_name: str, repo_path: str) -> None:
+@functools.lru_cache(maxsize=None)
+def _render_config(model_name: str, repo_path: str) -> bytes:
     """
-    Configure PSUU to work with the cloned model.
+    Render the PSUU configuration for a cloned model.
+    
+    The result only depends on the registry entry and the repository path,
+    so it is rendered once per (model, path); registry entries are not
+    expected to change once a model has been set up.
     
     Args:
         model_name: Name of the model
         repo_path: Path to the cloned repository
+        
+    Returns:
+        YAML document
     """
+    spec = _model_spec(model_name)
+    
     # Create default configuration
     config = {
         "simulation": {
-            "command": KNOWN_MODELS.get(model_name, {}).get("main_command", "python -m model"),
-            "param_format": KNOWN_MODELS.get(model_name, {}).get("param_format", "--{name} {value}"),
-            "output_format": KNOWN_MODELS.get(model_name, {}).get("output_format", "csv"),
+            "command": spec.main_command,
+            "param_format": spec.param_format,
+            "output_format": spec.output_format,
             "output_file": None,
             "working_dir": repo_path,
         },
@@ -339,8 +711,8 @@ def configure_psuu(model_name: str, repo_path: str) -> None:
     }
     
     # Add default parameters if available
-    if model_name in KNOWN_MODELS and "default_params" in KNOWN_MODELS[model_name]:
-        for param_name, param_value in KNOWN_MODELS[model_name]["default_params"].items():
+    if spec.default_params is not None:
+        for param_name, param_value in spec.default_params.items():
             if isinstance(param_value, tuple) and len(param_value) == 2:
                 config["parameters"][param_name] = list(param_value)
             else:
@@ -360,152 +732,226 @@ def configure_psuu(model_name: str, repo_path: str) -> None:
         else:
             config["optimizer"]["maximize"] = True
     
-    # Write configuration file
-    with open("psuu_config.yaml", "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    import yaml
+    # LibYAML's C emitter is several times faster than the pure-Python one
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
     
-    print(f"Created PSUU configuration for {model_name} in psuu_config.yaml")
+    return yaml.dump(config, Dumper=Dumper, default_flow_style=False, encoding="utf-8")
 
 
-def generate_example_script(model_name: str, repo_path: str) -> str:
+def configure_psuu(model_name: str, repo_path: str) -> None:
     """
-    Generate an example script to run the model with PSUU.
+    Configure PSUU to work with the cloned model.
     
     Args:
         model_name: Name of the model
         repo_path: Path to the cloned repository
-        
-    Returns:
-        Path to the generated script
     """
-    script_path = f"run_{model_name.replace('-', '_')}.py"
+    # Write configuration file
+    Path("psuu_config.yaml").write_bytes(_render_config(model_name, repo_path))
     
-    # Get connector module info
-    connector_module = KNOWN_MODELS.get(model_name, {}).get("connector_module", "")
-    connector_class = None
+    print(f"Created PSUU configuration for {model_name} in psuu_config.yaml")
+
+
+def _format_param_line(name: str, value: Any) -> str:
+    """
+    Format a parameter-space line of the example script.
     
-    if connector_module:
-        if "." in connector_module:
-            module_name = connector_module.split(".")[-1]
-            
-            if module_name == "cadcad_connector":
-                connector_class = "CadcadSimulationConnector"
-            else:
-                connector_class = f"{model_name.capitalize().replace('-', '')}Connector"
+    Two-element lists and tuples are written as (low, high) ranges, other
+    lists and tuples as lists of values, and any other value as is.
     
-    # Create the script
-    with open(script_path, "w") as f:
-        f.write(f'''#!/usr/bin/env python
-"""
-Example script to run {model_name} with PSUU.
-
-This script demonstrates how to use PSUU to optimize parameters for {model_name}.
-"""
+    Args:
+        name: Name of the parameter
+        value: Registry value of the parameter
+        
+    Returns:
+        Line of the parameter-space dictionary
+    """
+    if isinstance(value, (list, tuple)):
+        if len(value) == 2:
+            return f'        "{name}": ({value[0]}, {value[1]}),\n'
+        value = list(value)
+    return f'        "{name}": {value},\n'
 
-import os
-import sys
-import pandas as pd
-from psuu import PsuuExperiment
 
-''')
-        
-        # Import custom connector if available
-        if connector_module and connector_class:
-            f.write(f'from {connector_module} import {connector_class}\n')
-            f.write(f'from {connector_module} import peak_infections, total_infections, epidemic_duration, calculate_r0\n\n')
-        
-        f.write(f'''
-def main():
-    """Run optimization for {model_name}."""
-    print("PSUU - {model_name.capitalize()} Parameter Optimization")
-    print("=" * 50)
+@functools.lru_cache(maxsize=None)
+def _render_example_script(model_name: str, repo_path: str) -> str:
+    """
+    Render the example script for a cloned model.
     
-    # Create experiment
-    experiment = PsuuExperiment(
-        simulation_command="{KNOWN_MODELS.get(model_name, {}).get("main_command", "python -m model")}",
-        param_format="{KNOWN_MODELS.get(model_name, {}).get("param_format", "--{name} {value}")}",
-        output_format="{KNOWN_MODELS.get(model_name, {}).get("output_format", "csv")}",
-        working_dir="{repo_path}"
-    )
+    Like _render_config, this is rendered once per (model, path).
     
-''')
+    Args:
+        model_name: Name of the model
+        repo_path: Path to the cloned repository
         
-        # Add custom connector if available
-        if connector_module and connector_class:
-            f.write(f'''    # Replace default connector with custom connector
+    Returns:
+        Script source
+    """
+    spec = _model_spec(model_name)
+    connector_module = spec.connector_module
+    connector_class = spec.connector_class
+    command = spec.main_command
+    param_format = spec.param_format
+    default_kpis = spec.default_kpis
+    default_params = spec.default_params
+    
+    # Import and set up the custom connector if available
+    connector_imports = ""
+    connector_setup = ""
+    if connector_module and connector_class:
+        connector_imports = (
+            f"from {connector_module} import {connector_class}\n"
+            f"from {connector_module} import peak_infections, total_infections, epidemic_duration, calculate_r0\n\n"
+        )
+        connector_setup = f'''    # Replace default connector with custom connector
     experiment.simulation_connector = {connector_class}(
-        command="{KNOWN_MODELS.get(model_name, {}).get("main_command", "python -m model")}",
-        param_format="{KNOWN_MODELS.get(model_name, {}).get("param_format", "--{name} {value}")}",
+        command="{command}",
+        param_format="{param_format}",
         working_dir="{repo_path}"
     )
     
-''')
-        
-        # Add KPIs
-        if model_name in KNOWN_MODELS and "default_kpis" in KNOWN_MODELS[model_name]:
-            f.write("    # Add KPIs\n")
-            
-            for kpi_name, kpi_info in KNOWN_MODELS[model_name]["default_kpis"].items():
-                if kpi_info.get("type") == "custom":
-                    f.write(f'    experiment.add_kpi("{kpi_name}", function={kpi_info.get("function")})\n')
-                else:
-                    f.write(f'    experiment.add_kpi("{kpi_name}", column="{kpi_info.get("column", kpi_name)}", operation="{kpi_info.get("operation", "max")}")\n')
-            
-            f.write("\n")
+'''
+    
+    # Add KPIs
+    kpis = ""
+    kpi_prints = ""
+    optimizer = ""
+    if default_kpis is not None:
+        lines = ["    # Add KPIs\n"]
+        for kpi_name, kpi_info in default_kpis.items():
+            if kpi_info.get("type") == "custom":
+                lines.append(f'    experiment.add_kpi("{kpi_name}", function={kpi_info.get("function")})\n')
+            else:
+                lines.append(f'    experiment.add_kpi("{kpi_name}", column="{kpi_info.get("column", kpi_name)}", operation="{kpi_info.get("operation", "max")}")\n')
+        lines.append("\n")
+        kpis = "".join(lines)
         
-        # Add parameter space
-        if model_name in KNOWN_MODELS and "default_params" in KNOWN_MODELS[model_name]:
-            f.write("    # Set parameter space\n")
-            f.write("    experiment.set_parameter_space({\n")
-            
-            for param_name, param_value in KNOWN_MODELS[model_name]["default_params"].items():
-                if isinstance(param_value, tuple) and len(param_value) == 2:
-                    f.write(f'        "{param_name}": ({param_value[0]}, {param_value[1]}),\n')
-                elif isinstance(param_value, list):
-                    f.write(f'        "{param_name}": {param_value},\n')
-                else:
-                    f.write(f'        "{param_name}": {param_value},\n')
-            
-            f.write("    })\n\n")
+        kpi_prints = "".join(
+            f'    print(f"Best {kpi_name}: {{results.best_kpis[\'{kpi_name}\']:.2f}}")\n'
+            for kpi_name in default_kpis
+        )
         
         # Configure optimizer
-        if model_name in KNOWN_MODELS and "default_kpis" in KNOWN_MODELS[model_name]:
-            first_kpi = next(iter(KNOWN_MODELS[model_name]["default_kpis"].keys()))
-            maximize = "True" if "peak" not in first_kpi and "duration" not in first_kpi else "False"
-            
-            f.write("    # Configure optimizer\n")
-            f.write("    experiment.set_optimizer(\n")
-            f.write('        method="random",\n')
-            f.write(f'        objective_name="{first_kpi}",\n')
-            f.write(f'        maximize={maximize},\n')
-            f.write('        num_iterations=20\n')
-            f.write("    )\n\n")
-        
-        # Run optimization
-        f.write("    # Run optimization\n")
-        f.write('    results = experiment.run(verbose=True, save_results="results/{model_name}_optimization")\n\n')
-        
-        # Print results
-        f.write("    # Print results\n")
-        f.write('    print("\\nOptimization Results:")\n')
-        f.write('    print(f"Best parameters: {results.best_parameters}")\n')
-        
-        if model_name in KNOWN_MODELS and "default_kpis" in KNOWN_MODELS[model_name]:
-            for kpi_name in KNOWN_MODELS[model_name]["default_kpis"].keys():
-                f.write(f'    print(f"Best {kpi_name}: {{results.best_kpis[\'{kpi_name}\']:.2f}}")\n')
-        
-        f.write('''
+        first_kpi = next(iter(default_kpis))
+        maximize = "True" if "peak" not in first_kpi and "duration" not in first_kpi else "False"
+        optimizer = (
+            "    # Configure optimizer\n"
+            "    experiment.set_optimizer(\n"
+            '        method="random",\n'
+            f'        objective_name="{first_kpi}",\n'
+            f'        maximize={maximize},\n'
+            '        num_iterations=20\n'
+            "    )\n\n"
+        )
+    
+    # Add parameter space
+    parameter_space = ""
+    if default_params is not None:
+        parameter_space = "".join([
+            "    # Set parameter space\n",
+            "    experiment.set_parameter_space({\n",
+            *(
+                _format_param_line(param_name, param_value)
+                for param_name, param_value in default_params.items()
+            ),
+            "    })\n\n",
+        ])
+    
+    return _load_template("run_model.py.tmpl").substitute(
+        model_name=model_name,
+        model_title=model_name.capitalize(),
+        command=command,
+        param_format=param_format,
+        output_format=spec.output_format,
+        repo_path=repo_path,
+        connector_imports=connector_imports,
+        connector_setup=connector_setup,
+        kpis=kpis,
+        parameter_space=parameter_space,
+        optimizer=optimizer,
+        kpi_prints=kpi_prints,
+    )
 
-if __name__ == "__main__":
-    main()
-''')
+
+def generate_example_script(model_name: str, repo_path: str) -> str:
+    """
+    Generate an example script to run the model with PSUU.
+    
+    Args:
+        model_name: Name of the model
+        repo_path: Path to the cloned repository
+        
+    Returns:
+        Path to the generated script
+    """
+    script_path = f"run_{model_name.replace('-', '_')}.py"
+    script = Path(script_path)
+    
+    # Create the script
+    script.write_text(_render_example_script(model_name, repo_path), encoding="utf-8")
     
     # Make the script executable
-    os.chmod(script_path, 0o755)
+    script.chmod(0o755)
     return script_path
 
 
-def clone_model(model_name: str, target_dir: Optional[str] = None, install: bool = True) -> None:
+def _check_known_model(model_name: str) -> None:
+    """
+    Check that a model is in the registry.
+    
+    Raises:
+        ValueError: If the model is unknown
+    """
+    if model_name not in KNOWN_MODELS:
+        known_models = ", ".join(KNOWN_MODELS.keys())
+        raise ValueError(f"Unknown model: {model_name}. Known models: {known_models}")
+
+
+def _set_up_model(model_name: str, repo_path: str) -> str:
+    """
+    Generate the connector, PSUU configuration and example script for a model.
+    
+    Args:
+        model_name: Name of the model
+        repo_path: Path to the cloned repository
+        
+    Returns:
+        Path to the generated example script
+    """
+    # Generate custom connector
+    connector_path, connector_module = generate_custom_connector(model_name, repo_path)
+    print(f"Generated custom connector at {connector_path}")
+    
+    # Configure PSUU
+    configure_psuu(model_name, repo_path)
+    
+    # Generate example script
+    script_path = generate_example_script(model_name, repo_path)
+    print(f"Generated example script at {script_path}")
+    return script_path
+
+
+def _print_next_steps(model_name: str, script_path: str) -> None:
+    """Print how to run the model that was just set up."""
+    print(f"\nSuccessfully set up {model_name}!")
+    print(f"You can now run optimization with:")
+    print(f"  psuu run")
+    print(f"Or use the example script:")
+    print(f"  python {script_path}")
+
+
+def clone_model(
+    model_name: str,
+    target_dir: Optional[str] = None,
+    install: bool = True,
+    full_history: bool = False,
+    use_cache: bool = False,
+    filter_blobs: bool = False
+) -> None:
     """
     Clone and configure a simulation model.
     
@@ -513,20 +959,30 @@ def clone_model(model_name: str, target_dir: Optional[str] = None, install: bool
         model_name: Name of the model to clone
         target_dir: Directory to clone into (optional)
         install: Whether to install dependencies (default: True)
-        
+        full_history: Whether to clone the repository's complete history
+            (default: False, a shallow clone)
+        use_cache: Whether to clone from a local mirror of the repository
+            (default: False); see clone_repo
+        filter_blobs: With full_history, whether to make a blobless partial
+            clone (default: False); see clone_repo
+    
     Raises:
         ValueError: If the model is unknown
     """
     # Check if model is known
-    if model_name not in KNOWN_MODELS:
-        known_models = ", ".join(KNOWN_MODELS.keys())
-        raise ValueError(f"Unknown model: {model_name}. Known models: {known_models}")
+    _check_known_model(model_name)
     
-    repo_url = KNOWN_MODELS[model_name]["repo"]
-    print(f"Cloning {model_name} from {repo_url}...")
+    spec = _model_spec(model_name)
+    print(f"Cloning {model_name} from {spec.repo}...")
     
     # Clone repository
-    repo_path = clone_repo(repo_url, target_dir)
+    repo_path = clone_repo(
+        spec.repo, target_dir,
+        full_history=full_history,
+        use_cache=use_cache,
+        filter_blobs=filter_blobs,
+        clone_flags=spec.clone_flags,
+    )
     print(f"Cloned {model_name} to {repo_path}")
     
     # Install dependencies if requested
@@ -538,22 +994,131 @@ def clone_model(model_name: str, target_dir: Optional[str] = None, install: bool
             print(f"Error installing dependencies: {e}")
             print("You may need to manually install dependencies.")
     
-    # Generate custom connector
-    connector_path, connector_module = generate_custom_connector(model_name, repo_path)
-    print(f"Generated custom connector at {connector_path}")
+    script_path = _set_up_model(model_name, repo_path)
+    _print_next_steps(model_name, script_path)
+
+
+def clone_models(
+    model_names: List[str],
+    target_dir: Optional[str] = None,
+    install: bool = True,
+    full_history: bool = False,
+    use_cache: bool = False,
+    max_concurrency: int = 4,
+    filter_blobs: bool = False
+) -> None:
+    """
+    Clone and configure several simulation models concurrently.
     
-    # Configure PSUU
-    configure_psuu(model_name, repo_path)
+    Clones run as concurrent child processes of one event loop, at most
+    `max_concurrency` at a time, and each model's connector, configuration
+    and example script are generated as soon as it is cloned. The
+    dependencies of all models are then installed with a single pip run (see
+    install_dependencies_batch). As with clone_model, psuu_config.yaml is
+    written to the current directory, so it ends up configured for whichever
+    model finishes last.
     
-    # Generate example script
-    script_path = generate_example_script(model_name, repo_path)
-    print(f"Generated example script at {script_path}")
+    Falls back to cloning the models one after another when called from
+    inside a running event loop.
     
-    print(f"\nSuccessfully set up {model_name}!")
-    print(f"You can now run optimization with:")
-    print(f"  psuu run")
-    print(f"Or use the example script:")
-    print(f"  python {script_path}")
+    Args:
+        model_names: Names of the models to clone
+        target_dir: Directory to clone into (optional)
+        install: Whether to install dependencies (default: True)
+        full_history: Whether to clone the repositories' complete history
+            (default: False, shallow clones)
+        use_cache: Whether to clone from local mirrors of the repositories
+            (default: False); see clone_repo
+        max_concurrency: Maximum number of simultaneous clones
+        filter_blobs: With full_history, whether to make blobless partial
+            clones (default: False); see clone_repo
+    
+    Raises:
+        ValueError: If any of the models is unknown
+    """
+    import asyncio
+    
+    for model_name in model_names:
+        _check_known_model(model_name)
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        for model_name in model_names:
+            clone_model(model_name, target_dir, install, full_history, use_cache, filter_blobs)
+        return
+    
+    asyncio.run(_aclone_models(
+        model_names, target_dir, install, full_history, use_cache, max_concurrency, filter_blobs
+    ))
+
+
+async def _aclone_models(
+    model_names: List[str],
+    target_dir: Optional[str],
+    install: bool,
+    full_history: bool,
+    use_cache: bool,
+    max_concurrency: int,
+    filter_blobs: bool
+) -> None:
+    """
+    Clone and configure models with at most `max_concurrency` clones at once.
+    
+    Args:
+        model_names: Names of the models to clone
+        target_dir: Directory to clone into (optional)
+        install: Whether to install dependencies
+        full_history: Whether to clone the repositories' complete history
+        use_cache: Whether to clone from local mirrors of the repositories
+        max_concurrency: Maximum number of simultaneous clones
+        filter_blobs: With full_history, whether to make blobless partial clones
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def clone_one(model_name: str) -> Tuple[str, str]:
+        spec = _model_spec(model_name)
+        async with semaphore:
+            print(f"Cloning {model_name} from {spec.repo}...")
+            repo_path = await _aclone_repo(
+                spec.repo, target_dir,
+                full_history=full_history,
+                use_cache=use_cache,
+                filter_blobs=filter_blobs,
+                clone_flags=spec.clone_flags,
+            )
+        print(f"Cloned {model_name} to {repo_path}")
+        
+        # Generating the connector, configuration and script only touches
+        # local files; running it on the loop thread keeps models from
+        # writing psuu_config.yaml at the same time, while the other clones
+        # carry on downloading in their own processes
+        return repo_path, _set_up_model(model_name, repo_path)
+    
+    cloned = await asyncio.gather(*(clone_one(model_name) for model_name in model_names))
+    
+    # Install the dependencies of all models in a single pip run
+    if install:
+        argv = _batch_install_command([
+            (repo_path, model_name) for model_name, (repo_path, _) in zip(model_names, cloned)
+        ])
+        if argv is None:
+            print("No recognized dependency files found. Skipping dependency installation.")
+        else:
+            print(f"Installing dependencies for {', '.join(model_names)}...")
+            try:
+                await _arun(argv)
+                print(f"Installed dependencies for {', '.join(model_names)}")
+            except subprocess.CalledProcessError as e:
+                print(f"Error installing dependencies: {e}")
+                print("You may need to manually install dependencies.")
+    
+    for model_name, (_, script_path) in zip(model_names, cloned):
+        _print_next_steps(model_name, script_path)
 
 
 def list_available_models() -> None:
@@ -561,11 +1126,12 @@ def list_available_models() -> None:
     print("Available models:")
     print("=" * 50)
     
-    for name, info in KNOWN_MODELS.items():
+    for name in KNOWN_MODELS:
+        spec = _model_spec(name)
         print(f"- {name}")
-        print(f"  Repository: {info['repo']}")
-        print(f"  Description: {info.get('description', 'No description')}")
-        print(f"  Command: {info.get('main_command', 'python -m model')}")
-        if "dependencies" in info:
-            print(f"  Dependencies: {', '.join(info['dependencies'])}")
+        print(f"  Repository: {spec.repo}")
+        print(f"  Description: {spec.description}")
+        print(f"  Command: {spec.main_command}")
+        if spec.dependencies is not None:
+            print(f"  Dependencies: {', '.join(spec.dependencies)}")
         print()
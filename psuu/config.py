@@ -5,6 +5,8 @@ This module provides configuration handling for PSUU integration,
 including loading and validating YAML configuration files.
 """
 
+import copy
+import functools
 import os
 import yaml
 import json
@@ -15,10 +17,47 @@ from pathlib import Path
 
 from .exceptions import ConfigurationError
 
+# LibYAML's C parser is several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a configuration file, memoized on its path, mtime and size.
+    
+    Editing the file changes its mtime (and usually its size), which gives a
+    new cache key, so stale configurations are never returned. Callers must
+    not mutate the returned dictionary.
+    
+    Args:
+        path: Absolute path to the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Parsed configuration
+    
+    Raises:
+        ConfigurationError: If file format is not supported
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    # Both parsers take bytes and detect the encoding (UTF-8/16, BOM) themselves
+    with open(path, 'rb') as f:
+        if suffix == '.yaml' or suffix == '.yml':
+            return yaml.load(f, Loader=_YamlLoader)
+        elif suffix == '.json':
+            return json.load(f)
+        else:
+            raise ConfigurationError(f"Unsupported configuration format: {suffix}")
+
+
 class PsuuConfig:
     """
     Configuration handler for PSUU integration.
@@ -61,18 +100,16 @@ class PsuuConfig:
         Raises:
             ConfigurationError: If file format is not supported or file doesn't exist
         """
-        path = Path(config_path)
-        if not path.exists():
+        path = os.path.abspath(config_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {config_path}")
         
-        suffix = path.suffix.lower()
-        with open(path, 'r') as f:
-            if suffix == '.yaml' or suffix == '.yml':
-                return yaml.safe_load(f)
-            elif suffix == '.json':
-                return json.load(f)
-            else:
-                raise ConfigurationError(f"Unsupported configuration format: {suffix}")
+        # Repeated loads of an unchanged file are served from the parse cache;
+        # each instance gets its own copy since self.config is mutable
+        config = _load_config_cached(path, stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(config)
     
     def get_model_config(self) -> Dict:
         """Get model configuration section."""
@@ -7,17 +7,134 @@ Note: For improved error handling and robustness, consider using the
 RobustCadcadConnector from psuu.validation instead.
 """
 
+import asyncio
+import itertools
 import os
-import tempfile
+import shlex
 import subprocess
+import time
 import json
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from psuu.simulation_connector import SimulationConnector
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+
+# Sources of unique output names (see _prepare_run). The session token keeps
+# names from colliding with files left by an earlier process that had the same
+# pid. Kept at module level so connectors stay picklable for process-pool batches.
+_SESSION_TOKEN = format(time.time_ns() // 1000, "x")
+_RUN_COUNTER = itertools.count()
+
+# Only the end of a failed simulation's stderr is kept for the error report
+_STDERR_TAIL_BYTES = 8192
+
+
+def _contains_name(file_name: str, output_name: str) -> bool:
+    """
+    Check whether a file name contains output_name as a whole token.
+    
+    Output names end in a run counter, so 'psuu_run_x_1' must not match
+    files written for 'psuu_run_x_10'.
+    
+    Args:
+        file_name: Name of a file in the output directory
+        output_name: Output name passed to the simulation
+        
+    Returns:
+        True if output_name appears in file_name not followed by a digit
+    """
+    start = file_name.find(output_name)
+    while start != -1:
+        end = start + len(output_name)
+        if not file_name[end:end + 1].isdigit():
+            return True
+        start = file_name.find(output_name, start + 1)
+    return False
+
+
+def _clean_params(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert numpy scalars (integer, floating, bool_) to native Python types.
+    
+    Args:
+        parameters: Dictionary of parameter names and values
+        
+    Returns:
+        New dictionary with native Python values
+    """
+    return {
+        key: value.item() if isinstance(value, np.generic) else value
+        for key, value in parameters.items()
+    }
+
+
+def _run_with_stderr_tail(argv: Union[str, List[str]], cwd: Optional[str]) -> None:
+    """
+    Run a command, discarding stdout and keeping only the tail of stderr.
+    
+    Args:
+        argv: Command-line arguments, or a command string to run through
+            the shell
+        cwd: Working directory for the command
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+            status; its stderr holds the last _STDERR_TAIL_BYTES bytes
+    """
+    tail = b""
+    with subprocess.Popen(
+        argv,
+        shell=isinstance(argv, str),
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    ) as process:
+        for chunk in iter(lambda: process.stderr.read(_STDERR_TAIL_BYTES), b""):
+            tail = (tail + chunk)[-_STDERR_TAIL_BYTES:]
+        returncode = process.wait()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, argv, stderr=tail.decode(errors="replace")
+        )
+
+
+class KpiResult(NamedTuple):
+    """
+    Summary KPI values produced by a single cadcad-sandbox run.
+    """
+    peak: float
+    total: float
+    duration: float
+    r0: float
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the KPI values to the single-row DataFrame layout used by
+        column-based KPIs.
+        
+        Returns:
+            DataFrame with timestep, I, S, R, duration and r0 columns
+        """
+        return pd.DataFrame({
+            'timestep': [0],
+            'I': [self.peak],         # Using peak as I value
+            'S': [1000 - self.total], # Estimating S from total infections
+            'R': [self.total],        # Using total as R value
+            'duration': [self.duration],
+            'r0': [self.r0]
+        })
+
 
 class CadcadSimulationConnector(SimulationConnector):
     """
@@ -28,106 +145,329 @@ class CadcadSimulationConnector(SimulationConnector):
         or better parameter validation, use RobustCadcadConnector from psuu.validation.
     """
     
-    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
+    def __init__(
+        self,
+        command: str,
+        param_format: str = "--{name} {value}",
+        output_format: str = "csv",
+        output_file: Optional[str] = None,
+        working_dir: Optional[str] = None,
+        return_dataframe: bool = True,
+        model_callable: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        output_path_arg: Optional[str] = None,
+    ):
         """
-        Run the simulation with the given parameters and return results.
+        Initialize the cadCAD simulation connector.
         
         Args:
-            parameters: Dictionary of parameter names and values
+            command: Base command to execute the simulation
+            param_format: Format string for parameter arguments
+            output_format: Format of the simulation output ('csv' or 'json')
+            output_file: Filename where simulation writes its output (if None, uses stdout)
+            working_dir: Working directory for the simulation command
+            return_dataframe: Return a single-row DataFrame (default). Pass False
+                to get a KpiResult instead, which skips building the DataFrame;
+                the KPI functions of this module accept either, and column-based
+                KPIs such as add_kpi(column=...) convert it when needed
+            model_callable: Optional model entry point (e.g. CadcadModelWrapper.model_function)
+                called in-process with the parameters instead of running command.
+                Its return value (usually a DataFrame) is passed to the KPI
+                functions unchanged. Must be a module-level function for batches
+                to run in worker processes.
+            output_path_arg: Optional flag (e.g. "--output-path") the simulation
+                accepts for an explicit KPI file path. When set, the connector
+                passes the exact path and reads it directly instead of
+                searching data/simulations for the output.
+        """
+        super().__init__(command, param_format, output_format, output_file, working_dir)
+        self.return_dataframe = return_dataframe
+        self.model_callable = model_callable
+        self.output_path_arg = output_path_arg
+        self._sim_dir = os.path.join(working_dir or "", "data", "simulations")
+    
+    def _find_output_file(self, sim_dir: str, output_name: str) -> str:
+        """
+        Locate the KPI file written by a simulation run.
+        
+        Simulations that write their KPIs to exactly ``{output_name}.json`` in
+        ``data/simulations`` are found with a single stat call. Otherwise the
+        directory is scanned for the newest JSON file containing output_name
+        (cadcad-sandbox adds its own suffixes).
+        
+        Args:
+            sim_dir: Directory the simulation writes its output to
+            output_name: Output name passed to the simulation
             
         Returns:
-            DataFrame containing simulation results
+            Path to the KPI JSON file
+            
+        Raises:
+            FileNotFoundError: If no matching output file exists
         """
-        # Convert any numpy types to native Python types
-        cleaned_params = {}
-        for key, value in parameters.items():
-            if isinstance(value, np.integer):
-                cleaned_params[key] = int(value)
-            elif isinstance(value, np.floating):
-                cleaned_params[key] = float(value)
-            else:
-                cleaned_params[key] = value
+        exact_path = os.path.join(sim_dir, f"{output_name}.json")
+        if os.path.isfile(exact_path):
+            return exact_path
         
-        cmd = self._build_command(cleaned_params)
-        timestamp = time.strftime("%Y_%m_%d_%H_%M_%S")
-        output_name = f"psuu_run_{timestamp}"
+        # Keep the latest matching KPI file in a single pass; only matching
+        # entries are stat'ed
+        latest_path = None
+        latest_mtime = -1
+        with os.scandir(sim_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith('.json') and _contains_name(name, output_name):
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > latest_mtime:
+                        latest_path, latest_mtime = entry.path, mtime
         
-        # Add output parameter to command
-        cmd = f"{cmd} --output {output_name}"
+        if latest_path is None:
+            raise FileNotFoundError(f"No output files found with name {output_name}")
         
-        # Run simulation
-        try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                check=True,
-                cwd=self.working_dir,
-                env=os.environ.copy(),
-                capture_output=True,
-                text=True
-            )
+        return latest_path
+    
+    def _prepare_run(self, parameters: Dict[str, Any]) -> Tuple[Union[str, List[str]], str]:
+        """
+        Build the command and output name for a simulation run.
+        
+        Args:
+            parameters: Dictionary of parameter names and values
             
-            # Find the latest simulation output files
-            sim_dir = os.path.join(self.working_dir, "data", "simulations")
-            files = [f for f in os.listdir(sim_dir) if f.endswith('.json') and output_name in f]
+        Returns:
+            Tuple of (argument list, or a command string for the shell if the
+            command uses shell syntax, output name)
+        """
+        # Process id plus a per-process counter: unique across workers and
+        # across runs within one process, without a strftime call
+        output_name = f"psuu_run_{_SESSION_TOKEN}_{os.getpid()}_{next(_RUN_COUNTER)}"
+        
+        # Output parameters added to the command
+        output_args = ["--output", output_name]
+        if self.output_path_arg:
+            output_args.extend([self.output_path_arg, self._output_path(output_name)])
+        
+        # Like SimulationConnector.run_simulation, commands with pipes,
+        # redirects or variables are run through the shell
+        if self._use_shell:
+            command = self._build_command(_clean_params(parameters))
+            return f"{command} {' '.join(map(shlex.quote, output_args))}", output_name
+        
+        argv = self._build_argv(_clean_params(parameters))
+        argv.extend(output_args)
+        return argv, output_name
+    
+    def _output_path(self, output_name: str) -> str:
+        """
+        Build the explicit KPI file path passed with output_path_arg.
+        
+        Args:
+            output_name: Output name passed to the simulation
             
-            if not files:
-                raise FileNotFoundError(f"No output files found with name {output_name}")
+        Returns:
+            Path to the KPI JSON file for this run
+        """
+        return os.path.join(self._sim_dir, f"{output_name}.json")
+    
+    def _load_kpi_result(self, output_name: str) -> Union[KpiResult, pd.DataFrame]:
+        """
+        Load the KPIs written by a finished simulation run.
+        
+        Args:
+            output_name: Output name passed to the simulation
             
-            # Get the latest KPI file
-            kpi_file = sorted(files)[-1]
+        Returns:
+            Single-row DataFrame, or a KpiResult if return_dataframe is False
+        """
+        # Locate the simulation output file
+        if self.output_path_arg:
+            kpi_path = self._output_path(output_name)
+        else:
+            kpi_path = self._find_output_file(self._sim_dir, output_name)
+        
+        # Load KPI data from raw bytes, skipping a decode pass (parsed in C
+        # by orjson when it is installed)
+        with open(kpi_path, 'rb') as f:
+            kpi_data = _json_loads(f.read())
+        
+        kpi_result = KpiResult(
+            peak=kpi_data['peak_infections']['mean'],
+            total=kpi_data['total_infections']['mean'],
+            duration=kpi_data['epidemic_duration']['mean'],
+            r0=kpi_data['r0']['mean'],
+        )
+        
+        return kpi_result.to_dataframe() if self.return_dataframe else kpi_result
+    
+    def _failed_result(self, error: subprocess.CalledProcessError) -> Union[KpiResult, pd.DataFrame]:
+        """
+        Report a failed simulation and build the placeholder result.
+        
+        Args:
+            error: The error raised for the failed command
             
-            # Load KPI data
-            with open(os.path.join(sim_dir, kpi_file), 'r') as f:
-                kpi_data = json.load(f)
+        Returns:
+            Empty DataFrame, or a KpiResult of NaNs if return_dataframe is False
+        """
+        print(f"Simulation failed with error: {error}")
+        print(f"Stderr (tail): {error.stderr}")
+        if not self.return_dataframe:
+            return KpiResult(np.nan, np.nan, np.nan, np.nan)
+        # Return empty DataFrame with expected columns
+        return pd.DataFrame(columns=['timestep', 'I', 'S', 'R', 'duration', 'r0'])
+    
+    def run_simulation(self, parameters: Dict[str, Any]) -> Union[KpiResult, pd.DataFrame]:
+        """
+        Run the simulation with the given parameters and return results.
+        
+        Args:
+            parameters: Dictionary of parameter names and values
             
-            # Convert KPI data to DataFrame for compatibility with our KPI functions
-            # Create a synthetic DataFrame with just the KPI values
-            peak = kpi_data['peak_infections']['mean']
-            total = kpi_data['total_infections']['mean']
-            duration = kpi_data['epidemic_duration']['mean']
-            r0 = kpi_data['r0']['mean']
+        Returns:
+            Single-row DataFrame with the run's summary KPIs, or a KpiResult
+            if return_dataframe is False. With model_callable, whatever the
+            callable returns.
+        """
+        if self.model_callable is not None:
+            return self.model_callable(_clean_params(parameters))
+        
+        argv, output_name = self._prepare_run(parameters)
+        
+        # Run simulation
+        try:
+            _run_with_stderr_tail(argv, self.working_dir)
+        except subprocess.CalledProcessError as e:
+            return self._failed_result(e)
+        
+        return self._load_kpi_result(output_name)
+    
+    def run_simulation_batch(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[KpiResult, pd.DataFrame, Exception]]:
+        """
+        Run several simulations concurrently from a single asyncio event loop.
+        
+        Each simulation is a child process; the parent drains their stderr
+        pipes without blocking, so no worker processes are needed. Falls back
+        to the process pool when called from inside a running event loop, and
+        always uses it with model_callable (each worker imports the model
+        module once, when the callable is first unpickled, and reuses it for
+        every run it is given).
+        
+        Args:
+            parameter_sets: List of parameter dictionaries to simulate
+            max_workers: Maximum number of simultaneous simulations (None for os.cpu_count())
+            return_exceptions: If True, failed runs are returned as exception
+                instances in place of their result instead of being raised
             
-            df = pd.DataFrame({
-                'timestep': [0],
-                'I': [peak],         # Using peak as I value
-                'S': [1000 - total], # Estimating S from total infections
-                'R': [total],        # Using total as R value
-                'duration': [duration],
-                'r0': [r0]
-            })
+        Returns:
+            List of results, in the same order as parameter_sets
+        """
+        if self.model_callable is not None:
+            return super().run_simulation_batch(parameter_sets, max_workers, return_exceptions)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return super().run_simulation_batch(parameter_sets, max_workers, return_exceptions)
+        
+        limit = max_workers or os.cpu_count() or 1
+        return asyncio.run(
+            self._run_batch_async(parameter_sets, limit, return_exceptions)
+        )
+    
+    async def _run_batch_async(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        limit: int,
+        return_exceptions: bool,
+    ) -> List[Union[KpiResult, pd.DataFrame, Exception]]:
+        """
+        Run a batch of simulations with at most `limit` running at once.
+        
+        Args:
+            parameter_sets: List of parameter dictionaries to simulate
+            limit: Maximum number of simultaneous simulations
+            return_exceptions: Whether to return exceptions instead of raising
             
-            return df
+        Returns:
+            List of results, in the same order as parameter_sets
+        """
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run_one(parameters: Dict[str, Any]):
+            argv, output_name = self._prepare_run(parameters)
+            async with semaphore:
+                if isinstance(argv, str):
+                    process = await asyncio.create_subprocess_shell(
+                        argv,
+                        cwd=self.working_dir,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                else:
+                    process = await asyncio.create_subprocess_exec(
+                        *argv,
+                        cwd=self.working_dir,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                tail = b""
+                while True:
+                    chunk = await process.stderr.read(_STDERR_TAIL_BYTES)
+                    if not chunk:
+                        break
+                    tail = (tail + chunk)[-_STDERR_TAIL_BYTES:]
+                returncode = await process.wait()
             
-        except subprocess.CalledProcessError as e:
-            print(f"Simulation failed with error: {e}")
-            print(f"Stdout: {e.stdout}")
-            print(f"Stderr: {e.stderr}")
-            # Return empty DataFrame with expected columns
-            return pd.DataFrame(columns=['timestep', 'I', 'S', 'R', 'duration', 'r0'])
+            if returncode != 0:
+                return self._failed_result(subprocess.CalledProcessError(
+                    returncode, argv, stderr=tail.decode(errors="replace"),
+                ))
+            return self._load_kpi_result(output_name)
+        
+        return await asyncio.gather(
+            *(run_one(parameters) for parameters in parameter_sets),
+            return_exceptions=return_exceptions,
+        )
 
 
 # Custom KPI Functions
+#
+# These accept either the single-row DataFrame the connector returns by
+# default (also used by RobustCadcadConnector fallbacks) or the KpiResult
+# returned with return_dataframe=False.
 
-def peak_infections(df: pd.DataFrame) -> float:
+def peak_infections(result: Union[KpiResult, pd.DataFrame]) -> float:
     """Calculate peak infections KPI from simulation output."""
-    # Since we're using the synthetic DataFrame, I is directly the peak
-    return df['I'].iloc[0]
+    if isinstance(result, KpiResult):
+        return result.peak
+    # In the synthetic DataFrame, I is directly the peak
+    return result['I'].iloc[0]
 
 
-def total_infections(df: pd.DataFrame) -> float:
+def total_infections(result: Union[KpiResult, pd.DataFrame]) -> float:
     """Calculate total infections KPI from simulation output."""
-    # In our synthetic DataFrame, R is the total infections
-    return df['R'].iloc[0]
+    if isinstance(result, KpiResult):
+        return result.total
+    # In the synthetic DataFrame, R is the total infections
+    return result['R'].iloc[0]
 
 
-def epidemic_duration(df: pd.DataFrame) -> float:
+def epidemic_duration(result: Union[KpiResult, pd.DataFrame]) -> float:
     """Calculate epidemic duration KPI from simulation output."""
-    # In our synthetic DataFrame, duration is directly available
-    return df['duration'].iloc[0]
+    if isinstance(result, KpiResult):
+        return result.duration
+    # In the synthetic DataFrame, duration is directly available
+    return result['duration'].iloc[0]
 
 
-def calculate_r0(df: pd.DataFrame) -> float:
+def calculate_r0(result: Union[KpiResult, pd.DataFrame]) -> float:
     """Calculate basic reproduction number."""
-    # In our synthetic DataFrame, r0 is directly available
-    return df['r0'].iloc[0]
+    if isinstance(result, KpiResult):
+        return result.r0
+    # In the synthetic DataFrame, r0 is directly available
+    return result['r0'].iloc[0]
@@ -0,0 +1,199 @@
+"""
+Config Template Connector for PSUU.
+
+This module provides a connector for simulation models that read their
+parameters from a configuration file rather than from command-line flags.
+"""
+
+import hashlib
+import io
+import json
+import os
+import string
+import subprocess
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from psuu.simulation_connector import SimulationConnector
+
+
+class ConfigTemplateConnector(SimulationConnector):
+    """
+    Simulation connector that renders a config file per parameter set.
+
+    The template is the model's native config file (YAML, JSON, TOML, ...)
+    with ``${name}`` placeholders (string.Template syntax). For each run the
+    placeholders are filled in, the result is written to
+    ``config_dir/<run_id><ext>`` and the model is started as
+    ``command <config_arg> <path>``.
+
+    The run id is a blake2b hash of the parameters, the template text and
+    the command, so identical parameter sets map to the same config file
+    until the template or command changes. With ``cache_results`` enabled,
+    results for a run id already seen by this connector are returned (as
+    copies) without running the model again, and an existing output file for
+    that run id is loaded instead of re-running.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        template_path: str,
+        config_dir: str,
+        config_arg: str = "--config",
+        output_format: str = "csv",
+        output_file: Optional[str] = None,
+        working_dir: Optional[str] = None,
+        cache_results: bool = True,
+        cache_size: int = 128,
+    ):
+        """
+        Initialize the config template connector.
+
+        Args:
+            command: Base command to execute the simulation
+            template_path: Path to the config template
+            config_dir: Directory where rendered config files are written
+            config_arg: Command-line flag used to pass the config file path
+            output_format: Format of the simulation output ('csv', 'json' or 'feather')
+            output_file: Filename where simulation writes its output (if None, uses
+                stdout). May contain ``{run_id}``, which is also available to the
+                template as ``${run_id}``, so parallel runs do not share a file.
+            working_dir: Working directory for the simulation command
+            cache_results: Reuse results for parameter sets that were already run
+            cache_size: Number of results kept in memory for reuse (least
+                recently used results are dropped first)
+        """
+        super().__init__(command, output_format=output_format,
+                         output_file=output_file, working_dir=working_dir)
+        self.template_path = template_path
+        # Absolute, since the model runs with working_dir as its cwd
+        self.config_dir = os.path.abspath(config_dir)
+        self.config_arg = config_arg
+        self.cache_results = cache_results
+        self.cache_size = cache_size
+
+        # Read and parse the template once; only the substitutions vary per run
+        with open(template_path, "r") as f:
+            template_text = f.read()
+        self.template = string.Template(template_text)
+        self._config_ext = os.path.splitext(template_path)[1]
+
+        # Run ids also cover everything that determines a run's output besides
+        # the parameters, so configs and outputs left by an older template or
+        # command are not reused
+        self._run_context = hashlib.blake2b(
+            "\0".join([template_text, command, config_arg]).encode(), digest_size=16
+        ).hexdigest()
+
+        self._results_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        os.makedirs(self.config_dir, exist_ok=True)
+
+    @staticmethod
+    def _encode_parameters(parameters: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Encode parameter values for substitution into the template.
+
+        Values are JSON-encoded, which is valid in both JSON and YAML configs
+        (strings are quoted, booleans become true/false).
+
+        Args:
+            parameters: Dictionary of parameter names and values
+
+        Returns:
+            Dictionary of parameter names and encoded values
+        """
+        return {
+            name: json.dumps(value.item() if isinstance(value, np.generic) else value)
+            for name, value in parameters.items()
+        }
+
+    def _run_id(self, encoded: Dict[str, str]) -> str:
+        """
+        Build the content hash identifying a run.
+
+        Args:
+            encoded: Encoded parameters from _encode_parameters
+
+        Returns:
+            Hex digest identifying the parameter set together with the
+            template and command
+        """
+        payload = json.dumps([self._run_context, encoded], sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def write_config(self, parameters: Dict[str, Any]) -> str:
+        """
+        Render the template for a parameter set and write it to config_dir.
+
+        The file is only written if it does not exist yet.
+
+        Args:
+            parameters: Dictionary of parameter names and values
+
+        Returns:
+            Path to the rendered config file
+
+        Raises:
+            KeyError: If the template references a parameter that was not given
+        """
+        encoded = self._encode_parameters(parameters)
+        run_id = self._run_id(encoded)
+        config_path = os.path.join(self.config_dir, f"{run_id}{self._config_ext}")
+
+        if not os.path.exists(config_path):
+            content = self.template.substitute(encoded, run_id=run_id)
+            # Write to a temporary name first so parallel runs never read a partial file
+            tmp_path = f"{config_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, config_path)
+
+        return config_path
+
+    def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Run the simulation with the given parameters and return results.
+
+        Args:
+            parameters: Dictionary of parameter names and values
+
+        Returns:
+            DataFrame containing simulation results
+
+        Raises:
+            subprocess.CalledProcessError: If the simulation command fails
+        """
+        config_path = self.write_config(parameters)
+        run_id = os.path.splitext(os.path.basename(config_path))[0]
+
+        if self.cache_results and run_id in self._results_cache:
+            self._results_cache.move_to_end(run_id)
+            return self._results_cache[run_id].copy()
+
+        argv = self._command_argv + [self.config_arg, config_path]
+
+        if self.output_file:
+            output_path = self.output_file.format(run_id=run_id)
+
+            if not (self.cache_results and os.path.exists(output_path)):
+                subprocess.run(argv, check=True, cwd=self.working_dir)
+            results = self._load_output(output_path)
+        else:
+            completed = subprocess.run(
+                argv,
+                check=True,
+                capture_output=True,
+                cwd=self.working_dir
+            )
+            results = self._load_output(io.BytesIO(completed.stdout))
+
+        if self.cache_results and self.cache_size > 0:
+            # Keep a private copy so callers cannot change cached results
+            self._results_cache[run_id] = results.copy()
+            if len(self._results_cache) > self.cache_size:
+                self._results_cache.popitem(last=False)
+        return results
@@ -53,12 +53,17 @@ class KPICalculator:
             "filter_condition": filter_condition
         }
     
-    def calculate_kpis(self, df: pd.DataFrame) -> Dict[str, float]:
+    def calculate_kpis(self, df: Any) -> Dict[str, float]:
         """
         Calculate all defined KPIs for a given DataFrame.
         
+        Custom KPI functions receive the simulation output as-is, so connectors
+        may return lightweight result objects instead of DataFrames. Such
+        objects are converted with their to_dataframe() method only when
+        column-based KPIs need a DataFrame.
+        
         Args:
-            df: Simulation results DataFrame
+            df: Simulation results DataFrame (or connector-specific result object)
             
         Returns:
             Dictionary of KPI names and values
@@ -73,6 +78,9 @@ class KPICalculator:
                 print(f"Error calculating KPI '{name}': {e}")
                 results[name] = np.nan
         
+        if self.simple_kpis and not isinstance(df, pd.DataFrame) and hasattr(df, "to_dataframe"):
+            df = df.to_dataframe()
+        
         # Calculate simple KPIs
         for name, config in self.simple_kpis.items():
             try:
@@ -148,9 +156,33 @@ class DataAggregator:
             "result_index": len(self.simulation_results)
         }
         self.simulation_results.append(result_entry)
-        
+
         return kpis
-    
+
+    def add_direct_result(
+        self,
+        parameters: Dict[str, Any],
+        kpis: Dict[str, float]
+    ) -> Dict[str, float]:
+        """
+        Add a result whose KPIs have already been calculated.
+
+        Args:
+            parameters: Parameters used for this simulation run
+            kpis: Dictionary of KPI values for this run
+
+        Returns:
+            Dictionary of KPI values
+        """
+        result_entry = {
+            "parameters": parameters.copy(),
+            "kpis": kpis.copy(),
+            "result_index": len(self.simulation_results)
+        }
+        self.simulation_results.append(result_entry)
+
+        return kpis
+
     def get_best_result(
         self, 
         kpi_name: str, 
@@ -6,6 +6,8 @@ optimization experiments with PSUU.
 """
 
 from typing import Dict, Any, List, Tuple, Optional, Union, Callable, Type
+import contextlib
+import functools
 import os
 import time
 import json
@@ -13,12 +15,13 @@ import yaml
 import pandas as pd
 import numpy as np
 import logging
+from collections import OrderedDict
 
-from .simulation_connector import SimulationConnector
+from .simulation_connector import SimulationConnector, process_pool, run_in_process_pool
 from .data_aggregator import DataAggregator, KPICalculator
 from .optimizers import AVAILABLE_OPTIMIZERS, Optimizer
 from .protocols.model_protocol import ModelProtocol
-from .results import SimulationResults, convert_numpy_types
+from .results import PYARROW_AVAILABLE, SimulationResults, convert_numpy_types
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -53,6 +56,9 @@ class PsuuExperiment:
         output_file: Optional[str] = None,
         working_dir: Optional[str] = None,
         connector_class: Optional[Type[SimulationConnector]] = None,
+        cache_size: int = 0,
+        cache_precision: int = 6,
+        model_run_options: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize a new experiment with either a model or simulation command.
@@ -65,6 +71,15 @@ class PsuuExperiment:
             output_file: Path to output file (CLI mode only)
             working_dir: Working directory for the simulation (CLI mode only)
             connector_class: Custom connector class (defaults to SimulationConnector for CLI)
+            cache_size: Number of evaluated parameter sets to remember so repeated
+                points skip the simulation (0 disables caching; leave disabled for
+                stochastic simulations)
+            cache_precision: Decimal places float parameters are rounded to when
+                matching cached evaluations (lower values increase the hit rate)
+            model_run_options: Keyword arguments passed to model.run() and
+                model.run_batch() on every evaluation (protocol mode only), e.g.
+                {"return_timeseries": False} for models that can skip building
+                time series when only KPIs are needed
         
         Raises:
             ValueError: If neither model nor simulation_command is provided
@@ -73,6 +88,7 @@ class PsuuExperiment:
         self.integration_mode = None
         self.model = None
         self.simulation_connector = None
+        self.model_run_options = dict(model_run_options or {})
         
         # Set up the integration mode
         if model is not None:
@@ -108,6 +124,11 @@ class PsuuExperiment:
         self.kpi_calculator = KPICalculator()
         self.data_aggregator = DataAggregator(self.kpi_calculator)
         
+        # Cache of KPI values keyed by rounded parameter tuples (LRU order)
+        self.cache_size = cache_size
+        self.cache_precision = cache_precision
+        self._evaluation_cache: "OrderedDict[Tuple, Dict[str, float]]" = OrderedDict()
+        
         # Initialize optimization settings
         self.optimizer = None
         self.objective_name = None
@@ -171,6 +192,9 @@ class PsuuExperiment:
             raise ValueError(
                 "Must provide either a custom function or column name"
             )
+        
+        # Cached KPI values do not include the new KPI
+        self._evaluation_cache.clear()
             
         # Set as objective if specified
         if objective is not None:
@@ -262,10 +286,41 @@ class PsuuExperiment:
             **kwargs
         )
     
+    def _compute_kpis(self, sim_results: Any) -> Dict[str, float]:
+        """
+        Compute KPI values from raw simulation output.
+        
+        Args:
+            sim_results: SimulationResults object, DataFrame, or connector result
+                object (such as KpiResult) returned by a simulation
+            
+        Returns:
+            Dictionary of KPI values
+        """
+        # Handle both SimulationResults objects and raw DataFrames
+        if isinstance(sim_results, SimulationResults):
+            kpis = sim_results.kpis.copy()
+            df = sim_results.time_series_data
+            
+            # Compute any KPIs not already in results (models that only report
+            # KPIs may leave the time series unset)
+            for name, func in self.kpi_calculator.kpi_functions.items():
+                if name not in kpis and df is not None and not df.empty:
+                    kpis[name] = func(df)
+                    
+            return kpis
+        
+        # DataFrame or connector-specific result object (e.g. KpiResult);
+        # the KPI calculator dispatches on the type
+        return self.kpi_calculator.calculate_kpis(sim_results)
+    
     def _evaluate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, float]:
         """
         Evaluate a set of parameters using the configured model or connector.
         
+        Runs through _evaluate_batch, so single evaluations share its
+        caching and KPI computation.
+        
         Args:
             parameters: Dictionary of parameter values
             
@@ -275,38 +330,162 @@ class PsuuExperiment:
         Raises:
             ValueError: If neither model nor simulation_connector is configured
         """
-        if self.integration_mode == "protocol" and self.model is not None:
-            # Protocol Integration mode - call model.run()
-            sim_results = self.model.run(parameters)
+        (outcome,) = self._evaluate_batch([parameters])
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    def _cache_key(self, parameters: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Build the evaluation cache key for a parameter set.
+        
+        Args:
+            parameters: Dictionary of parameter values
             
-            # Handle both SimulationResults objects and raw DataFrames
-            if isinstance(sim_results, SimulationResults):
-                kpis = sim_results.kpis.copy()
-                df = sim_results.time_series_data
-                
-                # Compute any KPIs not already in results
-                for name, func in self.kpi_calculator.kpi_functions.items():
-                    if name not in kpis and not df.empty:
-                        kpis[name] = func(df)
-                        
-                return kpis
+        Returns:
+            Hashable key, or None if the parameters cannot be cached
+        """
+        key = tuple(sorted(
+            (name, round(value, self.cache_precision) if isinstance(value, float) else value)
+            for name, value in parameters.items()
+        ))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _evaluate_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        n_workers: Optional[int] = None,
+    ) -> List[Union[Dict[str, float], Exception]]:
+        """
+        Evaluate a batch of independent parameter sets concurrently.
+        
+        Simulations run in worker processes; KPIs are computed in this process
+        so that KPI functions do not need to be picklable.
+        
+        Args:
+            batch: List of parameter dictionaries
+            n_workers: Maximum number of worker processes (None for os.cpu_count())
+            
+        Returns:
+            List of KPI dictionaries, or the exception raised for a failed
+            evaluation, in the same order as batch
+        """
+        use_cache = self.cache_size > 0
+        
+        # For each batch entry record either a cached KPI dict or the index of
+        # the simulation that will produce it (duplicates share one run)
+        slots: List[Tuple[Optional[Dict[str, float]], int]] = []
+        keys: List[Optional[Tuple]] = []
+        pending: Dict[Tuple, int] = {}
+        to_run: List[Dict[str, Any]] = []
+        for parameters in batch:
+            key = self._cache_key(parameters) if use_cache else None
+            if key is not None and key in self._evaluation_cache:
+                self._evaluation_cache.move_to_end(key)
+                slots.append((self._evaluation_cache[key], -1))
+            elif key is not None and key in pending:
+                slots.append((None, pending[key]))
             else:
-                # Assume it's a DataFrame and compute KPIs
-                df = sim_results
-                return self.kpi_calculator.calculate_kpis(df)
-                
+                if key is not None:
+                    pending[key] = len(to_run)
+                slots.append((None, len(to_run)))
+                to_run.append(parameters)
+                keys.append(key)
+        
+        if not to_run:
+            outputs = []
         elif self.integration_mode == "cli" and self.simulation_connector is not None:
-            # CLI Integration mode - use simulation connector
-            result_df = self.simulation_connector.run_simulation(parameters)
-            return self.kpi_calculator.calculate_kpis(result_df)
+            outputs = self.simulation_connector.run_simulation_batch(
+                to_run, max_workers=n_workers, return_exceptions=True
+            )
+        elif self.integration_mode == "protocol" and self.model is not None:
+            # Use run_batch only when the model provides its own implementation
+            run_batch = getattr(type(self.model), "run_batch", None)
+            if run_batch is not None and run_batch is not ModelProtocol.run_batch:
+                outputs = self._run_model_batches(to_run, n_workers)
+            else:
+                outputs = run_in_process_pool(
+                    functools.partial(self.model.run, **self.model_run_options),
+                    to_run,
+                    max_workers=n_workers,
+                    return_exceptions=True,
+                )
         else:
             raise ValueError("Neither model nor simulation_connector is configured")
+        
+        computed = []
+        for output in outputs:
+            if isinstance(output, Exception):
+                computed.append(output)
+                continue
+            try:
+                computed.append(self._compute_kpis(output))
+            except Exception as e:
+                computed.append(e)
+        
+        # Remember successful evaluations, evicting the least recently used
+        for key, result in zip(keys, computed):
+            if key is not None and not isinstance(result, Exception):
+                self._evaluation_cache[key] = result
+                if len(self._evaluation_cache) > self.cache_size:
+                    self._evaluation_cache.popitem(last=False)
+        
+        results = [
+            cached if cached is not None else computed[index]
+            for cached, index in slots
+        ]
+        
+        return results
+    
+    def _run_model_batches(
+        self,
+        to_run: List[Dict[str, Any]],
+        n_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run parameter sets through the model's own run_batch method.
+        
+        The parameter sets are split into one contiguous chunk per worker, so
+        each worker pays the model's batch setup cost once.
+        
+        Args:
+            to_run: List of parameter dictionaries
+            n_workers: Maximum number of worker processes (None for os.cpu_count())
+            
+        Returns:
+            List of simulation outputs, or the exception raised for the chunk
+            a parameter set belonged to, in the same order as to_run
+        """
+        workers = min(len(to_run), n_workers or os.cpu_count() or 1)
+        chunk_size = -(-len(to_run) // workers)
+        chunks = [to_run[i:i + chunk_size] for i in range(0, len(to_run), chunk_size)]
+        
+        outputs: List[Any] = []
+        chunk_outputs = run_in_process_pool(
+            functools.partial(self.model.run_batch, **self.model_run_options),
+            chunks,
+            max_workers=n_workers,
+            return_exceptions=True,
+        )
+        for chunk, chunk_output in zip(chunks, chunk_outputs):
+            if isinstance(chunk_output, Exception):
+                outputs.extend([chunk_output] * len(chunk))
+            else:
+                outputs.extend(chunk_output)
+        
+        return outputs
     
     def run(
         self,
         max_iterations: Optional[int] = None,
         verbose: bool = True,
         save_results: Optional[str] = None,
+        batch_size: int = 1,
+        n_workers: Optional[int] = None,
     ) -> "ExperimentResults":
         """
         Run the parameter optimization experiment.
@@ -315,6 +494,10 @@ class PsuuExperiment:
             max_iterations: Maximum number of iterations (None for optimizer default)
             verbose: Whether to print progress information
             save_results: Path to save results (None to skip saving)
+            batch_size: Number of parameter sets to request from the optimizer and
+                evaluate concurrently per step (1 evaluates sequentially)
+            n_workers: Maximum number of worker processes for batched evaluation
+                (None for os.cpu_count())
             
         Returns:
             ExperimentResults object containing optimization results
@@ -328,6 +511,9 @@ class PsuuExperiment:
         if self.objective_name is None:
             raise ValueError("Objective KPI must be set before running experiment")
         
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
         iteration = 0
         start_time = time.time()
         
@@ -339,70 +525,93 @@ class PsuuExperiment:
         # Store all evaluation results
         all_evaluations = []
         
-        while not self.optimizer.is_finished():
-            if max_iterations is not None and iteration >= max_iterations:
-                if verbose:
-                    print(f"Reached maximum iterations ({max_iterations})")
-                break
-            
-            # Get next parameter set to evaluate
-            parameters = self.optimizer.suggest()
-            
-            if verbose:
-                params_str = ", ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}" 
-                                     for k, v in parameters.items())
-                print(f"Iteration {iteration + 1}: Evaluating parameters {params_str}")
-            
-            # Run simulation with these parameters
-            try:
-                # Validate parameters if using protocol model
-                if self.integration_mode == "protocol" and hasattr(self.model, 'validate_params'):
-                    is_valid, error_msg = self.model.validate_params(parameters)
-                    if not is_valid:
-                        raise ValueError(f"Invalid parameters: {error_msg}")
+        # Batches are simulated in worker processes, started once per run
+        with process_pool(n_workers) if batch_size > 1 else contextlib.nullcontext():
+            while not self.optimizer.is_finished():
+                if max_iterations is not None and iteration >= max_iterations:
+                    if verbose:
+                        print(f"Reached maximum iterations ({max_iterations})")
+                    break
                 
-                # Evaluate parameters
-                kpis = self._evaluate_parameters(parameters)
-                
-                # Add to evaluations
-                all_evaluations.append({
-                    "parameters": parameters,
-                    "kpis": kpis,
-                    "iteration": iteration
-                })
-                
-                # Update optimizer with result
-                objective_value = kpis.get(self.objective_name)
-                if objective_value is None:
-                    raise ValueError(f"Objective KPI '{self.objective_name}' not found in evaluation results")
+                # Get next parameter set(s) to evaluate
+                if batch_size == 1:
+                    batch = [self.optimizer.suggest()]
+                else:
+                    n = batch_size
+                    if max_iterations is not None:
+                        n = min(n, max_iterations - iteration)
+                    batch = self.optimizer.batch_suggest(n)
+                    if not batch:
+                        break
                 
-                self.optimizer.update(parameters, objective_value)
+                # Validate parameters if using protocol model
+                validation_errors: Dict[int, Exception] = {}
+                if self.integration_mode == "protocol" and hasattr(self.model, 'validate_params'):
+                    for i, parameters in enumerate(batch):
+                        is_valid, error_msg = self.model.validate_params(parameters)
+                        if not is_valid:
+                            validation_errors[i] = ValueError(f"Invalid parameters: {error_msg}")
                 
-                # Add to data aggregator
-                if self.integration_mode == "cli":
-                    # For CLI mode, data aggregator needs the DataFrame
-                    result_df = self.simulation_connector.run_simulation(parameters)
-                    self.data_aggregator.add_simulation_result(parameters, result_df)
-                else:
-                    # For protocol mode, add directly
-                    self.data_aggregator.add_direct_result(parameters, kpis)
+                # Run simulations with these parameters
+                to_run = [p for i, p in enumerate(batch) if i not in validation_errors]
+                outcomes_iter = iter(self._evaluate_batch(to_run, n_workers))
+                outcomes = [
+                    validation_errors[i] if i in validation_errors else next(outcomes_iter)
+                    for i in range(len(batch))
+                ]
                 
-                if verbose:
-                    print(f"  Result: {self.objective_name} = {objective_value:.6g}")
-            
-            except Exception as e:
-                if verbose:
-                    print(f"  Error evaluating parameters: {e}")
+                # Successful results, reported to the optimizer as one batch
+                evaluated: List[Tuple[Dict[str, Any], float]] = []
+                for parameters, outcome in zip(batch, outcomes):
+                    if verbose:
+                        params_str = ", ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}" 
+                                             for k, v in parameters.items())
+                        print(f"Iteration {iteration + 1}: Evaluating parameters {params_str}")
+                    
+                    try:
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        kpis = outcome
+                        
+                        # Add to evaluations
+                        all_evaluations.append({
+                            "parameters": parameters,
+                            "kpis": kpis,
+                            "iteration": iteration
+                        })
+                        
+                        # Queue the result for the optimizer
+                        objective_value = kpis.get(self.objective_name)
+                        if objective_value is None:
+                            raise ValueError(f"Objective KPI '{self.objective_name}' not found in evaluation results")
+                        
+                        evaluated.append((parameters, objective_value))
+                        
+                        # Add to data aggregator
+                        self.data_aggregator.add_direct_result(parameters, kpis)
+                        
+                        if verbose:
+                            print(f"  Result: {self.objective_name} = {objective_value:.6g}")
+                    
+                    except Exception as e:
+                        if verbose:
+                            print(f"  Error evaluating parameters: {e}")
+                        
+                        # Add failed evaluation
+                        all_evaluations.append({
+                            "parameters": parameters,
+                            "kpis": {},
+                            "iteration": iteration,
+                            "error": str(e)
+                        })
+                    
+                    iteration += 1
                 
-                # Add failed evaluation
-                all_evaluations.append({
-                    "parameters": parameters,
-                    "kpis": {},
-                    "iteration": iteration,
-                    "error": str(e)
-                })
-            
-            iteration += 1
+                if evaluated:
+                    self.optimizer.batch_update(
+                        [parameters for parameters, _ in evaluated],
+                        [objective_value for _, objective_value in evaluated],
+                    )
         
         # Get the best result
         best_result = self.data_aggregator.get_best_result(
@@ -479,6 +688,10 @@ class ExperimentResults:
         """Get the KPIs for the best parameters."""
         return self.best_result["kpis"]
     
+    def _results_table(self) -> pd.DataFrame:
+        """Per-iteration results table, empty if there are none."""
+        return self.all_results if self.all_results is not None else pd.DataFrame()
+    
     def to_csv(self, path: str) -> None:
         """
         Save all results to a CSV file.
@@ -486,7 +699,7 @@ class ExperimentResults:
         Args:
             path: Path to save the CSV file
         """
-        self.all_results.to_csv(path, index=False)
+        self._results_table().to_csv(path, index=False)
     
     def to_json(self, path: str) -> None:
         """
@@ -508,18 +721,45 @@ class ExperimentResults:
         with open(path, "w") as f:
             json.dump(results_dict, f, indent=2, cls=NumpyEncoder)
     
-    def save(self, base_path: str) -> None:
+    def to_parquet(self, path: str) -> None:
+        """
+        Save all results to a Parquet file (requires pyarrow).
+        
+        Args:
+            path: Path to save the Parquet file
+        
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Writing Parquet results requires pyarrow. Install it with 'pip install pyarrow'.")
+        
+        self._results_table().to_parquet(path, index=False, compression="zstd")
+    
+    def save(self, base_path: str, formats: Optional[List[str]] = None) -> None:
         """
         Save results to multiple formats.
         
         Args:
             base_path: Base path for saving results
+            formats: Formats for the per-iteration results table, 'csv' and/or
+                'parquet' (default: ['csv']). 'parquet' requires pyarrow and is
+                skipped without it, as in SimulationResults.save. The JSON and
+                YAML summaries are always written.
         """
+        formats = formats or ['csv']
+        
         # Create directory if needed
         os.makedirs(os.path.dirname(base_path) or ".", exist_ok=True)
         
-        # Save to CSV
-        self.to_csv(f"{base_path}.csv")
+        # Save the per-iteration results table
+        if 'csv' in formats:
+            self.to_csv(f"{base_path}.csv")
+        if 'parquet' in formats:
+            if PYARROW_AVAILABLE:
+                self.to_parquet(f"{base_path}.parquet")
+            else:
+                print("pyarrow not installed. Skipping Parquet export.")
         
         # Save to JSON
         self.to_json(f"{base_path}.json")
@@ -14,16 +14,25 @@ AVAILABLE_OPTIMIZERS = {
     "random": RandomSearchOptimizer,
 }
 
+__all__ = [
+    "Optimizer",
+    "GridSearchOptimizer",
+    "RandomSearchOptimizer",
+    "AVAILABLE_OPTIMIZERS",
+]
+
 try:
     from .bayesian import BayesianOptimizer
     AVAILABLE_OPTIMIZERS["bayesian"] = BayesianOptimizer
+    __all__.append("BayesianOptimizer")
 except ImportError:
     # Bayesian optimization requires additional dependencies
     pass
 
-__all__ = [
-    "Optimizer",
-    "GridSearchOptimizer",
-    "RandomSearchOptimizer",
-    "AVAILABLE_OPTIMIZERS",
-]
+try:
+    from .tpe import TPEOptimizer
+    AVAILABLE_OPTIMIZERS["tpe"] = TPEOptimizer
+    __all__.append("TPEOptimizer")
+except ImportError:
+    # TPE optimization requires additional dependencies
+    pass
@@ -63,15 +63,55 @@ class Optimizer(ABC):
         """
         Update the optimizer with a new evaluation result.
         
+        Ownership of ``parameters`` passes to the optimizer, which may keep a
+        reference to it instead of copying. Callers must not mutate the dict
+        afterwards; get_best_parameters() returns a copy.
+        
         Args:
             parameters: Parameter set that was evaluated
             objective_value: Value of the objective function
         """
         self.evaluations.append({
-            "parameters": parameters.copy(),
+            "parameters": parameters,
             "objective_value": objective_value
         })
-    
+
+    def batch_suggest(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Suggest up to n parameter sets that can be evaluated independently.
+
+        The default implementation calls suggest() repeatedly and stops early
+        once the optimizer reports it is finished. Optimizers that can propose
+        several points at once should override this method.
+
+        Args:
+            n: Maximum number of parameter sets to suggest
+
+        Returns:
+            List of parameter dictionaries to evaluate
+        """
+        batch = []
+        for _ in range(n):
+            if self.is_finished():
+                break
+            batch.append(self.suggest())
+        return batch
+
+    def batch_update(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        objective_values: List[float]
+    ) -> None:
+        """
+        Update the optimizer with the results of a batch of evaluations.
+
+        Args:
+            parameter_sets: Parameter sets that were evaluated
+            objective_values: Objective values, in the same order as parameter_sets
+        """
+        for parameters, objective_value in zip(parameter_sets, objective_values):
+            self.update(parameters, objective_value)
+
     def get_best_parameters(self) -> Dict[str, Any]:
         """
         Get the best parameters found so far.
@@ -126,7 +126,31 @@ class BayesianOptimizer(Optimizer):
         
         self.iteration += 1
         return parameters
-    
+
+    def batch_suggest(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Suggest up to n parameter sets in a single call to the surrogate model.
+
+        Args:
+            n: Maximum number of parameter sets to suggest
+
+        Returns:
+            List of parameter dictionaries to evaluate
+        """
+        n = min(n, self.num_iterations - self.iteration)
+        if n <= 0:
+            return []
+        if n == 1:
+            return [self.suggest()]
+
+        points = self.opt.ask(n_points=n)
+        self.iteration += len(points)
+
+        return [
+            {name: val for name, val in zip(self.param_names, x)}
+            for x in points
+        ]
+
     def update(self, parameters: Dict[str, Any], objective_value: float) -> None:
         """
         Update the optimizer with a new evaluation result.
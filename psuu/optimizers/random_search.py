@@ -67,8 +67,11 @@ class RandomSearchOptimizer(Optimizer):
                 min_val, max_val = param_range
                 parameters[param_name] = int(self.rng.randint(min_val, max_val + 1))
             else:
-                # Discrete parameter, choose random value
-                parameters[param_name] = self.rng.choice(param_range)
+                # Discrete parameter, choose random value. Indexing the list
+                # (rather than rng.choice) returns the original Python object
+                # instead of a NumPy scalar, so downstream code never has to
+                # convert it; the random stream is the same as rng.choice's.
+                parameters[param_name] = param_range[self.rng.randint(len(param_range))]
         
         self.iteration += 1
         return parameters
@@ -0,0 +1,182 @@
+"""
+TPE Optimizer Module
+
+This module implements Tree-structured Parzen Estimator (TPE) optimization.
+It requires optuna to be installed.
+"""
+
+from typing import Dict, Any, List, Tuple, Optional, Union
+import numpy as np
+from .base import Optimizer
+
+try:
+    import optuna
+    from optuna.distributions import (
+        CategoricalDistribution,
+        FloatDistribution,
+        IntDistribution,
+    )
+    OPTUNA_AVAILABLE = True
+except ImportError:
+    OPTUNA_AVAILABLE = False
+
+
+class TPEOptimizer(Optimizer):
+    """
+    Tree-structured Parzen Estimator optimizer using optuna.
+
+    TPE models good and bad regions of the parameter space from past
+    evaluations and samples where the ratio favours good results. Proposing a
+    point costs well under a millisecond, so it suits expensive simulations
+    where the goal is to need fewer real evaluations.
+    """
+
+    def __init__(
+        self,
+        parameter_space: Dict[str, Union[List[Any], Tuple[float, float]]],
+        objective_name: str,
+        maximize: bool = True,
+        num_iterations: int = 50,
+        n_initial_points: int = 10,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the TPE optimizer.
+
+        Args:
+            parameter_space: Dictionary mapping parameter names to their possible values
+                For continuous parameters, provide a tuple of (min, max)
+                For discrete parameters, provide a list of possible values
+            objective_name: Name of the KPI to optimize
+            maximize: Whether to maximize (True) or minimize (False) the objective
+            num_iterations: Maximum number of iterations
+            n_initial_points: Number of initial points to sample randomly
+            seed: Random seed for reproducibility
+
+        Raises:
+            ImportError: If optuna is not installed
+        """
+        if not OPTUNA_AVAILABLE:
+            raise ImportError(
+                "TPE optimization requires optuna. "
+                "Install it with 'pip install optuna'."
+            )
+
+        super().__init__(parameter_space, objective_name, maximize)
+        self.num_iterations = num_iterations
+        self.n_initial_points = n_initial_points
+        self.seed = seed
+        self.iteration = 0
+
+        # Convert parameter space to optuna distributions
+        self.distributions, self.param_names = self._convert_param_space()
+
+        # Per-trial log lines from optuna would drown out PSUU's own progress output
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+        self.study = optuna.create_study(
+            direction="maximize" if maximize else "minimize",
+            sampler=optuna.samplers.TPESampler(
+                n_startup_trials=n_initial_points,
+                seed=seed,
+            ),
+        )
+
+        # Trials that have been suggested but not yet reported back, oldest
+        # first per parameter set (TPE may suggest the same values again
+        # before the first result arrives)
+        self._pending_trials: Dict[Tuple, List[Any]] = {}
+
+    def _convert_param_space(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Convert the parameter space to optuna distributions.
+
+        Returns:
+            Tuple of (dict of optuna distributions, list of parameter names)
+        """
+        distributions = {}
+        param_names = []
+
+        for param_name, param_range in self.parameter_space.items():
+            param_names.append(param_name)
+
+            if isinstance(param_range, tuple) and len(param_range) == 2:
+                # Continuous parameter (integer bounds give an integer parameter)
+                min_val, max_val = param_range
+                if all(isinstance(v, (int, np.integer)) for v in param_range):
+                    distributions[param_name] = IntDistribution(int(min_val), int(max_val))
+                else:
+                    distributions[param_name] = FloatDistribution(float(min_val), float(max_val))
+            else:
+                # Discrete parameter
+                distributions[param_name] = CategoricalDistribution(list(param_range))
+
+        return distributions, param_names
+
+    def _trial_key(self, parameters: Dict[str, Any]) -> Tuple:
+        """
+        Build the key used to match reported results to pending trials.
+
+        Args:
+            parameters: Parameter set
+
+        Returns:
+            Tuple of parameter values in param_names order
+        """
+        return tuple(parameters[name] for name in self.param_names)
+
+    def suggest(self) -> Dict[str, Any]:
+        """
+        Suggest the next set of parameters to evaluate.
+
+        Returns:
+            Dictionary of parameter values to evaluate next
+        """
+        if self.is_finished():
+            if self.evaluations:
+                return self.get_best_parameters()
+            raise StopIteration("TPE optimization complete")
+
+        trial = self.study.ask(fixed_distributions=self.distributions)
+        parameters = {name: trial.params[name] for name in self.param_names}
+        self._pending_trials.setdefault(self._trial_key(parameters), []).append(trial)
+
+        self.iteration += 1
+        return parameters
+
+    def update(self, parameters: Dict[str, Any], objective_value: float) -> None:
+        """
+        Update the optimizer with a new evaluation result.
+
+        Args:
+            parameters: Parameter set that was evaluated
+            objective_value: Value of the objective function
+        """
+        # Call parent method to store the evaluation
+        super().update(parameters, objective_value)
+
+        key = self._trial_key(parameters)
+        pending = self._pending_trials.get(key)
+        if pending:
+            trial = pending.pop(0)
+            if not pending:
+                del self._pending_trials[key]
+            self.study.tell(trial, float(objective_value))
+        else:
+            # Result for a point this optimizer did not suggest
+            self.study.add_trial(
+                optuna.trial.create_trial(
+                    params={name: parameters[name] for name in self.param_names},
+                    distributions=self.distributions,
+                    value=float(objective_value),
+                )
+            )
+
+    def is_finished(self) -> bool:
+        """
+        Check if the TPE optimization is complete.
+
+        Returns:
+            True if maximum iterations reached, False otherwise
+        """
+        return self.iteration >= self.num_iterations
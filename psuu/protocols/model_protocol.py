@@ -31,6 +31,28 @@ class ModelProtocol(ABC):
         """
         pass
     
+    def run_batch(
+        self,
+        param_list: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[Union['SimulationResults', pd.DataFrame]]:
+        """
+        Run simulations for several parameter sets.
+        
+        The default implementation calls run() for each parameter set. Models
+        that can evaluate many parameter sets in one call (e.g. a single
+        cadCAD experiment with one config per set) should override this to
+        pay their setup cost once per batch.
+        
+        Args:
+            param_list: List of parameter dictionaries
+            **kwargs: Additional run-specific options (timesteps, samples, etc.)
+            
+        Returns:
+            List of simulation results, in the same order as param_list
+        """
+        return [self.run(params, **kwargs) for params in param_list]
+    
     @abstractmethod
     def get_parameter_space(self) -> Dict[str, Union[List, Tuple, Dict]]:
         """
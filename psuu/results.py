@@ -7,11 +7,16 @@ This module provides standardized containers for simulation results.
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
 import numpy as np
+import importlib.util
 import json
 import os
 import pickle
 import time
 
+# pyarrow is imported only by the Parquet and Feather paths, so importing
+# psuu does not pay for it
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 # Custom JSON encoder to handle NumPy types
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -76,6 +81,10 @@ class SimulationResults:
         if 'timestamp' not in self.metadata:
             self.metadata['timestamp'] = time.time()
     
+    def _has_time_series(self) -> bool:
+        """Whether there is time series data (models may leave it unset)."""
+        return self.time_series_data is not None and not self.time_series_data.empty
+    
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert to DataFrame format for PSUU.
@@ -83,7 +92,7 @@ class SimulationResults:
         Returns:
             DataFrame containing simulation results and/or KPIs
         """
-        if self.time_series_data.empty and self.kpis:
+        if not self._has_time_series() and self.kpis:
             # Create a single-row DataFrame with KPI values
             df = pd.DataFrame([self.kpis])
             
@@ -93,7 +102,7 @@ class SimulationResults:
                 
             return df
             
-        elif not self.time_series_data.empty and self.kpis:
+        elif self._has_time_series() and self.kpis:
             # Add KPIs as columns to the time series data for the last timestep
             last_row = self.time_series_data.iloc[[-1]].copy()
             for kpi_name, kpi_value in self.kpis.items():
@@ -106,8 +115,10 @@ class SimulationResults:
                     self.time_series_data[param_col] = param_value
                     
             return pd.concat([self.time_series_data, last_row]).reset_index(drop=True)
-        else:
+        elif self._has_time_series():
             return self.time_series_data
+        else:
+            return pd.DataFrame()
     
     def get_kpi(self, name: str, default: Any = None) -> Any:
         """
@@ -154,7 +165,7 @@ class SimulationResults:
             "parameters": convert_numpy_types(self.parameters),
         }
         
-        if not self.time_series_data.empty:
+        if self._has_time_series():
             # Add basic statistics for numeric columns
             numeric_cols = self.time_series_data.select_dtypes(include=[np.number]).columns
             stats = {}
@@ -181,7 +192,9 @@ class SimulationResults:
         
         Args:
             filepath: Base filepath without extension
-            formats: List of formats to save (default: ['csv', 'json'])
+            formats: List of formats to save (default: ['csv', 'json']). 'parquet'
+                and 'feather' write the time series and, in the file's schema
+                metadata, the KPIs, parameters and metadata (require pyarrow)
             
         Returns:
             Dictionary mapping format to saved filepath
@@ -193,7 +206,7 @@ class SimulationResults:
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
         
         for fmt in formats:
-            if fmt.lower() == 'csv' and not self.time_series_data.empty:
+            if fmt.lower() == 'csv' and self._has_time_series():
                 csv_path = f"{filepath}.csv"
                 self.time_series_data.to_csv(csv_path, index=False)
                 saved_files['csv'] = csv_path
@@ -207,7 +220,7 @@ class SimulationResults:
                 }
                 
                 # Add time series data if available
-                if not self.time_series_data.empty:
+                if self._has_time_series():
                     # Convert to records format for JSON
                     json_data["time_series"] = convert_numpy_types(
                         self.time_series_data.to_dict(orient='records')
@@ -218,6 +231,26 @@ class SimulationResults:
                 
                 saved_files['json'] = json_path
             
+            elif fmt.lower() == 'parquet':
+                if not PYARROW_AVAILABLE:
+                    print("pyarrow not installed. Skipping Parquet export.")
+                    continue
+                
+                import pyarrow.parquet as pq
+                parquet_path = f"{filepath}.parquet"
+                pq.write_table(self._to_arrow_table(), parquet_path, compression="zstd")
+                saved_files['parquet'] = parquet_path
+            
+            elif fmt.lower() == 'feather':
+                if not PYARROW_AVAILABLE:
+                    print("pyarrow not installed. Skipping Feather export.")
+                    continue
+                
+                import pyarrow.feather as feather
+                feather_path = f"{filepath}.feather"
+                feather.write_feather(self._to_arrow_table(), feather_path, compression="zstd")
+                saved_files['feather'] = feather_path
+            
             elif fmt.lower() == 'pickle':
                 pickle_path = f"{filepath}.pkl"
                 with open(pickle_path, 'wb') as f:
@@ -245,6 +278,50 @@ class SimulationResults:
         
         return saved_files
     
+    def _to_arrow_table(self) -> 'pa.Table':
+        """
+        Convert the results to an Arrow table for Parquet/Feather export.
+        
+        KPIs, parameters and metadata are stored as JSON under the b"psuu"
+        key of the table's schema metadata.
+        
+        Returns:
+            Arrow table with the time series data
+        """
+        import pyarrow as pa
+        
+        time_series = self.time_series_data if self.time_series_data is not None else pd.DataFrame()
+        table = pa.Table.from_pandas(time_series, preserve_index=False)
+        summary = json.dumps({
+            "metadata": self.metadata,
+            "kpis": self.kpis,
+            "parameters": self.parameters,
+        }, cls=NumpyEncoder)
+        return table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b"psuu": summary.encode(),
+        })
+    
+    @classmethod
+    def _from_arrow_table(cls, table: 'pa.Table') -> 'SimulationResults':
+        """
+        Create a SimulationResults instance from a table made by _to_arrow_table.
+        
+        Args:
+            table: Arrow table read from a Parquet or Feather file
+            
+        Returns:
+            SimulationResults instance
+        """
+        summary = json.loads((table.schema.metadata or {}).get(b"psuu", b"{}"))
+        
+        return cls(
+            time_series_data=table.to_pandas(),
+            kpis=summary.get("kpis", {}),
+            metadata=summary.get("metadata", {}),
+            parameters=summary.get("parameters", {})
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the results to a dictionary.
@@ -259,7 +336,7 @@ class SimulationResults:
         }
         
         # Add time series data if available
-        if not self.time_series_data.empty:
+        if self._has_time_series():
             # Convert to records format
             result_dict["time_series"] = convert_numpy_types(
                 self.time_series_data.to_dict(orient='records')
@@ -306,6 +383,46 @@ class SimulationResults:
             parameters=parameters
         )
     
+    @classmethod
+    def from_parquet(cls, path: str) -> 'SimulationResults':
+        """
+        Load a SimulationResults instance saved with the 'parquet' format.
+        
+        Args:
+            path: Path to the Parquet file
+            
+        Returns:
+            SimulationResults instance
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Reading Parquet results requires pyarrow. Install it with 'pip install pyarrow'.")
+        
+        import pyarrow.parquet as pq
+        return cls._from_arrow_table(pq.read_table(path))
+    
+    @classmethod
+    def from_feather(cls, path: str) -> 'SimulationResults':
+        """
+        Load a SimulationResults instance saved with the 'feather' format.
+        
+        Args:
+            path: Path to the Feather file
+            
+        Returns:
+            SimulationResults instance
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Reading Feather results requires pyarrow. Install it with 'pip install pyarrow'.")
+        
+        import pyarrow.feather as feather
+        return cls._from_arrow_table(feather.read_table(path))
+    
     @classmethod
     def from_json(cls, json_str: str) -> 'SimulationResults':
         """
@@ -5,13 +5,119 @@ This module provides the interface for running external simulation models via CL
 and collecting their outputs.
 """
 
+import contextlib
+import importlib.util
+import io
+import shlex
+import string
 import subprocess
-from typing import Dict, Optional, Union, List, Any
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Union, List, Any, Callable, IO, Iterator, Tuple
 import os
 import json
 import pandas as pd
 
+# pyarrow is only looked up here; pandas imports it on the first read that
+# uses engine="pyarrow", so importing the connector does not pay for it
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+# Specialized formatters for the common parameter formats. str.format has to
+# parse the format string on every call; these are plain f-strings. They are
+# module-level functions (not closures) so connectors remain picklable.
+
+def _format_space(name: str, value: Any) -> str:
+    return f"--{name} {value}"
+
+
+def _format_equals(name: str, value: Any) -> str:
+    return f"--{name}={value}"
+
+
+def _argv_space(name: str, value: Any) -> Tuple[str, ...]:
+    return (f"--{name}", f"{value}")
+
+
+def _argv_equals(name: str, value: Any) -> Tuple[str, ...]:
+    return (f"--{name}={value}",)
+
+
+# Characters that only mean something to a shell (pipes, redirection,
+# command chaining, expansion and globbing)
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`*?[]{}~\n")
+
+
+def _needs_shell(command_argv: List[str]) -> bool:
+    """
+    Check whether a tokenised command relies on shell features.
+    
+    Args:
+        command_argv: Command split with shlex.split
+        
+    Returns:
+        True if the command uses shell syntax or starts with environment
+        variable assignments (``NAME=value command ...``)
+    """
+    if command_argv and "=" in command_argv[0] and not command_argv[0].startswith("-"):
+        return True
+    return any(char in _SHELL_METACHARACTERS for token in command_argv for char in token)
+
+
+_PARAM_FORMATTERS = {
+    "--{name} {value}": (_format_space, _argv_space),
+    "--{name}={value}": (_format_equals, _argv_equals),
+}
+
+
+def _compile_param_format(param_format: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """
+    Compile any other parameter format into a printf-style template.
+    
+    The format string is parsed once here; rendering a parameter is then a
+    single C-level % operation instead of a str.format call that re-parses it.
+    
+    Args:
+        param_format: Format string using {name} and {value} fields
+        
+    Returns:
+        Tuple of (template, field names in order), or None if the format uses
+        conversions, format specs or other fields (rendered with str.format)
+    """
+    template = []
+    fields = []
+    try:
+        parsed = list(string.Formatter().parse(param_format))
+    except ValueError:
+        return None
+    
+    for literal, field, format_spec, conversion in parsed:
+        template.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if format_spec or conversion or field not in ("name", "value"):
+            return None
+        template.append("%s")
+        fields.append(field)
+    
+    if not fields:
+        # Plain literal, e.g. a "-p" token: nothing to substitute
+        return "".join(literal for literal, _, _, _ in parsed), ()
+    return "".join(template), tuple(fields)
+
+
+def _render_param(compiled: Tuple[str, Tuple[str, ...]], name: str, value: Any) -> str:
+    """Render one parameter with a template from _compile_param_format."""
+    template, fields = compiled
+    if not fields:
+        return template
+    if fields == ("name", "value"):
+        return template % (name, value)
+    if fields == ("value",):
+        return template % (value,)
+    if fields == ("name",):
+        return template % (name,)
+    return template % tuple(name if field == "name" else value for field in fields)
+
 
 class SimulationConnector:
     """
@@ -35,7 +141,7 @@ class SimulationConnector:
         Args:
             command: Base command to execute the simulation
             param_format: Format string for parameter arguments
-            output_format: Format of the simulation output ('csv' or 'json')
+            output_format: Format of the simulation output ('csv', 'json' or 'feather')
             output_file: Filename where simulation writes its output (if None, uses stdout)
             working_dir: Working directory for the simulation command
         """
@@ -44,6 +150,19 @@ class SimulationConnector:
         self.output_format = output_format
         self.output_file = output_file
         self.working_dir = working_dir
+        
+        # Tokenise the command and parameter format once; only values vary per run
+        self._command_argv = shlex.split(command)
+        # Plain commands are executed directly; going through /bin/sh costs an
+        # extra fork and exec per run
+        self._use_shell = _needs_shell(self._command_argv)
+        self._param_tokens = shlex.split(param_format)
+        self._format_param, self._format_param_argv = _PARAM_FORMATTERS.get(
+            param_format, (None, None)
+        )
+        self._compiled_format = _compile_param_format(param_format)
+        compiled_tokens = [_compile_param_format(token) for token in self._param_tokens]
+        self._compiled_tokens = None if None in compiled_tokens else compiled_tokens
     
     def _build_command(self, parameters: Dict[str, Any]) -> str:
         """
@@ -55,14 +174,48 @@ class SimulationConnector:
         Returns:
             Full command string with parameters
         """
-        param_strings = []
-        
-        for name, value in parameters.items():
-            param_str = self.param_format.format(name=name, value=value)
-            param_strings.append(param_str)
+        if self._format_param is not None:
+            param_strings = [self._format_param(name, value) for name, value in parameters.items()]
+        elif self._compiled_format is not None:
+            param_strings = [
+                _render_param(self._compiled_format, name, value)
+                for name, value in parameters.items()
+            ]
+        else:
+            param_strings = [
+                self.param_format.format(name=name, value=value)
+                for name, value in parameters.items()
+            ]
         
         return f"{self.command} {' '.join(param_strings)}"
     
+    def _build_argv(self, parameters: Dict[str, Any]) -> List[str]:
+        """
+        Build the full command as an argument list suitable for shell=False.
+        
+        The parameter format is split into tokens before values are substituted,
+        so values containing spaces stay a single argument.
+        
+        Args:
+            parameters: Dictionary of parameter names and values
+            
+        Returns:
+            List of command-line arguments
+        """
+        argv = list(self._command_argv)
+        
+        if self._format_param_argv is not None:
+            for name, value in parameters.items():
+                argv.extend(self._format_param_argv(name, value))
+        elif self._compiled_tokens is not None:
+            for name, value in parameters.items():
+                argv.extend(_render_param(token, name, value) for token in self._compiled_tokens)
+        else:
+            for name, value in parameters.items():
+                argv.extend(token.format(name=name, value=value) for token in self._param_tokens)
+        
+        return argv
+    
     def run_simulation(self, parameters: Dict[str, Any]) -> pd.DataFrame:
         """
         Run the simulation with the given parameters and return results.
@@ -76,13 +229,16 @@ class SimulationConnector:
         Raises:
             subprocess.CalledProcessError: If the simulation command fails
         """
-        cmd = self._build_command(parameters)
+        if self._use_shell:
+            cmd = self._build_command(parameters)
+        else:
+            cmd = self._build_argv(parameters)
         
         if self.output_file:
             # Run simulation, writing to specified output file
             subprocess.run(
                 cmd, 
-                shell=True, 
+                shell=self._use_shell, 
                 check=True,
                 cwd=self.working_dir
             )
@@ -91,33 +247,52 @@ class SimulationConnector:
             # Run simulation, capturing output directly
             result = subprocess.run(
                 cmd,
-                shell=True,
+                shell=self._use_shell,
                 check=True,
                 capture_output=True,
-                text=True,
                 cwd=self.working_dir
             )
             
-            # Save output to temporary file
-            with tempfile.NamedTemporaryFile(
-                mode='w+', 
-                suffix=f'.{self.output_format}',
-                delete=False
-            ) as temp_file:
-                temp_file.write(result.stdout)
-                temp_file_path = temp_file.name
-            
-            try:
-                return self._load_output(temp_file_path)
-            finally:
-                os.unlink(temp_file_path)
-    
-    def _load_output(self, file_path: str) -> pd.DataFrame:
+            # Parse the captured bytes in memory
+            stdout = result.stdout
+            if isinstance(stdout, str):
+                stdout = stdout.encode()
+            return self._load_output(io.BytesIO(stdout))
+
+    def run_simulation_batch(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[pd.DataFrame, Exception]]:
         """
-        Load simulation output from file.
+        Run several independent simulations concurrently.
+
+        Each parameter set is passed to run_simulation in a separate worker
+        process, so the connector must be picklable.
+
+        Args:
+            parameter_sets: List of parameter dictionaries to simulate
+            max_workers: Maximum number of worker processes (None for os.cpu_count())
+            return_exceptions: If True, failed runs are returned as exception
+                instances in place of their DataFrame instead of being raised
+
+        Returns:
+            List of DataFrames, in the same order as parameter_sets
+        """
+        return run_in_process_pool(
+            self.run_simulation, parameter_sets, max_workers, return_exceptions
+        )
+
+    def _load_output(self, file_path: Union[str, IO[bytes]]) -> pd.DataFrame:
+        """
+        Load simulation output from a file or an in-memory buffer.
+        
+        CSV output is parsed with the pyarrow engine when pyarrow is installed.
+        Feather output (Arrow IPC) also requires pyarrow.
         
         Args:
-            file_path: Path to the output file
+            file_path: Path to the output file, or a binary buffer with its contents
             
         Returns:
             DataFrame containing simulation results
@@ -125,9 +300,108 @@ class SimulationConnector:
         Raises:
             ValueError: If output format is not supported
         """
-        if self.output_format.lower() == 'csv':
+        output_format = self.output_format.lower()
+        if output_format == 'csv':
+            if PYARROW_AVAILABLE:
+                return pd.read_csv(file_path, engine='pyarrow')
             return pd.read_csv(file_path)
-        elif self.output_format.lower() == 'json':
+        elif output_format == 'json':
             return pd.read_json(file_path)
+        elif output_format in ('feather', 'arrow'):
+            return pd.read_feather(file_path)
         else:
             raise ValueError(f"Unsupported output format: {self.output_format}")
+
+
+# Pool shared by the run_in_process_pool calls made inside a process_pool()
+# block
+_shared_executor: Optional[ProcessPoolExecutor] = None
+
+
+@contextlib.contextmanager
+def process_pool(max_workers: Optional[int] = None) -> Iterator[None]:
+    """
+    Share one pool of worker processes between run_in_process_pool calls.
+
+    Starting worker processes (and importing the simulation code in each of
+    them) costs far more than most simulations, so a caller evaluating many
+    batches, such as an experiment run, keeps one pool for all of them.
+    Nested blocks reuse the outer pool, and no pool is started for a single
+    worker, since such batches run in the current process.
+
+    Args:
+        max_workers: Maximum number of worker processes (None for os.cpu_count())
+    """
+    global _shared_executor
+
+    if _shared_executor is not None or (max_workers is not None and max_workers <= 1):
+        yield
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+    _shared_executor = executor
+    try:
+        yield
+    finally:
+        _shared_executor = None
+        executor.shutdown()
+
+
+def run_in_process_pool(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Apply a function to each item using a pool of worker processes.
+
+    Batches of a single item, or a pool limited to one worker, are run in the
+    current process to avoid the cost of starting workers. Inside a
+    process_pool() block the shared pool is used, and its size applies in
+    place of max_workers.
+
+    Args:
+        func: Picklable callable to apply to each item
+        items: Items to process
+        max_workers: Maximum number of worker processes (None for os.cpu_count())
+        return_exceptions: If True, exceptions raised by func are returned in
+            place of the result instead of being raised
+
+    Returns:
+        List of results, in the same order as items
+    """
+    results: List[Any] = []
+
+    if len(items) <= 1 or (max_workers is not None and max_workers <= 1):
+        for item in items:
+            try:
+                results.append(func(item))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    executor = _shared_executor
+    if executor is None:
+        executor = ProcessPoolExecutor(
+            max_workers=min(len(items), max_workers or os.cpu_count() or 1)
+        )
+    try:
+        futures = [executor.submit(func, item) for item in items]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    # A shared pool outlives this call, so drop what is queued
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(e)
+    finally:
+        if executor is not _shared_executor:
+            executor.shutdown()
+
+    return results
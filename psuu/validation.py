@@ -13,7 +13,7 @@ import pandas as pd
 import numpy as np
 
 from .exceptions import ParameterValidationError, ModelExecutionError
-from .simulation_connector import SimulationConnector
+from .simulation_connector import SimulationConnector, run_in_process_pool
 from .custom_connectors.cadcad_connector import CadcadSimulationConnector
 
 
@@ -282,6 +282,68 @@ class RobustCadcadConnector(CadcadSimulationConnector):
         else:
             return self.generate_fallback_result()
     
+    def run_simulation_batch(
+        self,
+        parameter_sets: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[pd.DataFrame, Exception]]:
+        """
+        Run several simulations concurrently with robust error handling.
+        
+        Uses the process pool so every run goes through the validation,
+        retry and fallback logic of run_simulation. Errors logged by the
+        worker processes are added to error_log in the order of
+        parameter_sets.
+        
+        Args:
+            parameter_sets: List of parameter dictionaries to simulate
+            max_workers: Maximum number of worker processes (None for os.cpu_count())
+            return_exceptions: If True, failed runs are returned as exception
+                instances in place of their result instead of being raised
+            
+        Returns:
+            List of results, in the same order as parameter_sets
+        """
+        outcomes = run_in_process_pool(self._run_logged, parameter_sets, max_workers)
+        
+        results: List[Union[pd.DataFrame, Exception]] = []
+        first_error = None
+        for result, error_entries in outcomes:
+            self.error_log.extend(error_entries)
+            if isinstance(result, Exception) and first_error is None:
+                first_error = result
+            results.append(result)
+        
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return results
+    
+    def _run_logged(
+        self, parameters: Dict[str, Any]
+    ) -> Tuple[Union[pd.DataFrame, Exception], List[Dict[str, Any]]]:
+        """
+        Run a simulation and hand back the errors it logged.
+        
+        Runs in a worker process, on a copy of the connector, so the log
+        entries are returned for the caller to merge rather than kept.
+        
+        Args:
+            parameters: Dictionary of parameter values
+        
+        Returns:
+            Tuple of (DataFrame, or the exception raised by run_simulation,
+            error log entries added by the run)
+        """
+        start = len(self.error_log)
+        try:
+            result = self.run_simulation(parameters)
+        except Exception as e:
+            result = e
+        error_entries = self.error_log[start:]
+        del self.error_log[start:]
+        return result, error_entries
+    
     def _add_jitter(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add small random variations to numeric parameters.
@@ -65,7 +65,8 @@ def main():
     experiment.simulation_connector = CadcadSimulationConnector(
         command="python -m model",
         param_format="--{name} {value}",
-        working_dir="cadcad-sandbox"
+        working_dir="cadcad-sandbox",
+        return_dataframe=False,  # the KPI functions below read a KpiResult
     )
     
     # Add KPIs
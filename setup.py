@@ -25,6 +25,7 @@ setup(
     url="https://github.com/yourusername/psuu",
     packages=find_packages(),
     include_package_data=True,
+    package_data={"psuu": ["templates/*.tmpl"]},
     install_requires=[
         "numpy>=1.20.0",
         "pandas>=1.3.0",
@@ -43,6 +44,9 @@ setup(
         "bayesian": [
             "scikit-optimize>=0.9.0",
         ],
+        "tpe": [
+            "optuna>=3.0.0",
+        ],
         "visualization": [
             "matplotlib>=3.5.0",
             "seaborn>=0.11.0",
@@ -53,7 +57,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "psuu=psuu.cli:main",
+            "psuu=psuu.__main__:main",
         ],
     },
     classifiers=[
@@ -0,0 +1,120 @@
+"""
+Tests for the cadCAD connector.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from psuu.custom_connectors.cadcad_connector import (
+    CadcadSimulationConnector,
+    KpiResult,
+    calculate_r0,
+    epidemic_duration,
+    peak_infections,
+    total_infections,
+)
+from psuu.experiment import PsuuExperiment
+
+# Writes the KPI summary to the path given after --output-path, with the
+# peak equal to the --beta parameter
+SIMULATION = """
+import json, os, sys
+args = sys.argv[1:]
+beta = float(args[args.index("--beta") + 1])
+path = args[args.index("--output-path") + 1]
+os.makedirs(os.path.dirname(path), exist_ok=True)
+kpis = {"peak_infections": beta, "total_infections": 2.0, "epidemic_duration": 3.0, "r0": 4.0}
+with open(path, "w") as f:
+    json.dump({name: {"mean": value} for name, value in kpis.items()}, f)
+"""
+
+
+@pytest.fixture
+def simulation_script(tmp_path):
+    path = tmp_path / "simulation.py"
+    path.write_text(SIMULATION)
+    return path
+
+
+@pytest.mark.parametrize("prefix", ["", "PSUU_TEST=1 "])
+def test_run_simulation(tmp_path, simulation_script, prefix):
+    """Test running a simulation directly and through the shell."""
+    connector = CadcadSimulationConnector(
+        command=f'{prefix}"{sys.executable}" "{simulation_script}"',
+        working_dir=str(tmp_path),
+        output_path_arg="--output-path",
+        return_dataframe=False,
+    )
+    assert connector._use_shell == bool(prefix)
+
+    result = connector.run_simulation({"beta": np.float64(0.25)})
+
+    assert result == KpiResult(peak=0.25, total=2.0, duration=3.0, r0=4.0)
+
+
+@pytest.mark.parametrize("prefix", ["", "PSUU_TEST=1 "])
+def test_run_simulation_batch(tmp_path, simulation_script, prefix):
+    """Test running a batch of simulations directly and through the shell."""
+    connector = CadcadSimulationConnector(
+        command=f'{prefix}"{sys.executable}" "{simulation_script}"',
+        working_dir=str(tmp_path),
+        output_path_arg="--output-path",
+        return_dataframe=False,
+    )
+
+    results = connector.run_simulation_batch([{"beta": 0.1}, {"beta": 0.2}, {"beta": 0.3}])
+
+    assert [result.peak for result in results] == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.parametrize("as_dataframe", [False, True])
+def test_kpi_functions(as_dataframe):
+    """Test that the KPI functions read a KpiResult and its DataFrame alike."""
+    result = KpiResult(peak=0.25, total=2.0, duration=3.0, r0=4.0)
+    if as_dataframe:
+        result = result.to_dataframe()
+
+    assert peak_infections(result) == 0.25
+    assert total_infections(result) == 2.0
+    assert epidemic_duration(result) == 3.0
+    assert calculate_r0(result) == 4.0
+
+
+def test_experiment_kpis_from_kpi_result(tmp_path, simulation_script):
+    """Test that function and column KPIs are computed from a KpiResult."""
+    experiment = PsuuExperiment(simulation_command="unused")
+    experiment.simulation_connector = CadcadSimulationConnector(
+        command=f'"{sys.executable}" "{simulation_script}"',
+        working_dir=str(tmp_path),
+        output_path_arg="--output-path",
+        return_dataframe=False,
+    )
+    experiment.add_kpi("peak", function=peak_infections)
+    experiment.add_kpi("total", column="R", operation="max")
+    experiment.set_parameter_space({"beta": (0.1, 0.9)})
+    experiment.set_optimizer(method="random", objective_name="peak", num_iterations=2, seed=1)
+
+    results = experiment.run(verbose=False)
+
+    for evaluation in results.all_evaluations:
+        assert evaluation["kpis"]["peak"] == pytest.approx(evaluation["parameters"]["beta"])
+        assert evaluation["kpis"]["total"] == 2.0
+
+
+def test_run_simulation_returns_dataframe_by_default(tmp_path, simulation_script):
+    """Test that the connector returns a single-row DataFrame unless asked for a KpiResult."""
+    connector = CadcadSimulationConnector(
+        command=f'"{sys.executable}" "{simulation_script}"',
+        working_dir=str(tmp_path),
+        output_path_arg="--output-path",
+    )
+
+    result = connector.run_simulation({"beta": 0.25})
+
+    assert isinstance(result, pd.DataFrame)
+    assert result.to_dict(orient="records") == [
+        {"timestep": 0, "I": 0.25, "S": 998.0, "R": 2.0, "duration": 3.0, "r0": 4.0}
+    ]
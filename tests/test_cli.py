@@ -0,0 +1,146 @@
+"""
+Tests for the CLI module.
+"""
+
+import inspect
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from psuu import cli as cli_module
+from psuu.cli import cli
+
+
+def test_commands_registered_once():
+    """Test that every command is defined exactly once."""
+    # Click keys commands by name, so a second definition silently replaces
+    # the first; count the registrations in the module source instead
+    source = inspect.getsource(cli_module)
+    registrations = source.count("@cli.command(")
+
+    assert len(cli.commands) == len(set(cli.commands))
+    assert registrations == len(cli.commands)
+    assert source.count("def cli(") == 1
+
+
+def test_config_cached_across_writes(tmp_path, monkeypatch):
+    """Test that a written configuration is not parsed again on the next load."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(cli, ["init"]).exit_code == 0
+
+    calls = []
+    load = yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    for name in ("beta", "gamma"):
+        result = runner.invoke(cli, ["add-param", "--name", name, "--range", "0", "1"])
+        assert result.exit_code == 0
+
+    assert len(calls) == 1
+
+    with open(tmp_path / "psuu_config.yaml") as f:
+        cfg = load(f, Loader=yaml.SafeLoader)
+    assert cfg["parameters"] == {"beta": [0.0, 1.0], "gamma": [0.0, 1.0]}
+    assert cli_module._load_cfg("psuu_config.yaml") == cfg
+    assert list(cli_module._load_cfg("psuu_config.yaml")) == list(cfg)
+
+
+def test_run_reports_missing_settings(tmp_path, monkeypatch):
+    """Test that run names the first setting missing from the configuration."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(cli, ["init"]).exit_code == 0
+
+    result = runner.invoke(cli, ["run"])
+    assert result.exit_code == 1
+    assert "No parameters defined" in result.output
+
+    runner.invoke(cli, ["add-param", "--name", "beta", "--range", "0", "1"])
+    runner.invoke(cli, ["add-kpi", "--name", "peak", "--column", "I", "--operation", "max"])
+    result = runner.invoke(cli, ["run"])
+    assert result.exit_code == 1
+    assert "No objective KPI set" in result.output
+
+
+WANTED = [("parameters",), ("kpis",), ("optimizer", "objective")]
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Block style, all set
+    ("parameters:\n  beta: [0, 1]\nkpis:\n  peak: {column: I}\noptimizer:\n  objective: peak\n",
+     {("parameters",): True, ("kpis",): True, ("optimizer", "objective"): True}),
+    # Empty collections and null scalars are unset
+    ("parameters: {}\nkpis: []\noptimizer:\n  objective: ~\n",
+     {("parameters",): False, ("kpis",): False, ("optimizer", "objective"): False}),
+    ("parameters:\nkpis: null\noptimizer: {objective: ''}\n",
+     {("parameters",): False, ("kpis",): False, ("optimizer", "objective"): False}),
+    # A quoted "null" is a string, so it is set
+    ("optimizer: {objective: 'null'}\n", {("optimizer", "objective"): True}),
+    # Missing keys, including a same-named key under another section
+    ("simulation:\n  objective: peak\n  kpis: {a: 1}\noptimizer:\n  method: random\n", {}),
+    # Flow style throughout
+    ("{parameters: {beta: [0, 1]}, kpis: {}, optimizer: {objective: peak}}\n",
+     {("parameters",): True, ("kpis",): False, ("optimizer", "objective"): True}),
+    # Anchors and aliases
+    ("defaults: &params {beta: [0, 1]}\nparameters: *params\noptimizer:\n  objective: &obj peak\nkpis: {peak: *obj}\n",
+     {("parameters",): True, ("kpis",): True, ("optimizer", "objective"): True}),
+    # Keys inside sequences are not run requirements
+    ("lists:\n  - {objective: x}\n  - [parameters]\noptimizer:\n  objective: peak\n",
+     {("optimizer", "objective"): True}),
+])
+def test_peek_cfg(tmp_path, text, expected):
+    """Test which run requirements the event-stream check reports as set."""
+    path = tmp_path / "psuu_config.yaml"
+    path.write_text(text)
+
+    assert cli_module._peek_cfg(str(path), WANTED) == expected
+
+    # Agrees with checking the fully loaded configuration
+    cfg = yaml.safe_load(text)
+    for key_path, is_set in expected.items():
+        value = cfg
+        for key in key_path:
+            value = value[key]
+        assert bool(value) == is_set
+
+
+def test_tpe_settings_reach_optimizer(tmp_path, monkeypatch):
+    """Test that set-optimizer stores the TPE settings and run passes them on."""
+    pytest.importorskip("optuna")
+    from psuu.experiment import PsuuExperiment
+    from psuu.optimizers.tpe import TPEOptimizer
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    runner.invoke(cli, ["init"])
+    runner.invoke(cli, ["add-param", "--name", "beta", "--range", "0", "1"])
+    runner.invoke(cli, ["add-kpi", "--name", "peak", "--column", "I", "--operation", "max"])
+    result = runner.invoke(cli, ["set-optimizer", "-m", "tpe", "-o", "peak", "-i", "7",
+                                 "--n-initial-points", "2", "--seed", "3"])
+    assert result.exit_code == 0
+
+    cfg = cli_module._load_cfg("psuu_config.yaml")
+    assert cfg["optimizer"]["num_iterations"] == 7
+    assert cfg["optimizer"]["n_initial_points"] == 2
+    assert cfg["optimizer"]["seed"] == 3
+
+    # Stop before any simulation runs, keeping the configured optimizer
+    optimizers = []
+
+    def fake_run(self, *args, **kwargs):
+        optimizers.append(self.optimizer)
+        raise RuntimeError("stopped")
+
+    monkeypatch.setattr(PsuuExperiment, "run", fake_run)
+    runner.invoke(cli, ["run"])
+
+    (optimizer,) = optimizers
+    assert isinstance(optimizer, TPEOptimizer)
+    assert (optimizer.num_iterations, optimizer.n_initial_points, optimizer.seed) == (7, 2, 3)
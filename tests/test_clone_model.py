@@ -0,0 +1,206 @@
+"""
+Tests for the clone_model module.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from psuu import clone_model
+from psuu.cli import cli
+
+
+@pytest.fixture
+def registered_model(monkeypatch):
+    """Register a throwaway model without a connector module."""
+    monkeypatch.setitem(clone_model.KNOWN_MODELS, "toy-model", {"repo": "https://example.com/toy-model.git"})
+    clone_model._model_spec.cache_clear()
+    yield "toy-model"
+    clone_model._model_spec.cache_clear()
+
+
+def test_generated_connector_reads_stdout(tmp_path, monkeypatch, registered_model):
+    """Test that a generated connector runs and parses CSV from stdout."""
+    monkeypatch.chdir(tmp_path)
+    connector_path, _ = clone_model.generate_custom_connector(registered_model, str(tmp_path))
+
+    spec = importlib.util.spec_from_file_location("toy_model_connector", connector_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Echo a CSV table followed by the parameters it was given
+    script = "import sys; print('x,arg'); print('1,' + sys.argv[-1])"
+    connector = module.ToymodelConnector(command=f'"{sys.executable}" -c "{script}"')
+    df = connector.run_simulation({"beta": 0.5})
+
+    assert df.to_dict(orient="records") == [{"x": 1, "arg": 0.5}]
+
+
+def test_generated_connector_uses_shell_when_needed(tmp_path, monkeypatch, registered_model):
+    """Test that a generated connector runs shell syntax through the shell."""
+    monkeypatch.chdir(tmp_path)
+    connector_path, _ = clone_model.generate_custom_connector(registered_model, str(tmp_path))
+
+    spec = importlib.util.spec_from_file_location("toy_model_connector", connector_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # A leading variable assignment only works through the shell
+    script = "import os; print('x,arg'); print(os.environ['PSUU_X'] + ',' + os.sys.argv[-1])"
+    connector = module.ToymodelConnector(command=f'PSUU_X=3 "{sys.executable}" -c "{script}"')
+    df = connector.run_simulation({"beta": 0.5})
+
+    assert df.to_dict(orient="records") == [{"x": 3, "arg": 0.5}]
+
+
+@pytest.mark.parametrize("existing, written", [
+    (None, True),
+    ("{header}{content}", False),
+    ("{header}old content\n", False),
+    ("{old_header}old content\n", True),
+    ("{content}", True),
+    ("old content\n", False),
+])
+def test_write_generated_file(tmp_path, capsys, existing, written):
+    """Test which existing files are refreshed and which are left with a warning."""
+    path = tmp_path / "connector.py"
+    content = "print('hello')\n"
+    old_content = "old content\n"
+    header = f"{clone_model._GENERATED_HEADER}{clone_model._content_hash(content)}\n"
+    old_header = f"{clone_model._GENERATED_HEADER}{clone_model._content_hash(old_content)}\n"
+    if existing is not None:
+        existing = existing.format(header=header, old_header=old_header, content=content)
+        path.write_text(existing, encoding="utf-8")
+
+    assert clone_model._write_generated_file(str(path), content) == written
+
+    assert path.read_text(encoding="utf-8") == (header + content if written else existing)
+    edited = existing is not None and not written and not existing.startswith(header)
+    assert ("Warning" in capsys.readouterr().out) == edited
+
+
+@pytest.mark.parametrize("value, line", [
+    ((0.1, 0.5), '        "beta": (0.1, 0.5),\n'),
+    ([0.1, 0.5], '        "beta": (0.1, 0.5),\n'),
+    ((0.1, 0.2, 0.3), '        "beta": [0.1, 0.2, 0.3],\n'),
+    ([0.1, 0.2, 0.3], '        "beta": [0.1, 0.2, 0.3],\n'),
+    (0.3, '        "beta": 0.3,\n'),
+])
+def test_format_param_line(value, line):
+    """Test that only two-element sequences are written as ranges."""
+    assert clone_model._format_param_line("beta", value) == line
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    """Create a Git repository that serves partial clones."""
+    path = tmp_path / "source"
+    git = ["git", "-c", "user.name=psuu", "-c", "user.email=psuu@example.com"]
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    for i in range(3):
+        (path / f"file{i}.txt").write_text(f"{i}\n")
+        subprocess.run(git + ["-C", str(path), "add", "."], check=True)
+        subprocess.run(git + ["-C", str(path), "commit", "-q", "-m", str(i)], check=True)
+    subprocess.run(["git", "-C", str(path), "config", "uploadpack.allowFilter", "true"], check=True)
+    return path
+
+
+def test_clone_from_blobless_mirror(tmp_path, monkeypatch, source_repo):
+    """Test that clones from a blobless mirror check out every file."""
+    monkeypatch.setenv("PSUU_CACHE_DIR", str(tmp_path / "cache"))
+    repo_url = source_repo.as_uri()
+
+    for name in ("first", "second"):
+        clone_path = clone_model.clone_repo(repo_url, str(tmp_path / name), use_cache=True)
+        assert sorted(os.listdir(clone_path)) == [".git", "file0.txt", "file1.txt", "file2.txt"]
+        status = subprocess.run(
+            ["git", "-C", clone_path, "status", "--porcelain"],
+            check=True, capture_output=True, text=True,
+        )
+        assert status.stdout == ""
+        remote = subprocess.run(
+            ["git", "-C", clone_path, "remote", "get-url", "origin"],
+            check=True, capture_output=True, text=True,
+        )
+        assert remote.stdout.strip() == repo_url
+
+    if clone_model._git_version() >= (2, 19):
+        mirror_filter = subprocess.run(
+            ["git", "-C", clone_model._mirror_path(repo_url), "config", "remote.origin.partialclonefilter"],
+            check=True, capture_output=True, text=True,
+        )
+        assert mirror_filter.stdout.strip() == "blob:none"
+
+
+REPO_URL = "https://example.com/toy-model.git"
+
+
+@pytest.mark.parametrize("git_version, kwargs, options", [
+    ((2, 39), {}, ["--depth=1", "--single-branch", "--no-tags", "--filter=blob:none"]),
+    ((2, 18), {}, ["--depth=1", "--single-branch", "--no-tags"]),
+    ((2, 39), {"full_history": True}, []),
+    ((2, 39), {"full_history": True, "filter_blobs": True}, ["--filter=blob:none"]),
+    ((2, 18), {"full_history": True, "filter_blobs": True}, []),
+    ((2, 39), {"clone_flags": ["--depth=5"]}, ["--depth=5"]),
+    ((2, 39), {"full_history": True, "clone_flags": ["--depth=5"]}, []),
+])
+def test_clone_commands(tmp_path, monkeypatch, git_version, kwargs, options):
+    """Test the `git clone` options chosen for each combination of flags."""
+    monkeypatch.setattr(clone_model, "_git_version", lambda: git_version)
+    kwargs = {"full_history": False, "use_cache": False, **kwargs}
+
+    clone_path, commands = clone_model._clone_commands(REPO_URL, str(tmp_path), **kwargs)
+
+    assert clone_path == str(tmp_path / "toy-model")
+    assert commands == [["git", "clone", *options, REPO_URL, clone_path]]
+
+
+@pytest.mark.parametrize("git_version", [(2, 39), (2, 18)])
+def test_clone_commands_with_cache(tmp_path, monkeypatch, git_version):
+    """Test that cached clones create, then update, a mirror and clone from it."""
+    monkeypatch.setattr(clone_model, "_git_version", lambda: git_version)
+    monkeypatch.setenv("PSUU_CACHE_DIR", str(tmp_path / "cache"))
+    mirror = clone_model._mirror_path(REPO_URL)
+    partial = ["--filter=blob:none"] if git_version >= (2, 19) else []
+
+    clone_path, commands = clone_model._clone_commands(REPO_URL, str(tmp_path), False, True)
+
+    assert mirror.startswith(str(tmp_path / "cache" / "git"))
+    assert commands[0] == ["git", "clone", "--mirror", *partial, REPO_URL, mirror]
+    assert commands[1][:3] == ["git", "clone", "--local"]
+    assert commands[1][-2:] == [mirror, clone_path]
+    assert ["git", "-C", clone_path, "remote", "set-url", "origin", REPO_URL] in commands
+
+    os.makedirs(mirror)
+    _, commands = clone_model._clone_commands(REPO_URL, str(tmp_path), False, True)
+    assert commands[0] == ["git", "-C", mirror, "fetch", "--prune", "origin"]
+
+
+def test_clone_commands_existing_directory(tmp_path):
+    """Test that nothing is run when the clone directory already exists."""
+    (tmp_path / "toy-model").mkdir()
+
+    clone_path, commands = clone_model._clone_commands(REPO_URL, str(tmp_path), False, False)
+
+    assert clone_path == str(tmp_path / "toy-model")
+    assert commands == []
+
+
+@pytest.mark.parametrize("args, kwargs", [
+    ([], {"full_history": False, "use_cache": False, "filter_blobs": False}),
+    (["--full-history", "--blobless"], {"full_history": True, "use_cache": False, "filter_blobs": True}),
+    (["--cache"], {"full_history": False, "use_cache": True, "filter_blobs": False}),
+])
+def test_cli_clone_flags(monkeypatch, args, kwargs):
+    """Test that the clone command passes its flags on to clone_model."""
+    calls = []
+    monkeypatch.setattr(clone_model, "clone_model", lambda *a, **kw: calls.append((a, kw)))
+
+    result = CliRunner().invoke(cli, ["clone-model", "toy-model", "--no-install", *args])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [(("toy-model", None, False), kwargs)]
@@ -0,0 +1,55 @@
+"""
+Tests for the config module.
+"""
+
+import os
+
+import pytest
+
+from psuu import config as config_module
+from psuu.config import PsuuConfig
+from psuu.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("parameters:\n  beta:\n    type: continuous\n    min: 0.1\n    max: 0.5\n")
+    config_module._load_config_cached.cache_clear()
+    yield path
+    config_module._load_config_cached.cache_clear()
+
+
+def test_unchanged_file_parsed_once(config_file):
+    """Test that loading an unchanged file reuses the parsed configuration."""
+    first = PsuuConfig(str(config_file))
+    second = PsuuConfig(str(config_file))
+
+    info = config_module._load_config_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert first.config == second.config
+
+    # Each instance gets its own copy
+    first.config["parameters"]["beta"]["max"] = 0.9
+    assert PsuuConfig(str(config_file)).config["parameters"]["beta"]["max"] == 0.5
+
+
+def test_modified_file_reloaded(config_file):
+    """Test that a modified file is parsed again."""
+    PsuuConfig(str(config_file))
+
+    config_file.write_text("parameters:\n  gamma:\n    type: discrete\n    values: [1, 2]\n")
+    # Make the change visible even on filesystems with coarse timestamps
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert PsuuConfig(str(config_file)).config == {
+        "parameters": {"gamma": {"type": "discrete", "values": [1, 2]}}
+    }
+    assert config_module._load_config_cached.cache_info().misses == 2
+
+
+def test_missing_file(tmp_path):
+    """Test that a missing configuration file raises ConfigurationError."""
+    with pytest.raises(ConfigurationError):
+        PsuuConfig(str(tmp_path / "missing.yaml"))
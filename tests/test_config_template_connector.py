@@ -0,0 +1,80 @@
+"""
+Tests for the config template connector.
+"""
+
+import json
+import sys
+
+import pytest
+
+from psuu.custom_connectors.config_template_connector import ConfigTemplateConnector
+
+# Reads the rendered JSON config and prints it as a one-row CSV table
+MODEL = """
+import json, sys
+with open(sys.argv[sys.argv.index("--config") + 1]) as f:
+    config = json.load(f)
+print(",".join(config))
+print(",".join(str(value) for value in config.values()))
+"""
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "model.py"
+    path.write_text(MODEL)
+    return f'"{sys.executable}" "{path}"'
+
+
+def make_connector(tmp_path, command, template, **kwargs):
+    template_path = tmp_path / "template.json"
+    template_path.write_text(template)
+    return ConfigTemplateConnector(
+        command=command,
+        template_path=str(template_path),
+        config_dir=str(tmp_path / "configs"),
+        output_format="csv",
+        **kwargs
+    )
+
+
+def test_run_simulation(tmp_path, model):
+    """Test rendering the config and parsing the model output."""
+    connector = make_connector(tmp_path, model, '{"beta": ${beta}, "label": ${label}}')
+
+    df = connector.run_simulation({"beta": 0.25, "label": "a b"})
+
+    assert df.to_dict(orient="records") == [{"beta": 0.25, "label": "a b"}]
+    with open(connector.write_config({"beta": 0.25, "label": "a b"})) as f:
+        assert json.load(f) == {"beta": 0.25, "label": "a b"}
+
+
+def test_run_id_covers_template_and_command(tmp_path, model):
+    """Test that changing the template or command gives new run ids."""
+    first = make_connector(tmp_path, model, '{"beta": ${beta}}')
+    config_path = first.write_config({"beta": 0.5})
+
+    changed_template = make_connector(tmp_path, model, '{"beta": ${beta}, "gamma": 1}')
+    changed_command = make_connector(tmp_path, model + " --verbose", '{"beta": ${beta}}')
+
+    assert first.write_config({"beta": 0.5}) == config_path
+    assert changed_template.write_config({"beta": 0.5}) != config_path
+    assert changed_command.write_config({"beta": 0.5}) != config_path
+    with open(changed_template.write_config({"beta": 0.5})) as f:
+        assert json.load(f) == {"beta": 0.5, "gamma": 1}
+
+
+def test_results_cache(tmp_path, model):
+    """Test that cached results are bounded and handed out as copies."""
+    connector = make_connector(tmp_path, model, '{"beta": ${beta}}', cache_size=2)
+
+    first = connector.run_simulation({"beta": 0.1})
+    first.loc[0, "beta"] = -1.0
+    again = connector.run_simulation({"beta": 0.1})
+    again.loc[0, "beta"] = -2.0
+
+    assert connector.run_simulation({"beta": 0.1})["beta"].tolist() == [0.1]
+
+    connector.run_simulation({"beta": 0.2})
+    connector.run_simulation({"beta": 0.3})
+    assert len(connector._results_cache) == 2
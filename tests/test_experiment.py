@@ -0,0 +1,217 @@
+"""
+Tests for the experiment module.
+"""
+
+import json
+import os
+
+import pytest
+
+from psuu import experiment as experiment_module
+from psuu.experiment import PsuuExperiment
+from psuu.results import SimulationResults
+from psuu.simulation_connector import SimulationConnector
+
+
+class KpiOnlyConnector(SimulationConnector):
+    """Connector whose simulation reports KPIs but no time series."""
+
+    def run_simulation(self, parameters):
+        results = SimulationResults(
+            kpis={"score": (parameters["x"] - 0.5) ** 2},
+            parameters=parameters,
+        )
+        results.time_series_data = None
+        return results
+
+
+class PidConnector(SimulationConnector):
+    """Connector reporting the process each simulation ran in."""
+
+    def run_simulation(self, parameters):
+        return SimulationResults(
+            kpis={"score": parameters["x"], "pid": os.getpid()},
+            parameters=parameters,
+        )
+
+
+class CountingConnector(SimulationConnector):
+    """Connector recording the parameter sets it simulates."""
+
+    def __init__(self):
+        super().__init__(command="unused")
+        self.calls = []
+
+    def run_simulation(self, parameters):
+        self.calls.append(dict(parameters))
+        return SimulationResults(kpis={"score": parameters["x"] ** 2}, parameters=parameters)
+
+
+def make_experiment(connector, **kwargs):
+    """Create an experiment around a connector, minimizing its score over x."""
+    experiment = PsuuExperiment(simulation_command="unused", **kwargs)
+    experiment.simulation_connector = connector
+    experiment.set_parameter_space({"x": (0.0, 1.0)})
+    return experiment
+
+
+def test_kpi_only_connector(tmp_path):
+    """Test that simulations reporting only KPIs are evaluated and saved."""
+    experiment = PsuuExperiment(simulation_command="unused")
+    experiment.simulation_connector = KpiOnlyConnector(command="unused")
+    # A KPI computed from the time series is skipped when there is none
+    experiment.add_kpi("final_x", function=lambda df: df["x"].iloc[-1])
+    experiment.set_parameter_space({"x": (0.0, 1.0)})
+    experiment.set_optimizer(method="random", objective_name="score", maximize=False,
+                             num_iterations=3, seed=1)
+
+    results = experiment.run(verbose=False)
+
+    assert results.iterations == 3
+    assert all("error" not in evaluation for evaluation in results.all_evaluations)
+    assert results.best_kpis["score"] == min(
+        evaluation["kpis"]["score"] for evaluation in results.all_evaluations
+    )
+
+    results.save(str(tmp_path / "run"))
+    assert os.path.exists(tmp_path / "run.csv")
+    assert os.path.exists(tmp_path / "run.json")
+
+
+def test_simulation_results_without_time_series(tmp_path):
+    """Test that SimulationResults handles an unset time series."""
+    results = SimulationResults(kpis={"score": 1.0}, parameters={"x": 0.5})
+    results.time_series_data = None
+
+    assert list(results.to_dataframe().columns) == ["score", "param_x"]
+    assert "statistics" not in results.get_summary()
+    assert "time_series" not in results.to_dict()
+
+    saved = results.save(str(tmp_path / "kpis"), formats=["csv", "json"])
+    assert list(saved) == ["json"]
+    with open(saved["json"]) as f:
+        assert json.load(f)["kpis"] == {"score": 1.0}
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_batches_share_worker_processes(n_workers):
+    """Test that batches of a run reuse one pool of worker processes."""
+    experiment = PsuuExperiment(simulation_command="unused")
+    experiment.simulation_connector = PidConnector(command="unused")
+    experiment.set_parameter_space({"x": (0.0, 1.0)})
+    experiment.set_optimizer(method="random", objective_name="score", num_iterations=8, seed=1)
+
+    results = experiment.run(verbose=False, batch_size=2, n_workers=n_workers)
+
+    pids = {evaluation["kpis"]["pid"] for evaluation in results.all_evaluations}
+    assert results.iterations == 8
+    if n_workers == 1:
+        assert pids == {os.getpid()}
+    else:
+        assert os.getpid() not in pids
+        assert len(pids) <= n_workers
+
+
+def test_evaluation_cache():
+    """Test that repeated parameter sets are simulated once while cached."""
+    connector = CountingConnector()
+    experiment = make_experiment(connector, cache_size=2, cache_precision=3)
+
+    first = experiment._evaluate_batch([{"x": 0.1}, {"x": 0.1}, {"x": 0.2}], n_workers=1)
+    # Matched after rounding to cache_precision decimal places
+    second = experiment._evaluate_batch([{"x": 0.1000001}], n_workers=1)
+
+    assert connector.calls == [{"x": 0.1}, {"x": 0.2}]
+    assert first[0] == first[1] == second[0] == {"score": 0.1 ** 2}
+
+    # The least recently used entry is evicted once the cache is full
+    experiment._evaluate_batch([{"x": 0.3}, {"x": 0.2}], n_workers=1)
+    experiment._evaluate_batch([{"x": 0.1}], n_workers=1)
+    assert connector.calls[2:] == [{"x": 0.3}, {"x": 0.1}]
+
+
+def test_evaluation_cache_disabled():
+    """Test that every parameter set is simulated without a cache."""
+    connector = CountingConnector()
+    experiment = make_experiment(connector)
+
+    experiment._evaluate_batch([{"x": 0.1}, {"x": 0.1}], n_workers=1)
+
+    assert connector.calls == [{"x": 0.1}, {"x": 0.1}]
+
+
+@pytest.mark.parametrize("batch_size, max_iterations, expected", [
+    (1, None, 7),
+    (3, None, 7),
+    (3, 5, 5),
+])
+def test_batched_run(batch_size, max_iterations, expected):
+    """Test that batched runs evaluate every suggested point in order."""
+    connector = CountingConnector()
+    experiment = make_experiment(connector)
+    experiment.set_optimizer(method="random", objective_name="score", maximize=False,
+                             num_iterations=7, seed=3)
+
+    results = experiment.run(max_iterations=max_iterations, verbose=False,
+                             batch_size=batch_size, n_workers=1)
+
+    assert results.iterations == expected
+    assert [evaluation["iteration"] for evaluation in results.all_evaluations] == list(range(expected))
+    assert [evaluation["parameters"] for evaluation in results.all_evaluations] == connector.calls
+    assert results.best_kpis["score"] == min(call["x"] ** 2 for call in connector.calls)
+
+
+def test_batch_size_must_be_positive():
+    """Test that a batch size below one is rejected."""
+    experiment = make_experiment(CountingConnector())
+    experiment.set_optimizer(method="random", objective_name="score", num_iterations=2)
+
+    with pytest.raises(ValueError):
+        experiment.run(verbose=False, batch_size=0)
+
+
+def test_parquet_without_pyarrow(tmp_path, monkeypatch, capsys):
+    """Test that saving skips Parquet, and to_parquet fails clearly, without pyarrow."""
+    monkeypatch.setattr(experiment_module, "PYARROW_AVAILABLE", False)
+    experiment = make_experiment(CountingConnector())
+    experiment.set_optimizer(method="random", objective_name="score", num_iterations=2, seed=1)
+    results = experiment.run(verbose=False)
+
+    results.save(str(tmp_path / "run"), formats=["csv", "parquet"])
+
+    assert "Skipping Parquet export" in capsys.readouterr().out
+    assert os.path.exists(tmp_path / "run.csv")
+    assert not os.path.exists(tmp_path / "run.parquet")
+    with pytest.raises(ImportError, match="pyarrow"):
+        results.to_parquet(str(tmp_path / "run.parquet"))
+
+
+def test_batches_reported_together():
+    """Test that each batch's results reach the optimizer in one batch_update call."""
+    experiment = make_experiment(CountingConnector())
+    experiment.set_optimizer(method="random", objective_name="score", maximize=False,
+                             num_iterations=7, seed=3)
+    batches = []
+    batch_update = experiment.optimizer.batch_update
+
+    def recording_batch_update(parameter_sets, objective_values):
+        batches.append(list(objective_values))
+        batch_update(parameter_sets, objective_values)
+
+    experiment.optimizer.batch_update = recording_batch_update
+
+    results = experiment.run(verbose=False, batch_size=3, n_workers=1)
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert sum(batches, []) == [evaluation["kpis"]["score"] for evaluation in results.all_evaluations]
+    assert len(experiment.optimizer.evaluations) == 7
+
+
+def test_evaluate_parameters_uses_batch_path():
+    """Test that single evaluations go through the cached batch path."""
+    connector = CountingConnector()
+    experiment = make_experiment(connector, cache_size=4)
+
+    assert experiment._evaluate_parameters({"x": 0.5}) == {"score": 0.25}
+    assert experiment._evaluate_parameters({"x": 0.5}) == {"score": 0.25}
+    assert connector.calls == [{"x": 0.5}]
@@ -0,0 +1,40 @@
+"""
+Tests for the psuu command entry point.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from psuu import __main__ as entry_point
+from psuu.cli import cli
+
+
+@pytest.mark.parametrize("args", [["--version"], ["list-models"]])
+def test_fast_path_matches_click(args, monkeypatch, capsys):
+    """Test that commands answered without Click print what Click would."""
+    monkeypatch.setattr(sys, "argv", ["psuu", *args])
+    entry_point.main()
+    fast_output = capsys.readouterr().out
+
+    result = CliRunner().invoke(cli, args, prog_name="psuu")
+
+    assert result.exit_code == 0
+    assert fast_output == result.output
+
+
+def test_fast_path_version_as_module():
+    """Test that `python -m psuu --version` reports the same program name as Click."""
+    fast = subprocess.run(
+        [sys.executable, "-m", "psuu", "--version"],
+        capture_output=True, text=True, check=True,
+    )
+    click_run = subprocess.run(
+        [sys.executable, "-c",
+         "from psuu.cli import cli; cli(['--version'], prog_name='python -m psuu')"],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert fast.stdout == click_run.stdout
@@ -0,0 +1,90 @@
+"""
+Tests for the optimizers.
+"""
+
+import pytest
+
+pytest.importorskip("optuna")
+
+from psuu import optimizers
+from psuu.optimizers import AVAILABLE_OPTIMIZERS
+from psuu.optimizers.tpe import TPEOptimizer
+
+PARAMETER_SPACE = {"x": (-2.0, 2.0), "mode": ["a", "b"]}
+
+
+def objective(parameters):
+    return (parameters["x"] - 1.0) ** 2 + (0.0 if parameters["mode"] == "b" else 1.0)
+
+
+def test_tpe_registered():
+    """Test that the TPE optimizer is available when optuna is installed."""
+    assert AVAILABLE_OPTIMIZERS["tpe"] is TPEOptimizer
+    assert "TPEOptimizer" in optimizers.__all__
+
+
+def test_tpe_suggestions_within_space():
+    """Test that TPE suggests points inside the parameter space until finished."""
+    optimizer = TPEOptimizer(PARAMETER_SPACE, "loss", maximize=False,
+                             num_iterations=12, n_initial_points=4, seed=0)
+
+    suggested = 0
+    while not optimizer.is_finished():
+        parameters = optimizer.suggest()
+        assert -2.0 <= parameters["x"] <= 2.0
+        assert parameters["mode"] in ("a", "b")
+        optimizer.update(parameters, objective(parameters))
+        suggested += 1
+
+    assert suggested == 12
+    assert len(optimizer.study.trials) == 12
+    best = optimizer.get_best_parameters()
+    assert objective(best) == min(trial.value for trial in optimizer.study.trials)
+
+
+def test_tpe_batch_and_foreign_results():
+    """Test that batched suggestions and unsuggested results are recorded."""
+    optimizer = TPEOptimizer(PARAMETER_SPACE, "loss", maximize=False,
+                             num_iterations=5, n_initial_points=2, seed=1)
+
+    batch = optimizer.batch_suggest(3)
+    assert len(batch) == 3
+    # Results may come back in any order
+    for parameters in reversed(batch):
+        optimizer.update(parameters, objective(parameters))
+    optimizer.update({"x": 1.0, "mode": "b"}, 0.0)
+
+    assert [trial.state.name for trial in optimizer.study.trials] == ["COMPLETE"] * 4
+    assert optimizer.study.best_value == 0.0
+    assert len(optimizer.batch_suggest(5)) == 2
+    assert optimizer.is_finished()
+
+
+def test_tpe_is_reproducible():
+    """Test that a seeded TPE optimizer repeats its suggestions."""
+    def run():
+        optimizer = TPEOptimizer(PARAMETER_SPACE, "loss", maximize=False,
+                                 num_iterations=8, n_initial_points=3, seed=7)
+        suggested = []
+        while not optimizer.is_finished():
+            parameters = optimizer.suggest()
+            optimizer.update(parameters, objective(parameters))
+            suggested.append(parameters)
+        return suggested
+
+    assert run() == run()
+
+
+def test_tpe_repeated_suggestions():
+    """Test that every pending trial is told when TPE repeats a suggestion."""
+    optimizer = TPEOptimizer({"mode": ["a"]}, "loss", maximize=False,
+                             num_iterations=3, n_initial_points=1, seed=0)
+
+    batch = optimizer.batch_suggest(3)
+    assert batch == [{"mode": "a"}] * 3
+    for value, parameters in enumerate(batch):
+        optimizer.update(parameters, float(value))
+
+    assert [trial.state.name for trial in optimizer.study.trials] == ["COMPLETE"] * 3
+    assert [trial.value for trial in optimizer.study.trials] == [0.0, 1.0, 2.0]
+    assert optimizer._pending_trials == {}
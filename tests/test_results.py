@@ -0,0 +1,67 @@
+"""
+Tests for the results module.
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from psuu import results as results_module
+from psuu.results import SimulationResults
+
+
+@pytest.fixture
+def simulation_results():
+    return SimulationResults(
+        time_series_data=pd.DataFrame({
+            "timestep": np.arange(4),
+            "I": np.array([1.0, 5.0, 3.0, 2.0]),
+        }),
+        kpis={"peak": np.float64(5.0)},
+        metadata={"run": "test"},
+        parameters={"beta": 0.3, "gamma": np.int64(2)},
+    )
+
+
+@pytest.mark.parametrize("fmt, loader", [
+    ("parquet", SimulationResults.from_parquet),
+    ("feather", SimulationResults.from_feather),
+])
+def test_arrow_round_trip(tmp_path, simulation_results, fmt, loader):
+    """Test that Parquet and Feather files restore the results they were saved from."""
+    pytest.importorskip("pyarrow")
+
+    saved = simulation_results.save(str(tmp_path / "run"), formats=[fmt])
+    loaded = loader(saved[fmt])
+
+    pd.testing.assert_frame_equal(loaded.time_series_data, simulation_results.time_series_data)
+    assert loaded.kpis == {"peak": 5.0}
+    assert loaded.parameters == {"beta": 0.3, "gamma": 2}
+    assert loaded.metadata == simulation_results.metadata
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_arrow_formats_skipped_without_pyarrow(tmp_path, monkeypatch, simulation_results, fmt):
+    """Test that Arrow formats are skipped, not failed, when pyarrow is missing."""
+    monkeypatch.setattr(results_module, "PYARROW_AVAILABLE", False)
+
+    saved = simulation_results.save(str(tmp_path / "run"), formats=[fmt, "json"])
+
+    assert list(saved) == ["json"]
+    with pytest.raises(ImportError):
+        getattr(SimulationResults, f"from_{fmt}")(str(tmp_path / f"run.{fmt}"))
+
+
+def test_pyarrow_imported_lazily():
+    """Test that importing the results module does not import pyarrow."""
+    code = (
+        "import sys, pandas; before = 'pyarrow' in sys.modules; "
+        "import psuu.experiment; print(before, 'pyarrow' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    if result.stdout.split()[0] == "True":
+        pytest.skip("pandas imports pyarrow itself")
+    assert result.stdout.split() == ["False", "False"]
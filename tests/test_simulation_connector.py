@@ -4,6 +4,8 @@ Tests for the Simulation Connector module.
 
 import pytest
 import os
+import subprocess
+import sys
 import tempfile
 import pandas as pd
 from unittest.mock import patch, MagicMock
@@ -90,3 +92,15 @@ def test_run_simulation_with_stdout(mock_run):
     
     # Verify command was called correctly
     mock_run.assert_called_once()
+
+
+def test_pyarrow_imported_lazily():
+    """Test that importing the connector module does not import pyarrow."""
+    code = (
+        "import sys, pandas; before = 'pyarrow' in sys.modules; "
+        "import psuu.simulation_connector; print(before, 'pyarrow' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    if result.stdout.split()[0] == "True":
+        pytest.skip("pandas imports pyarrow itself")
+    assert result.stdout.split() == ["False", "False"]
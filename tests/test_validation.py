@@ -0,0 +1,56 @@
+"""
+Tests for the validation module.
+"""
+
+import json
+import sys
+
+import pytest
+
+from psuu.validation import RobustCadcadConnector
+
+# Writes a KPI summary to the path given after --output-path, except for
+# --beta values above 0.5, for which it writes nothing
+SIMULATION = """
+import json, os, sys
+args = sys.argv[1:]
+beta = float(args[args.index("--beta") + 1])
+if beta > 0.5:
+    sys.exit()
+path = args[args.index("--output-path") + 1]
+os.makedirs(os.path.dirname(path), exist_ok=True)
+kpis = {"peak_infections": beta, "total_infections": 2.0, "epidemic_duration": 3.0, "r0": 4.0}
+with open(path, "w") as f:
+    json.dump({name: {"mean": value} for name, value in kpis.items()}, f)
+"""
+
+
+@pytest.fixture
+def connector(tmp_path):
+    script = tmp_path / "simulation.py"
+    script.write_text(SIMULATION)
+    return RobustCadcadConnector(
+        command=f'"{sys.executable}" "{script}"',
+        working_dir=str(tmp_path),
+        output_path_arg="--output-path",
+        error_policy="fallback",
+        retry_attempts=1,
+        fallback_values={"peak": -1.0},
+        error_log_file=str(tmp_path / "errors.jsonl"),
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_merges_worker_error_logs(connector, max_workers):
+    """Test that errors logged in worker processes reach the parent's error log."""
+    parameter_sets = [{"beta": 0.9}, {"beta": 0.1}, {"beta": 0.7}]
+
+    results = connector.run_simulation_batch(parameter_sets, max_workers=max_workers)
+
+    assert results[1]["I"].tolist() == [0.1]
+    assert results[0]["peak"].tolist() == results[2]["peak"].tolist() == [-1.0]
+    assert [entry["parameters"] for entry in connector.error_log] == [{"beta": 0.9}, {"beta": 0.7}]
+
+    with open(connector.error_log_file) as f:
+        logged = [json.loads(line)["parameters"] for line in f]
+    assert sorted(logged, key=lambda p: p["beta"]) == [{"beta": 0.7}, {"beta": 0.9}]